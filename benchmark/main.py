@@ -1,10 +1,18 @@
 """Benchmark - Performance benchmark CLI"""
 
+import bisect
 import json
+import os
+import select
 import shutil
+import signal
+import sqlite3
 import subprocess
 import time
 import warnings
+from contextlib import closing
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import NamedTuple, Optional
 
@@ -16,6 +24,14 @@ app = typer.Typer(help="Measure and compare performance metrics", add_completion
 
 BENCHMARK_DIR = Path.home() / ".cache" / "toolkit-benchmarks"
 BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+BENCHMARK_DB = BENCHMARK_DIR / "benchmarks.db"
+
+# Only the head of the command output is kept (see run_command)
+OUTPUT_LIMIT = 512
+COMMAND_TIMEOUT = 60
+
+_SHELL = "/bin/sh"
+_DEVNULL = os.open(os.devnull, os.O_RDWR)
 
 
 class BenchmarkResult(NamedTuple):
@@ -29,61 +45,332 @@ class BenchmarkResult(NamedTuple):
     timestamp: str
 
 
-def run_command(cmd: str, iterations: int = 3) -> dict:
-    """Run a command and measure its performance"""
-    times = []
-    output = ""
-
-    for _ in range(iterations):
-        start = time.perf_counter()
+def _spawn_and_wait(cmd: str, timeout: float = COMMAND_TIMEOUT) -> str:
+    """Run a shell command via posix_spawn and return the head of its output
+
+    posix_spawn avoids the page-table copy of a full fork, which otherwise
+    dominates the measured time of short commands.
+    """
+    read_end, write_end = os.pipe()
+    try:
+        pid = os.posix_spawn(
+            _SHELL,
+            ["sh", "-c", cmd],
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, _DEVNULL, 0),
+                (os.POSIX_SPAWN_DUP2, write_end, 1),
+                (os.POSIX_SPAWN_DUP2, write_end, 2),
+                (os.POSIX_SPAWN_CLOSE, write_end),
+                (os.POSIX_SPAWN_CLOSE, read_end),
+            ],
+        )
+    finally:
+        os.close(write_end)
+
+    output = b""
+    deadline = time.monotonic() + timeout
+    try:
+        # Keep the head of the output and drain the rest so the child never
+        # blocks on a full pipe
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([read_end], [], [], remaining)[0]:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                return "Timeout"
+            chunk = os.read(read_end, OUTPUT_LIMIT)
+            if not chunk:
+                break
+            if len(output) < OUTPUT_LIMIT:
+                output += chunk
+    finally:
+        os.close(read_end)
+
+    # The child can close its output and keep running, so reaping is bounded too
+    if not _reap_by(pid, deadline):
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        return "Timeout"
+    return output.decode("utf-8", errors="replace")
+
+
+def _reap_by(pid: int, deadline: float) -> bool:
+    """Reap a child, waiting until the deadline; False if it is still running
+
+    A pidfd (Linux) lets select() wake exactly when the child exits; elsewhere
+    poll with a short, backing-off sleep to keep added latency out of timings.
+    """
+    if os.waitpid(pid, os.WNOHANG)[0]:
+        return True
+    if hasattr(os, "pidfd_open"):
         try:
-            result = subprocess.run(
+            pidfd = os.pidfd_open(pid)
+        except OSError:
+            pass
+        else:
+            try:
+                select.select([pidfd], [], [], max(deadline - time.monotonic(), 0))
+            finally:
+                os.close(pidfd)
+            return os.waitpid(pid, os.WNOHANG)[0] != 0
+
+    delay = 0.0001
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.01)
+        if os.waitpid(pid, os.WNOHANG)[0]:
+            return True
+
+
+def _run_subprocess(cmd: str) -> str:
+    """Fallback launcher for platforms without posix_spawn"""
+    try:
+        result = subprocess.run(
+            cmd,
+            shell=True,
+            capture_output=True,
+            text=True,
+            timeout=COMMAND_TIMEOUT,
+        )
+        return result.stdout or result.stderr
+    except subprocess.TimeoutExpired:
+        return "Timeout"
+
+
+_launch = _spawn_and_wait if hasattr(os, "posix_spawn") else _run_subprocess
+
+
+async def _run_parallel(cmd: str, iterations: int, parallel: int) -> list[int]:
+    """Run iterations concurrently, at most ``parallel`` at a time
+
+    Each sample still times a single command, but concurrent runs compete
+    for CPU and IO, so this measures throughput rather than latency.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(parallel)
+
+    async def _timed_run() -> int:
+        async with semaphore:
+            start = time.perf_counter_ns()
+            proc = await asyncio.create_subprocess_shell(
                 cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=60,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
-            output = result.stdout or result.stderr
-        except subprocess.TimeoutExpired:
-            output = "Timeout"
+            try:
+                await asyncio.wait_for(proc.wait(), COMMAND_TIMEOUT)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+            return time.perf_counter_ns() - start
+
+    return list(await asyncio.gather(*(_timed_run() for _ in range(iterations))))
+
+
+def _sorted_median(values: list[int]) -> int:
+    """Median of an already sorted list, rounded down to an int"""
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) // 2
+
+
+def run_command(cmd: str, iterations: int = 3, warmup: int = 1, parallel: int = 1) -> dict:
+    """Run a command and measure its performance
+
+    Timings are taken and aggregated as integer nanoseconds; the float
+    ``*_time`` fields (seconds) are derived from them for older readers.
+
+    The first ``warmup`` runs are not timed so cold caches don't skew the
+    samples. Noise only ever adds time, so the minimum is the headline
+    statistic; samples further than 3 MADs from the median are counted
+    as outliers.
+
+    With ``parallel > 1`` the timed iterations run concurrently; only use
+    this for independent commands where throughput is what matters.
+    """
+    times_ns: list[int] = []
+    output = ""
+
+    for _ in range(warmup):
+        try:
+            output = _launch(cmd)
         except Exception as e:
             output = str(e)
-        end = time.perf_counter()
-        times.append(end - start)
+
+    if parallel > 1:
+        import asyncio
+
+        times_ns = asyncio.run(_run_parallel(cmd, iterations, parallel))
+    else:
+        for _ in range(iterations):
+            start = time.perf_counter_ns()
+            try:
+                output = _launch(cmd)
+            except Exception as e:
+                output = str(e)
+            end = time.perf_counter_ns()
+            times_ns.append(end - start)
+
+    # Sort once: min, max and median are then index lookups, and sorted
+    # deviations give the MAD and the outlier count via bisect
+    ordered = sorted(times_ns)
+    total_ns = sum(ordered)
+    avg_ns = total_ns // len(ordered)
+    min_ns = ordered[0]
+    max_ns = ordered[-1]
+    median_ns = _sorted_median(ordered)
+    deviations = sorted(abs(t - median_ns) for t in ordered)
+    mad_ns = _sorted_median(deviations)
+    outliers = len(deviations) - bisect.bisect_right(deviations, 3 * mad_ns) if mad_ns else 0
 
     return {
         "iterations": iterations,
-        "times": times,
-        "total_time": sum(times),
-        "avg_time": sum(times) / len(times),
-        "min_time": min(times),
-        "max_time": max(times),
+        "warmup": warmup,
+        "parallel": parallel,
+        "times_ns": times_ns,
+        "total_ns": total_ns,
+        "avg_ns": avg_ns,
+        "min_ns": min_ns,
+        "max_ns": max_ns,
+        "median_ns": median_ns,
+        "mad_ns": mad_ns,
+        "outliers": outliers,
+        "times": [t / 1e9 for t in times_ns],
+        "total_time": total_ns / 1e9,
+        "avg_time": avg_ns / 1e9,
+        "min_time": min_ns / 1e9,
+        "max_time": max_ns / 1e9,
         "output": output[:500],
     }
 
 
+def get_ns(result: dict, stat: str) -> int:
+    """Read a statistic in nanoseconds, falling back to the float seconds field"""
+    value = result.get(f"{stat}_ns")
+    if value is not None:
+        return value
+    return round(result[f"{stat}_time"] * 1e9)
+
+
+@lru_cache(maxsize=1)
+def _orjson():
+    """Import orjson once, on first use; it is an optional speedup"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dumps(data: dict, indent: bool = True) -> bytes:
+    """Serialize to JSON, using orjson when available"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse JSON, using orjson when available"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the results database, creating the schema on first use
+
+    Results saved as one JSON file per name by older versions are imported
+    the first time the database is created.
+    """
+    BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    is_new = not BENCHMARK_DB.exists()
+    conn = sqlite3.connect(BENCHMARK_DB)
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS runs (
+            name TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            avg_ns INTEGER NOT NULL,
+            min_ns INTEGER NOT NULL,
+            max_ns INTEGER NOT NULL,
+            iterations INTEGER NOT NULL,
+            payload_json BLOB NOT NULL,
+            PRIMARY KEY (name, timestamp)
+        )"""
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_name ON runs (name)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON runs (timestamp)")
+    if is_new:
+        with os.scandir(BENCHMARK_DIR) as entries:
+            legacy = [e for e in entries if e.name.endswith(".json") and e.is_file()]
+        for entry in legacy:
+            try:
+                with open(entry.path, "rb") as f:
+                    data = _loads(f.read())
+                timestamp = datetime.fromtimestamp(entry.stat().st_mtime).isoformat()
+                _insert_run(conn, entry.name[: -len(".json")], data, timestamp)
+            except (OSError, ValueError, KeyError):
+                continue
+        conn.commit()
+    return conn
+
+
+def _insert_run(conn: sqlite3.Connection, name: str, result: dict, timestamp: str) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO runs"
+        " (name, timestamp, avg_ns, min_ns, max_ns, iterations, payload_json)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            name,
+            timestamp,
+            get_ns(result, "avg"),
+            get_ns(result, "min"),
+            get_ns(result, "max"),
+            result["iterations"],
+            _dumps(result, indent=False),
+        ),
+    )
+
+
 def save_result(result: dict, name: str):
-    """Save benchmark result to file"""
-    filepath = BENCHMARK_DIR / f"{name}.json"
-    filepath.write_text(json.dumps(result, indent=2))
-    return filepath
+    """Save benchmark result to the results database"""
+    timestamp = result.setdefault("timestamp", datetime.now().isoformat())
+    with closing(_connect()) as conn, conn:
+        _insert_run(conn, name, result, timestamp)
+    return BENCHMARK_DB
 
 
 def load_result(name: str) -> Optional[dict]:
-    """Load benchmark result from file"""
-    filepath = BENCHMARK_DIR / f"{name}.json"
-    if filepath.exists():
-        return json.loads(filepath.read_text())
+    """Load the latest benchmark result for a name"""
+    with closing(_connect()) as conn:
+        row = conn.execute(
+            "SELECT payload_json FROM runs WHERE name = ? ORDER BY timestamp DESC LIMIT 1",
+            (name,),
+        ).fetchone()
+    if row:
+        return _loads(row[0])
     return None
 
 
-def format_delta(old: float, new: float) -> str:
-    """Format the delta between two values"""
-    delta = new - old
-    percent = (delta / old * 100) if old > 0 else 0
+def format_seconds(ns: int) -> str:
+    """Format a nanosecond duration as seconds"""
+    return f"{ns / 1e9:.4f}s"
+
+
+def format_delta(old_ns: int, new_ns: int) -> str:
+    """Format the delta between two nanosecond values"""
+    delta = new_ns - old_ns
+    percent = (delta / old_ns * 100) if old_ns > 0 else 0
     sign = "+" if delta > 0 else ""
-    return f"{sign}{delta:.4f}s ({sign}{percent:.1f}%)"
+    return f"{sign}{delta / 1e9:.4f}s ({sign}{percent:.1f}%)"
 
 
 @app.command()
@@ -91,29 +378,43 @@ def run(
     name: str = typer.Argument(..., help="Benchmark name"),
     cmd: str = typer.Option(..., "--command", "-c", help="Command to benchmark"),
     iterations: int = typer.Option(3, "--iterations", "-n", help="Number of iterations"),
+    warmup: int = typer.Option(1, "--warmup", "-w", help="Untimed warmup iterations"),
+    parallel: int = typer.Option(
+        1,
+        "--parallel",
+        "-j",
+        help="Run up to N iterations concurrently (independent commands only; "
+        "measures throughput, not latency)",
+    ),
     save: bool = typer.Option(True, "--save/--no-save", help="Save result for comparison"),
 ):
     """Run a benchmark"""
     typer.echo(f"🏃 Running benchmark: {name}")
     typer.echo(f"Command: {cmd}")
-    typer.echo(f"Iterations: {iterations}")
+    typer.echo(f"Iterations: {iterations} (+{warmup} warmup)")
+    if parallel > 1:
+        typer.echo(f"Parallel: {parallel} (throughput mode)")
     typer.echo("-" * 40)
 
-    result = run_command(cmd, iterations)
+    result = run_command(cmd, iterations, warmup, parallel)
 
-    typer.echo(f"Total time: {result['total_time']:.4f}s")
-    typer.echo(f"Average: {result['avg_time']:.4f}s")
-    typer.echo(f"Min: {result['min_time']:.4f}s")
-    typer.echo(f"Max: {result['max_time']:.4f}s")
+    typer.echo(f"Min: {format_seconds(result['min_ns'])}")
+    typer.echo(f"Median: {format_seconds(result['median_ns'])} (MAD {format_seconds(result['mad_ns'])})")
+    typer.echo(f"Average: {format_seconds(result['avg_ns'])}")
+    typer.echo(f"Max: {format_seconds(result['max_ns'])}")
+    typer.echo(f"Total time: {format_seconds(result['total_ns'])}")
+    if result["outliers"]:
+        typer.echo(f"⚠️  {result['outliers']} outlier(s) beyond 3 MAD from the median")
+
+    previous = load_result(name)
 
     if save:
         filepath = save_result(result, name)
         typer.echo(f"\n💾 Saved to: {filepath}")
 
-    previous = load_result(name)
     if previous:
         typer.echo("\n📊 Comparison with previous run:")
-        typer.echo(f"  Average: {format_delta(previous['avg_time'], result['avg_time'])}")
+        typer.echo(f"  Min: {format_delta(get_ns(previous, 'min'), result['min_ns'])}")
 
 
 @app.command()
@@ -135,12 +436,14 @@ def compare(
 
     typer.echo("📊 Benchmark Comparison")
     typer.echo("-" * 40)
-    typer.echo(f"{name1}: {result1['avg_time']:.4f}s avg")
-    typer.echo(f"{name2}: {result2['avg_time']:.4f}s avg")
+    min1_ns = get_ns(result1, "min")
+    min2_ns = get_ns(result2, "min")
+    typer.echo(f"{name1}: {format_seconds(min1_ns)} min ({format_seconds(get_ns(result1, 'avg'))} avg)")
+    typer.echo(f"{name2}: {format_seconds(min2_ns)} min ({format_seconds(get_ns(result2, 'avg'))} avg)")
     typer.echo("")
-    typer.echo(f"Delta: {format_delta(result1['avg_time'], result2['avg_time'])}")
+    typer.echo(f"Delta: {format_delta(min1_ns, min2_ns)}")
 
-    if result1['avg_time'] < result2['avg_time']:
+    if min1_ns < min2_ns:
         typer.echo(f"✅ {name1} is faster")
     else:
         typer.echo(f"✅ {name2} is faster")
@@ -152,26 +455,45 @@ def history():
     typer.echo("📜 Benchmark History")
     typer.echo("-" * 40)
 
-    benchmarks = sorted(BENCHMARK_DIR.glob("*.json"))
+    with closing(_connect()) as conn:
+        runs = conn.execute(
+            "SELECT name, min_ns, iterations FROM runs ORDER BY timestamp DESC LIMIT 10"
+        ).fetchall()
 
-    if not benchmarks:
+    if not runs:
         typer.echo("No benchmarks saved yet.")
         raise typer.Exit(code=0)
 
-    for filepath in benchmarks[-10:]:
-        data = json.loads(filepath.read_text())
-        typer.echo(f"  • {filepath.stem}: {data['avg_time']:.4f}s avg ({data['iterations']} iterations)")
+    for name, min_ns, iterations in reversed(runs):
+        typer.echo(f"  • {name}: {format_seconds(min_ns)} min ({iterations} iterations)")
+
+
+@app.command()
+def export(
+    name: str = typer.Argument(..., help="Benchmark name"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write JSON to file"),
+):
+    """Export the latest result of a benchmark as JSON"""
+    result = load_result(name)
+
+    if not result:
+        typer.echo(f"❌ Benchmark '{name}' not found", err=True)
+        raise typer.Exit(code=1)
+
+    content = _dumps(result)
+    if output:
+        output.write_bytes(content)
+        typer.echo(f"💾 Exported to: {output}")
+    else:
+        typer.echo(content.decode("utf-8"))
 
 
 @app.command()
 def clear():
     """Clear benchmark history"""
-    global BENCHMARK_DIR
-    import shutil
-    if BENCHMARK_DIR.exists():
-        shutil.rmtree(BENCHMARK_DIR)
-        BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
-        typer.echo("✅ Benchmark history cleared")
+    shutil.rmtree(BENCHMARK_DIR, ignore_errors=True)
+    BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    typer.echo("✅ Benchmark history cleared")
 
 
 def main():
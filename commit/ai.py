@@ -1,12 +1,13 @@
 """Commit message generator - AI summarizer"""
 
-from shared.ai import AICommitSummarizer
-
-
 def generate_ai_commit_message(diff_content: str) -> str:
     """Generate commit message using AI"""
+    # Imported here so commands that don't use AI skip loading requests
+    from shared.ai import AICommitSummarizer
+
     try:
-        summarizer = AICommitSummarizer()
+        # Rerunning should give a fresh suggestion, so skip the response cache
+        summarizer = AICommitSummarizer(use_cache=False)
         return summarizer.summarize([diff_content], "commit")
     except ValueError as e:
         raise ValueError(f"AI generation failed: {e}")
@@ -1,6 +1,8 @@
 """Commit message generator - CLI commands"""
 
-from typing import Optional
+import functools
+import os
+from typing import TYPE_CHECKING, Optional
 
 import typer
 
@@ -12,6 +14,28 @@ app = typer.Typer(help="Generate and create high-quality conventional commit mes
 
 __all__ = ["app", "generate", "status", "diff"]
 
+if TYPE_CHECKING:
+    from git import Repo
+
+
+@functools.lru_cache(maxsize=4)
+def _get_repo(cwd: str) -> "Repo":
+    """Open the repository containing cwd (cached per directory)"""
+    from git import Repo
+
+    return Repo(cwd, search_parent_directories=True)
+
+
+def _open_repo() -> "Repo":
+    """Open the current repository or exit with an error"""
+    from git import InvalidGitRepositoryError
+
+    try:
+        return _get_repo(os.getcwd())
+    except InvalidGitRepositoryError:
+        typer.echo("❌ Not a git repository", err=True)
+        raise typer.Exit(code=1)
+
 
 @app.command()
 def generate(
@@ -46,13 +70,7 @@ def generate(
     amend: bool = typer.Option(False, "--amend", help="Amend the previous commit"),
 ):
     """Generate and create commit messages"""
-    from git import Repo, InvalidGitRepositoryError
-
-    try:
-        repo = Repo(".", search_parent_directories=True)
-    except InvalidGitRepositoryError:
-        typer.echo("❌ Not a git repository", err=True)
-        raise typer.Exit(code=1)
+    repo = _open_repo()
 
     try:
         if all_changes:
@@ -158,13 +176,7 @@ def _build_commit_message(
 @app.command()
 def status():
     """Show staged changes"""
-    from git import Repo, InvalidGitRepositoryError
-
-    try:
-        repo = Repo(".", search_parent_directories=True)
-    except InvalidGitRepositoryError:
-        typer.echo("❌ Not a git repository", err=True)
-        raise typer.Exit(code=1)
+    repo = _open_repo()
 
     files = get_staged_files(repo)
 
@@ -181,13 +193,7 @@ def status():
 @app.command()
 def diff():
     """Show detailed diff of staged changes"""
-    from git import Repo, InvalidGitRepositoryError
-
-    try:
-        repo = Repo(".", search_parent_directories=True)
-    except InvalidGitRepositoryError:
-        typer.echo("❌ Not a git repository", err=True)
-        raise typer.Exit(code=1)
+    repo = _open_repo()
 
     staged_diff = get_staged_diff(repo)
 
@@ -197,8 +203,16 @@ def diff():
 
     typer.echo("📄 Diff preview:")
     typer.echo("-" * 50)
-    lines = staged_diff.split("\n")[:100]
-    typer.echo("\n".join(lines))
-    if len(staged_diff.split("\n")) > 100:
-        typer.echo(f"\n... and {len(staged_diff.split('\n')) - 100} more lines")
+    # Locate the end of line 100 without splitting the whole diff
+    cut = -1
+    for _ in range(100):
+        cut = staged_diff.find("\n", cut + 1)
+        if cut < 0:
+            break
+    if cut < 0:
+        typer.echo(staged_diff)
+    else:
+        typer.echo(staged_diff[:cut])
+        remaining = staged_diff.count("\n", cut + 1) + 1
+        typer.echo(f"\n... and {remaining} more lines")
     typer.echo("-" * 50)
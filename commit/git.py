@@ -1,8 +1,31 @@
 """Commit message generator - Git operations"""
 
-from typing import NamedTuple, Optional
-
-from git import Repo
+import re
+import shutil
+import subprocess
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    # GitPython is slow to import; callers already hold a Repo instance
+    from git import Repo
+
+_GIT = shutil.which("git") or "git"
+
+# File paths from "+++ b/<path>" headers (and bare "a/<path>" lines)
+_DIFF_PATH_RE = re.compile(r"^(?:\+\+\+ b/|a/)(.*)$", re.MULTILINE)
+
+# Checked in order; the first scope with a matching keyword wins
+_SCOPE_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+    (scope, re.compile("|".join(re.escape(kw) for kw in keywords)))
+    for scope, keywords in (
+        ("auth", ["auth", "login", "password", "token", "jwt"]),
+        ("api", ["api", "endpoint", "route", "controller"]),
+        ("db", ["db", "migration", "model", "schema", "query"]),
+        ("ui", ["ui", "view", "page", "component", "button", "style", "css"]),
+        ("test", ["test", "spec", "__tests__"]),
+        ("docs", ["readme", "doc", ".md"]),
+    )
+]
 
 
 class StagedFile(NamedTuple):
@@ -12,7 +35,7 @@ class StagedFile(NamedTuple):
     status: str
 
 
-def get_staged_files(repo: Repo) -> list[StagedFile]:
+def get_staged_files(repo: "Repo") -> list[StagedFile]:
     """Get list of staged files with their status"""
     staged: list[StagedFile] = []
     for item in repo.index.diff("HEAD"):
@@ -29,15 +52,36 @@ def get_staged_files(repo: Repo) -> list[StagedFile]:
     return staged
 
 
-def get_staged_diff(repo: Repo) -> str:
+def _git_diff_cmd(repo: "Repo", *args: str) -> list[str]:
+    return [_GIT, "-C", str(repo.working_tree_dir), "diff", *args]
+
+
+def _decode_diff(output: bytes) -> str:
+    # Mirror GitPython, which drops the single trailing newline
+    text = output.decode("utf-8", errors="replace")
+    return text[:-1] if text.endswith("\n") else text
+
+
+def get_staged_diff(repo: "Repo") -> str:
     """Get staged changes as a diff string"""
-    return repo.git.diff("--cached")
+    result = subprocess.run(_git_diff_cmd(repo, "--cached"), capture_output=True, check=True)
+    return _decode_diff(result.stdout)
 
 
-def get_all_changes(repo: Repo) -> str:
+def get_all_changes(repo: "Repo") -> str:
     """Get all changes (staged + unstaged) as a diff string"""
-    staged = repo.git.diff("--cached")
-    unstaged = repo.git.diff()
+    # Run both diffs concurrently; they only read the repository
+    procs = [
+        subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        for cmd in (_git_diff_cmd(repo, "--cached"), _git_diff_cmd(repo))
+    ]
+    outputs = []
+    for proc in procs:
+        stdout, stderr = proc.communicate()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args, stdout, stderr)
+        outputs.append(_decode_diff(stdout))
+    staged, unstaged = outputs
     if staged and unstaged:
         return f"Staged:\n{staged}\n\nUnstaged:\n{unstaged}"
     return staged or unstaged
@@ -48,30 +92,19 @@ def analyze_diff_for_scope(diff: str) -> Optional[str]:
     if not diff:
         return None
 
-    files: list[str] = []
-    for line in diff.split("\n"):
-        if line.startswith("+++ b/") or line.startswith("a/"):
-            raw_path = line[6:] if line.startswith("+++ b/") else line[2:]
-            path = raw_path.strip()
-            if path and not path.startswith(".git"):
-                files.append(path)
+    files = [
+        path
+        for path in (raw.strip() for raw in _DIFF_PATH_RE.findall(diff))
+        if path and not path.startswith(".git")
+    ]
 
     if not files:
         return None
 
     path_str = " ".join(files).lower()
 
-    scope_indicators: dict[str, list[str]] = {
-        "auth": ["auth", "login", "password", "token", "jwt"],
-        "api": ["api", "endpoint", "route", "controller"],
-        "db": ["db", "migration", "model", "schema", "query"],
-        "ui": ["ui", "view", "page", "component", "button", "style", "css"],
-        "test": ["test", "spec", "__tests__"],
-        "docs": ["readme", "doc", ".md"],
-    }
-
-    for scope, keywords in scope_indicators.items():
-        if any(kw in path_str for kw in keywords):
+    for scope, pattern in _SCOPE_PATTERNS:
+        if pattern.search(path_str):
             return scope
 
     return None
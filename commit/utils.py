@@ -30,18 +30,29 @@ def generate_conventional_message(
     return f"{commit_type}: {subject}"
 
 
+_OK = (True, "")
+_ERR_EMPTY = (False, "Subject is required")
+_ERR_TOO_LONG = (False, "Subject too long (max 50 characters)")
+_ERR_CAPITALIZED = (False, "Subject should not start with capital letter")
+_ERR_PERIOD = (False, "Subject should not end with period")
+
+
 def validate_subject(subject: str) -> tuple[bool, str]:
     """Validate commit subject"""
+    if subject and len(subject) <= 50 and not subject[0].isupper() and not subject.endswith("."):
+        return _OK
+    return _classify_subject_error(subject)
+
+
+def _classify_subject_error(subject: str) -> tuple[bool, str]:
+    """Return the first validation error for an invalid subject"""
     if not subject:
-        return False, "Subject is required"
+        return _ERR_EMPTY
 
     if len(subject) > 50:
-        return False, "Subject too long (max 50 characters)"
+        return _ERR_TOO_LONG
 
     if subject[0].isupper():
-        return False, "Subject should not start with capital letter"
-
-    if subject.endswith("."):
-        return False, "Subject should not end with period"
+        return _ERR_CAPITALIZED
 
-    return True, ""
+    return _ERR_PERIOD
@@ -10,8 +10,6 @@ from typing import Optional
 
 import typer
 
-from shared.ai import chat_completion
-
 app = typer.Typer(help="Check grammar and rewrite text", add_completion=True)
 
 
@@ -49,6 +47,8 @@ def main(
         "Return only the corrected text, without labels, explanations, or extra commentary."
     )
 
+    from shared.ai import chat_completion
+
     try:
         result = chat_completion(
             system_prompt,
@@ -1,12 +1,15 @@
 """Mock - Mock data generator CLI"""
 
+import csv
+import io
 import json
-import random
 import string
 import warnings
-from datetime import datetime, timedelta
-from typing import Any
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable
 
+import numpy as np
 import typer
 
 warnings.filterwarnings("ignore", message=".*'mock.main' found in sys.modules.*")
@@ -15,96 +18,230 @@ app = typer.Typer(help="Generate mock data for testing and demos", add_completio
 
 SEED = 42
 
-
-def random_string(length: int = 10) -> str:
-    return "".join(random.choices(string.ascii_letters, k=length))
-
-
-def random_email() -> str:
-    domains = ["example.com", "test.org", "demo.net", "sample.io"]
-    return f"{random_string(8)}@{random_domain()}"
-
-
-def random_domain() -> str:
-    domains = ["example.com", "test.org", "demo.net", "sample.io"]
-    return random.choice(domains)
-
-
-def random_name() -> str:
-    first_names = ["John", "Jane", "Bob", "Alice", "Charlie", "Diana", "Eve", "Frank"]
-    last_names = ["Smith", "Doe", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis"]
-    return f"{random.choice(first_names)} {random.choice(last_names)}"
-
-
-def random_phone() -> str:
-    return f"+1-{random.randint(200, 999)}-{random.randint(100, 999)}-{random.randint(1000, 9999)}"
-
-
-def random_date(start: datetime, end: datetime) -> datetime:
-    delta = end - start
-    random_days = random.randint(0, delta.days)
-    return start + timedelta(days=random_days)
-
-
-def random_address() -> dict[str, Any]:
-    streets = ["Main St", "Oak Ave", "Park Blvd", "Cedar Ln", "Maple Dr", "Pine Rd"]
-    cities = ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Philadelphia"]
-    return {
-        "street": f"{random.randint(100, 9999)} {random.choice(streets)}",
-        "city": random.choice(cities),
-        "state": random.choice(["NY", "CA", "IL", "TX", "AZ", "PA"]),
-        "zip": f"{random.randint(10000, 99999)}",
-    }
-
-
-GENERATORS = {
-    "user": lambda: {
-        "id": random.randint(1, 10000),
-        "name": random_name(),
-        "email": random_email(),
-        "phone": random_phone(),
-        "address": random_address(),
-        "created_at": datetime.now().isoformat(),
-    },
-    "product": lambda: {
-        "id": random.randint(1, 1000),
-        "name": f"Product {random_string(8).title()}",
-        "sku": f"SKU-{random_string(6).upper()}",
-        "price": round(random.uniform(10, 1000), 2),
-        "category": random.choice(["Electronics", "Clothing", "Books", "Home", "Sports"]),
-        "in_stock": random.choice([True, False]),
-    },
-    "order": lambda: {
-        "id": random.randint(1, 100000),
-        "customer": random_name(),
-        "items": random.randint(1, 5),
-        "total": round(random.uniform(50, 500), 2),
-        "status": random.choice(["pending", "processing", "shipped", "delivered", "cancelled"]),
-        "created_at": datetime.now().isoformat(),
-    },
-    "log": lambda: {
-        "timestamp": datetime.now().isoformat(),
-        "level": random.choice(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
-        "message": random.choice([
-            "Request processed successfully",
-            "Cache miss for key",
-            "Database connection established",
-            "User login successful",
-            "API rate limit approaching",
-            "Background job completed",
-        ]),
-        "service": random.choice(["api", "auth", "database", "cache", "worker"]),
-    },
-    "event": lambda: {
-        "id": random.randint(1, 10000),
-        "type": random.choice(["click", "view", "purchase", "signup", "login", "logout"]),
-        "user_id": random.randint(1, 1000),
-        "timestamp": datetime.now().isoformat(),
-        "properties": {
-            "page": f"/{random_string(5)}",
-            "duration": random.randint(1, 300),
-        },
-    },
+# Choice tables are built once as numpy arrays so batch helpers only index them
+_LETTERS = np.frombuffer(string.ascii_letters.encode("ascii"), dtype=np.uint8)
+_DOMAINS = np.array(("example.com", "test.org", "demo.net", "sample.io"))
+_FIRST_NAMES = np.array(("John", "Jane", "Bob", "Alice", "Charlie", "Diana", "Eve", "Frank"))
+_LAST_NAMES = np.array(
+    ("Smith", "Doe", "Johnson", "Williams", "Brown", "Jones", "Miller", "Davis")
+)
+_STREETS = np.array(("Main St", "Oak Ave", "Park Blvd", "Cedar Ln", "Maple Dr", "Pine Rd"))
+_CITIES = np.array(
+    ("New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Philadelphia")
+)
+_STATES = np.array(("NY", "CA", "IL", "TX", "AZ", "PA"))
+_CATEGORIES = np.array(("Electronics", "Clothing", "Books", "Home", "Sports"))
+_BOOLS = np.array((True, False))
+_ORDER_STATUSES = np.array(("pending", "processing", "shipped", "delivered", "cancelled"))
+_LOG_LEVELS = np.array(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+_LOG_MESSAGES = np.array(
+    (
+        "Request processed successfully",
+        "Cache miss for key",
+        "Database connection established",
+        "User login successful",
+        "API rate limit approaching",
+        "Background job completed",
+    )
+)
+_SERVICES = np.array(("api", "auth", "database", "cache", "worker"))
+_EVENT_TYPES = np.array(("click", "view", "purchase", "signup", "login", "logout"))
+
+# Each helper below generates a whole column of ``n`` values with one numpy
+# call; records are only assembled at the end of each batch generator.
+# Batch generators share one ``now_iso`` timestamp for all their records.
+
+
+def random_strings(rng: np.random.Generator, n: int, length: int = 10) -> list[str]:
+    # Map indices to ASCII bytes and decode all strings in one go
+    idx = rng.integers(0, len(_LETTERS), (n, length))
+    text = _LETTERS[idx].tobytes().decode("ascii")
+    return [text[i : i + length] for i in range(0, n * length, length)]
+
+
+def random_choices(rng: np.random.Generator, options: np.ndarray, n: int) -> list:
+    return options[rng.integers(0, len(options), n)].tolist()
+
+
+def random_ints(rng: np.random.Generator, low: int, high: int, n: int) -> list[int]:
+    """Random ints in [low, high], like random.randint"""
+    return rng.integers(low, high + 1, n).tolist()
+
+
+def random_prices(rng: np.random.Generator, low: float, high: float, n: int) -> list[float]:
+    return np.round(rng.uniform(low, high, n), 2).tolist()
+
+
+def random_emails(rng: np.random.Generator, n: int) -> list[str]:
+    users = random_strings(rng, n, 8)
+    return [f"{user}@{domain}" for user, domain in zip(users, random_choices(rng, _DOMAINS, n))]
+
+
+def random_names(rng: np.random.Generator, n: int) -> list[str]:
+    firsts = random_choices(rng, _FIRST_NAMES, n)
+    lasts = random_choices(rng, _LAST_NAMES, n)
+    return [f"{first} {last}" for first, last in zip(firsts, lasts)]
+
+
+def random_phones(rng: np.random.Generator, n: int) -> list[str]:
+    areas = random_ints(rng, 200, 999, n)
+    prefixes = random_ints(rng, 100, 999, n)
+    lines = random_ints(rng, 1000, 9999, n)
+    return [f"+1-{a}-{p}-{line}" for a, p, line in zip(areas, prefixes, lines)]
+
+
+def random_addresses(rng: np.random.Generator, n: int) -> list[dict[str, Any]]:
+    return [
+        {"street": f"{number} {street}", "city": city, "state": state, "zip": str(zip_code)}
+        for number, street, city, state, zip_code in zip(
+            random_ints(rng, 100, 9999, n),
+            random_choices(rng, _STREETS, n),
+            random_choices(rng, _CITIES, n),
+            random_choices(rng, _STATES, n),
+            random_ints(rng, 10000, 99999, n),
+        )
+    ]
+
+
+def _user_batch(rng: np.random.Generator, n: int, now_iso: str) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": id_,
+            "name": name,
+            "email": email,
+            "phone": phone,
+            "address": address,
+            "created_at": now_iso,
+        }
+        for id_, name, email, phone, address in zip(
+            random_ints(rng, 1, 10000, n),
+            random_names(rng, n),
+            random_emails(rng, n),
+            random_phones(rng, n),
+            random_addresses(rng, n),
+        )
+    ]
+
+
+def _product_batch(rng: np.random.Generator, n: int, now_iso: str) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": id_,
+            "name": f"Product {name.title()}",
+            "sku": f"SKU-{sku.upper()}",
+            "price": price,
+            "category": category,
+            "in_stock": in_stock,
+        }
+        for id_, name, sku, price, category, in_stock in zip(
+            random_ints(rng, 1, 1000, n),
+            random_strings(rng, n, 8),
+            random_strings(rng, n, 6),
+            random_prices(rng, 10, 1000, n),
+            random_choices(rng, _CATEGORIES, n),
+            random_choices(rng, _BOOLS, n),
+        )
+    ]
+
+
+def _order_batch(rng: np.random.Generator, n: int, now_iso: str) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": id_,
+            "customer": customer,
+            "items": items,
+            "total": total,
+            "status": status,
+            "created_at": now_iso,
+        }
+        for id_, customer, items, total, status in zip(
+            random_ints(rng, 1, 100000, n),
+            random_names(rng, n),
+            random_ints(rng, 1, 5, n),
+            random_prices(rng, 50, 500, n),
+            random_choices(rng, _ORDER_STATUSES, n),
+        )
+    ]
+
+
+def _log_batch(rng: np.random.Generator, n: int, now_iso: str) -> list[dict[str, Any]]:
+    return [
+        {
+            "timestamp": now_iso,
+            "level": level,
+            "message": message,
+            "service": service,
+        }
+        for level, message, service in zip(
+            random_choices(rng, _LOG_LEVELS, n),
+            random_choices(rng, _LOG_MESSAGES, n),
+            random_choices(rng, _SERVICES, n),
+        )
+    ]
+
+
+def _event_batch(rng: np.random.Generator, n: int, now_iso: str) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": id_,
+            "type": event_type,
+            "user_id": user_id,
+            "timestamp": now_iso,
+            "properties": {
+                "page": f"/{page}",
+                "duration": duration,
+            },
+        }
+        for id_, event_type, user_id, page, duration in zip(
+            random_ints(rng, 1, 10000, n),
+            random_choices(rng, _EVENT_TYPES, n),
+            random_ints(rng, 1, 1000, n),
+            random_strings(rng, n, 5),
+            random_ints(rng, 1, 300, n),
+        )
+    ]
+
+
+@lru_cache(maxsize=1)
+def _orjson():
+    """Import orjson once, on first use; it is an optional speedup"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _to_json(data: Any, indent: bool = False) -> str:
+    """Serialize to JSON, using orjson when available"""
+    orjson = _orjson()
+    if orjson is None:
+        # Match orjson's output byte for byte: compact separators, raw UTF-8
+        if indent:
+            return json.dumps(data, indent=2, ensure_ascii=False)
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+
+
+def _csv_cell(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _to_json(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+def _flatten(item: dict[str, Any]) -> tuple:
+    """Turn a record into CSV cells (nested dicts as JSON, bools lowercased)"""
+    return tuple(_csv_cell(v) for v in item.values())
+
+
+GENERATORS: dict[str, Callable[[np.random.Generator, int, str], list[dict[str, Any]]]] = {
+    "user": _user_batch,
+    "product": _product_batch,
+    "order": _order_batch,
+    "log": _log_batch,
+    "event": _event_batch,
 }
 
 
@@ -116,32 +253,27 @@ def generate(
     seed: int = typer.Option(SEED, "--seed", "-s", help="Random seed for reproducibility"),
 ):
     """Generate mock data"""
-    random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     if type not in GENERATORS:
         typer.echo(f"❌ Unknown type: {type}", err=True)
         typer.echo(f"Available types: {', '.join(GENERATORS.keys())}")
         raise typer.Exit(code=1)
 
+    # One timestamp for the whole batch instead of a clock read per record
+    now_iso = datetime.now().isoformat()
     generator = GENERATORS[type]
-    data = [generator() for _ in range(count)]
+    data = generator(rng, count, now_iso)
 
     if format == "json":
-        output = json.dumps(data, indent=2)
+        output = _to_json(data, indent=True)
     elif format == "csv":
         if data:
-            headers = list(data[0].keys())
-            output = ",".join(headers) + "\n"
-            for item in data:
-                values = []
-                for v in item.values():
-                    if isinstance(v, dict):
-                        values.append(json.dumps(v))
-                    elif isinstance(v, bool):
-                        values.append(str(v).lower())
-                    else:
-                        values.append(str(v))
-                output += ",".join(values) + "\n"
+            buf = io.StringIO()
+            writer = csv.writer(buf, lineterminator="\n")
+            writer.writerow(data[0].keys())
+            writer.writerows(_flatten(item) for item in data)
+            output = buf.getvalue()
         else:
             output = ""
     else:
@@ -1,7 +1,9 @@
 """Port - Port conflict resolver CLI"""
 
 import os
+import re
 import signal
+import socket
 import subprocess
 import warnings
 from typing import Optional
@@ -12,17 +14,25 @@ warnings.filterwarnings("ignore", message=".*'port.main' found in sys.modules.*"
 
 app = typer.Typer(help="Detect and resolve port conflicts", add_completion=True)
 
+# ss -p appends e.g. users:(("nginx",pid=1234,fd=6)) to each socket line
+_SS_PID_RE = re.compile(r"pid=(\d+)")
+
 
 def get_process_info_linux(pid: int) -> dict:
     """Get process info on Linux"""
     try:
-        cmdline = f"/proc/{pid}/cmdline"
-        if os.path.exists(cmdline):
-            cmd = open(cmdline).read().replace("\x00", " ")
-            return {"pid": pid, "cmd": cmd[:100]}
-    except Exception:
-        pass
-    return {"pid": pid, "cmd": "Unknown"}
+        fd = os.open(f"/proc/{pid}/cmdline", os.O_RDONLY)
+    except OSError:
+        return {"pid": pid, "cmd": "Unknown"}
+    try:
+        # Only the first 100 characters are shown, so one small read is enough
+        data = os.read(fd, 4096)
+    except OSError:
+        return {"pid": pid, "cmd": "Unknown"}
+    finally:
+        os.close(fd)
+    cmd = data.replace(b"\x00", b" ").decode("utf-8", errors="replace")
+    return {"pid": pid, "cmd": cmd[:100]}
 
 
 def find_process_on_port(port: int) -> Optional[dict]:
@@ -45,9 +55,13 @@ def find_process_on_port(port: int) -> Optional[dict]:
     return None
 
 
-def get_all_ports() -> list[tuple[int, int]]:
-    """Get all listening ports with PIDs"""
-    ports = []
+def get_all_ports() -> list[tuple[int, Optional[int]]]:
+    """Get all listening ports with PIDs
+
+    PIDs come from the same ``ss -tlnp`` call and are None when ss cannot
+    see the owning process (e.g. sockets of other users without root).
+    """
+    ports: dict[int, Optional[int]] = {}
     try:
         result = subprocess.run(
             ["ss", "-tlnp"],
@@ -55,28 +69,48 @@ def get_all_ports() -> list[tuple[int, int]]:
             text=True,
         )
         for line in result.stdout.split("\n"):
-            if ":" in line and "LISTEN" in line:
-                parts = line.split()
-                for part in parts:
-                    if part.startswith(":"):
-                        try:
-                            port = int(part.replace(":", ""))
-                            ports.append((port, None))
-                        except ValueError:
-                            pass
+            parts = line.split()
+            if len(parts) < 4 or parts[0] != "LISTEN":
+                continue
+            # Local address is e.g. 0.0.0.0:8080, [::]:8080 or *:8080
+            try:
+                port = int(parts[3].rpartition(":")[2])
+            except ValueError:
+                continue
+            match = _SS_PID_RE.search(line)
+            pid = int(match.group(1)) if match else None
+            if ports.get(port) is None:
+                ports[port] = pid
     except Exception:
         pass
-    return ports
+    return [*ports.items()]  # "list" is shadowed by the command below
+
+
+def _can_bind(port: int) -> bool:
+    """Check whether a TCP port is free by trying to bind it"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        try:
+            sock.bind(("", port))
+        except OSError:
+            return False
+    return True
 
 
 def get_free_port(start: int = 8000, end: int = 9000) -> int:
     """Find a free port in range"""
     for port in range(start, end + 1):
-        if find_process_on_port(port) is None:
+        if _can_bind(port):
             return port
     raise ValueError(f"No free port found in range {start}-{end}")
 
 
+def get_any_free_port() -> int:
+    """Let the kernel pick any free port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("", 0))
+        return sock.getsockname()[1]
+
+
 @app.command()
 def list(
     port: Optional[int] = typer.Option(None, "--port", "-p", help="Check specific port"),
@@ -94,8 +128,15 @@ def list(
         typer.echo("📋 Listening Ports")
         typer.echo("-" * 40)
         ports = get_all_ports()[:20]
-        for p, _ in ports:
-            proc = find_process_on_port(p)
+        # Only fall back to one lsof call per port if ss reported no PIDs
+        have_pids = any(pid is not None for _, pid in ports)
+        for p, pid in ports:
+            if pid is not None:
+                proc = get_process_info_linux(pid)
+            elif have_pids:
+                proc = None
+            else:
+                proc = find_process_on_port(p)
             if proc:
                 typer.echo(f"🔴 {p:5} - {proc['cmd'][:40]}")
             else:
@@ -129,10 +170,11 @@ def find(
 def free(
     start: int = typer.Option(8000, "--start", "-s", help="Start of port range"),
     end: int = typer.Option(9000, "--end", "-e", help="End of port range"),
+    any_port: bool = typer.Option(False, "--any", help="Any free port, ignoring the range"),
 ):
     """Find a free port in range"""
     try:
-        port = get_free_port(start, end)
+        port = get_any_free_port() if any_port else get_free_port(start, end)
         typer.echo(f"🟢 Free port found: {port}")
     except ValueError as e:
         typer.echo(f"❌ {e}")
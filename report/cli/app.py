@@ -1,5 +1,7 @@
 """CLI application setup and command registration"""
 
+import os
+
 import typer
 
 from report.cli import completion
@@ -9,6 +11,21 @@ from report.cli.commands import config as config_cmd
 # Create main app
 app = typer.Typer(help="Daily & Weekly Report CLI", add_completion=True)
 
+
+@app.callback()
+def main(
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Skip the on-disk caches (AI summaries, repository discovery)",
+    ),
+):
+    """Daily & Weekly Report CLI"""
+    if no_cache:
+        os.environ["GROQ_CACHE"] = "false"
+        os.environ["REPORT_DISCOVERY_CACHE"] = "false"
+
+
 # Register basic commands (daily, yesterday, weekly, lastweek, range)
 app.command(name="daily")(basic.daily)
 app.command(name="yesterday")(basic.yesterday)
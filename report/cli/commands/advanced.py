@@ -1,21 +1,20 @@
 """Advanced commands (filter, search, multirepo, tickets)"""
 
-from collections import defaultdict
+import re
 
 import typer
 
-from report.cli.formatters import print_commits_table
-from report.git.commits import (
-    discover_repos_in_directory,
-    get_commits_detailed,
-    get_commits_from_multiple_repos,
-)
+from report.cli.handlers import normalize_author
 from report.utils.dates import custom_range, last_n_days_range
-from report.utils.tickets import group_commits_by_ticket
 
 app = typer.Typer()
 
 
+def _keyword_pattern(keywords: str) -> re.Pattern[str]:
+    """Compile comma-separated keywords into one alternation matched against lowercased text"""
+    return re.compile("|".join(re.escape(k.strip().lower()) for k in keywords.split(",")))
+
+
 @app.command()
 def filter(
     days: int = typer.Option(
@@ -50,6 +49,11 @@ def filter(
     ),
 ):
     """Filter commits with advanced options"""
+    from report.cli.formatters import print_commits_table
+    from report.git.commits import get_commits_detailed
+
+    _, author = normalize_author(author)
+
     since, until = last_n_days_range(days)
 
     # Get commits
@@ -59,23 +63,19 @@ def filter(
         typer.echo(f"No commits found in last {days} days.")
         raise typer.Exit(code=0)
 
-    # Apply include filter
-    if include:
-        include_keywords = [k.strip().lower() for k in include.split(",")]
-        commits_info = [
-            c
-            for c in commits_info
-            if any(keyword in c.message.lower() for keyword in include_keywords)
-        ]
-
-    # Apply exclude filter
-    if exclude:
-        exclude_keywords = [k.strip().lower() for k in exclude.split(",")]
-        commits_info = [
-            c
-            for c in commits_info
-            if not any(keyword in c.message.lower() for keyword in exclude_keywords)
-        ]
+    # Apply include/exclude filters in one pass, lowercasing each message once
+    if include or exclude:
+        include_re = _keyword_pattern(include) if include else None
+        exclude_re = _keyword_pattern(exclude) if exclude else None
+        matched = []
+        for c in commits_info:
+            message = c.message.lower()
+            if include_re and not include_re.search(message):
+                continue
+            if exclude_re and exclude_re.search(message):
+                continue
+            matched.append(c)
+        commits_info = matched
 
     if not commits_info:
         typer.echo("No commits match the filter criteria.")
@@ -90,25 +90,38 @@ def filter(
 
     # Show files if requested
     if files:
-        from git import Repo
+        from concurrent.futures import ThreadPoolExecutor
 
-        repo = Repo(".", search_parent_directories=True)
+        from report.git.commits import open_repo
 
-        typer.echo("\n📁 Files Changed:\n")
-        for commit in commits_info:
+        repo = open_repo(".")
+
+        def changed_files(commit_hash: str) -> list[str] | Exception:
+            # One git subprocess per commit, so lookups can run side by side
             try:
-                git_commit = repo.commit(commit.hash)
-                changed_files = list(git_commit.stats.files.keys())
-
-                if changed_files:
-                    typer.echo(f"  {commit.hash} - {commit.message[:50]}")
-                    for file in changed_files[:5]:  # Show first 5 files
-                        typer.echo(f"    • {file}")
-                    if len(changed_files) > 5:
-                        typer.echo(f"    ... and {len(changed_files) - 5} more")
-                    typer.echo()
+                output = repo.git.diff_tree(
+                    "--no-commit-id", "--name-only", "-r", "--root", "-m", "--first-parent",
+                    commit_hash,
+                )
             except Exception as e:
-                typer.echo(f"  {commit.hash} - Error: {e}")
+                return e
+            return output.splitlines()
+
+        hashes = [c.hash for c in commits_info]
+        with ThreadPoolExecutor(max_workers=max(1, min(16, len(hashes)))) as pool:
+            files_by_commit = pool.map(changed_files, hashes)
+
+        typer.echo("\n📁 Files Changed:\n")
+        for commit, commit_files in zip(commits_info, files_by_commit):
+            if isinstance(commit_files, Exception):
+                typer.echo(f"  {commit.hash} - Error: {commit_files}")
+            elif commit_files:
+                typer.echo(f"  {commit.hash} - {commit.message[:50]}")
+                for file in commit_files[:5]:  # Show first 5 files
+                    typer.echo(f"    • {file}")
+                if len(commit_files) > 5:
+                    typer.echo(f"    ... and {len(commit_files) - 5} more")
+                typer.echo()
 
 
 @app.command()
@@ -137,6 +150,11 @@ def search(
     ),
 ):
     """Search commits by keyword"""
+    from report.cli.formatters import print_commits_table
+    from report.git.commits import get_commits_detailed
+
+    _, author = normalize_author(author)
+
     since, until = last_n_days_range(days)
 
     # Get all commits
@@ -151,7 +169,9 @@ def search(
         matching = [c for c in commits_info if keyword in c.message]
     else:
         keyword_lower = keyword.lower()
-        matching = [c for c in commits_info if keyword_lower in c.message.lower()]
+        # Messages are single subject lines, so lowercase them all in one call
+        lowered = "\n".join(c.message for c in commits_info).lower().split("\n")
+        matching = [c for c, message in zip(commits_info, lowered) if keyword_lower in message]
 
     # Display results
     if not matching:
@@ -198,8 +218,23 @@ def multirepo(
         "--discover",
         help="Auto-discover repositories in workspace",
     ),
+    jobs: int = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Repositories to scan in parallel (default: CPU count x 4, max 32)",
+    ),
 ):
     """Generate report across multiple repositories"""
+    from itertools import groupby
+    from operator import attrgetter
+
+    from report.cli.formatters import print_commits_table
+    from report.git.commits import discover_repos_in_directory, get_commits_from_multiple_repos
+
+    _, author = normalize_author(author)
+
     # Determine repository paths
     repo_paths = []
 
@@ -221,11 +256,8 @@ def multirepo(
             import os
 
             try:
-                repo_paths = [
-                    os.path.join(workspace, d)
-                    for d in os.listdir(workspace)
-                    if os.path.isdir(os.path.join(workspace, d))
-                ]
+                with os.scandir(workspace) as entries:
+                    repo_paths = [entry.path for entry in entries if entry.is_dir()]
             except OSError as e:
                 typer.echo(f"Error accessing workspace: {e}", err=True)
                 raise typer.Exit(code=1)
@@ -242,21 +274,24 @@ def multirepo(
     # Get commits from all repos
     typer.echo(f"📊 Multi-Repository Report - last {days} days\n")
 
-    commits_info = get_commits_from_multiple_repos(repo_paths, since, until, author)
+    commits_info = get_commits_from_multiple_repos(
+        repo_paths, since, until, author, max_workers=jobs
+    )
 
     if not commits_info:
         typer.echo("No commits found across all repositories.")
         raise typer.Exit(code=0)
 
-    # Group by repository
-    by_repo = defaultdict(list)
-    for commit in commits_info:
-        by_repo[commit.repo].append(commit)
+    # Group by repository (stable sort keeps each repo's commits newest first)
+    repo_key = attrgetter("repo")
+    by_repo = [
+        (repo_name, [*repo_commits])
+        for repo_name, repo_commits in groupby(sorted(commits_info, key=repo_key), key=repo_key)
+    ]
 
     typer.echo(f"Found {len(commits_info)} commit(s) across {len(by_repo)} repositories:\n")
 
-    for repo_name in sorted(by_repo.keys()):
-        repo_commits = by_repo[repo_name]
+    for repo_name, repo_commits in by_repo:
         typer.echo(f"📁 {repo_name} ({len(repo_commits)} commits)")
         print_commits_table(repo_commits, title=None)
 
@@ -295,6 +330,12 @@ def tickets(
     ),
 ):
     """Show commits grouped by ticket/issue numbers"""
+    from report.cli.formatters import print_commits_table
+    from report.git.commits import get_commits_detailed
+    from report.utils.tickets import group_commits_by_ticket
+
+    _, author = normalize_author(author)
+
     # Determine date range
     try:
         if from_date and to_date:
@@ -1,19 +1,11 @@
 """Basic report commands (daily, yesterday, weekly, lastweek, range)"""
 
 from datetime import date as date_module
+from datetime import datetime
 
 import typer
 
-from report.cli.formatters import print_simple_report
-from report.cli.handlers import (
-    generate_custom_range_team_report,
-    generate_team_report,
-    handle_detailed_report,
-    handle_export,
-    prepare_grouped_commits_for_export,
-)
-from report.git.commits import get_commits, get_commits_detailed
-from report.utils.categorizer import group_commits_by_component
+from report.cli.handlers import normalize_author
 from report.utils.dates import (
     custom_range,
     last_n_days_range,
@@ -27,6 +19,76 @@ from report.utils.dates import (
 app = typer.Typer()
 
 
+def _run_report(
+    since: datetime,
+    until: datetime,
+    *,
+    title: str,
+    plain_title: str,
+    empty_message: str,
+    report_type: str,
+    summarize: bool,
+    author: str | None,
+    export: str | None,
+    output: str | None,
+    group_by_component: bool = False,
+    by_day: bool = False,
+) -> None:
+    """Shared simple-list → export → summarize flow for an individual report"""
+    from report.git.commits import get_commits, get_commits_detailed
+
+    if not (summarize or export):
+        from report.cli.formatters import print_simple_report
+
+        # Plain list only needs subjects, which one `git log` call provides
+        messages = get_commits(".", since, until, author)
+        if not messages:
+            typer.echo(empty_message)
+            raise typer.Exit(code=0)
+        print_simple_report(messages, f"{plain_title} (by {author})" if author else plain_title)
+        return
+
+    commits_info = get_commits_detailed(".", since, until, author)
+
+    if not commits_info:
+        typer.echo(empty_message)
+        raise typer.Exit(code=0)
+
+    commits_messages = [c.message for c in commits_info]
+
+    # Handle export if requested (the only path that needs components up front)
+    if export:
+        from report.cli.handlers import handle_export, prepare_grouped_commits_for_export
+        from report.utils.categorizer import group_commits_by_component
+
+        grouped_info = None
+        if group_by_component:
+            grouped = group_commits_by_component(commits_messages)
+            grouped_info = prepare_grouped_commits_for_export(commits_info, grouped)
+        metadata = {
+            "title": title,
+            "date_range": f"{since.strftime('%Y-%m-%d')} to {until.strftime('%Y-%m-%d')}",
+            "author": author if author else "All authors",
+        }
+        handle_export(commits_info, export, output, metadata, grouped_info)
+        return
+
+    from report.cli.handlers import handle_detailed_report
+
+    # Build title
+    title = f"📊 {title} (by {author})" if author else f"📊 {title}"
+
+    handle_detailed_report(
+        commits_info,
+        commits_messages,
+        title,
+        report_type,
+        summarize,
+        group_by_component=group_by_component,
+        by_day=by_day,
+    )
+
+
 @app.command()
 def daily(
     summarize: bool = typer.Option(
@@ -63,38 +125,27 @@ def daily(
     """Generate daily report"""
     since, until = today_range()
 
-    # Team mode - show all authors
-    if team or (author and author.lower() == "all"):
-        generate_team_report(since, until, "daily", summarize)
-        return
+    kind, author = normalize_author(author)
 
-    # Get detailed info for table
-    commits_info = get_commits_detailed(".", since, until, author)
-
-    if not commits_info:
-        typer.echo("No commits today.")
-        raise typer.Exit(code=0)
+    # Team mode - show all authors
+    if team or kind == "all":
+        from report.cli.handlers import generate_team_report
 
-    # Handle export if requested
-    if export:
-        metadata = {
-            "title": "Today's Commits",
-            "date_range": f"{since.strftime('%Y-%m-%d')} to {until.strftime('%Y-%m-%d')}",
-            "author": author if author else "All authors",
-        }
-        handle_export(commits_info, export, output, metadata)
+        generate_team_report(since, until, "daily", summarize)
         return
 
-    # Build title
-    title_prefix = "📊 Today's Commits" if summarize else "Today's commits"
-    title = f"{title_prefix} (by {author})" if author else title_prefix
-
-    if summarize:
-        commits_messages = [c.message for c in commits_info]
-        handle_detailed_report(commits_info, commits_messages, title, "daily", summarize)
-    else:
-        commits = get_commits(".", since, until, author)
-        print_simple_report(commits, title)
+    _run_report(
+        since,
+        until,
+        title="Today's Commits",
+        plain_title="Today's commits",
+        empty_message="No commits today.",
+        report_type="daily",
+        summarize=summarize,
+        author=author,
+        export=export,
+        output=output,
+    )
 
 
 @app.command()
@@ -133,38 +184,27 @@ def yesterday(
     """Generate yesterday's report"""
     since, until = yesterday_range()
 
-    # Team mode - show all authors
-    if team or (author and author.lower() == "all"):
-        generate_team_report(since, until, "daily", summarize)
-        return
-
-    # Get detailed info for table
-    commits_info = get_commits_detailed(".", since, until, author)
+    kind, author = normalize_author(author)
 
-    if not commits_info:
-        typer.echo("No commits yesterday.")
-        raise typer.Exit(code=0)
+    # Team mode - show all authors
+    if team or kind == "all":
+        from report.cli.handlers import generate_team_report
 
-    # Handle export if requested
-    if export:
-        metadata = {
-            "title": "Yesterday's Commits",
-            "date_range": f"{since.strftime('%Y-%m-%d')} to {until.strftime('%Y-%m-%d')}",
-            "author": author if author else "All authors",
-        }
-        handle_export(commits_info, export, output, metadata)
+        generate_team_report(since, until, "daily", summarize)
         return
 
-    # Build title
-    title_prefix = "📊 Yesterday's Commits" if summarize else "Yesterday's commits"
-    title = f"{title_prefix} (by {author})" if author else title_prefix
-
-    if summarize:
-        commits_messages = [c.message for c in commits_info]
-        handle_detailed_report(commits_info, commits_messages, title, "daily", summarize)
-    else:
-        commits = get_commits(".", since, until, author)
-        print_simple_report(commits, title)
+    _run_report(
+        since,
+        until,
+        title="Yesterday's Commits",
+        plain_title="Yesterday's commits",
+        empty_message="No commits yesterday.",
+        report_type="daily",
+        summarize=summarize,
+        author=author,
+        export=export,
+        output=output,
+    )
 
 
 @app.command()
@@ -199,48 +239,38 @@ def weekly(
         "-o",
         help="Output file path (prints to stdout if not specified)",
     ),
+    by_day: bool = typer.Option(
+        False,
+        "--by-day",
+        help="With --summarize, also summarize each day separately",
+    ),
 ):
     """Generate weekly report"""
     since, until = this_week_range()
 
-    # Team mode - show all authors
-    if team or (author and author.lower() == "all"):
-        generate_team_report(since, until, "weekly", summarize)
-        return
-
-    # Get detailed info for table
-    commits_info = get_commits_detailed(".", since, until, author)
+    kind, author = normalize_author(author)
 
-    if not commits_info:
-        typer.echo("No commits this week.")
-        raise typer.Exit(code=0)
-
-    # Group commits by component
-    commits_messages = [c.message for c in commits_info]
-    grouped = group_commits_by_component(commits_messages)
+    # Team mode - show all authors
+    if team or kind == "all":
+        from report.cli.handlers import generate_team_report
 
-    # Handle export if requested
-    if export:
-        grouped_info = prepare_grouped_commits_for_export(commits_info, grouped)
-        metadata = {
-            "title": "This Week's Commits",
-            "date_range": f"{since.strftime('%Y-%m-%d')} to {until.strftime('%Y-%m-%d')}",
-            "author": author if author else "All authors",
-        }
-        handle_export(commits_info, export, output, metadata, grouped_info)
+        generate_team_report(since, until, "weekly", summarize)
         return
 
-    # Build title
-    title_prefix = "📊 This Week's Commits" if summarize else "This week's commits"
-    title = f"{title_prefix} (by {author})" if author else title_prefix
-
-    if summarize:
-        handle_detailed_report(
-            commits_info, commits_messages, title, "weekly", summarize, group_by_component=True
-        )
-    else:
-        commits = get_commits(".", since, until, author)
-        print_simple_report(commits, title)
+    _run_report(
+        since,
+        until,
+        title="This Week's Commits",
+        plain_title="This week's commits",
+        empty_message="No commits this week.",
+        report_type="weekly",
+        summarize=summarize,
+        author=author,
+        export=export,
+        output=output,
+        group_by_component=True,
+        by_day=by_day,
+    )
 
 
 @app.command()
@@ -275,48 +305,38 @@ def lastweek(
         "-o",
         help="Output file path (prints to stdout if not specified)",
     ),
+    by_day: bool = typer.Option(
+        False,
+        "--by-day",
+        help="With --summarize, also summarize each day separately",
+    ),
 ):
     """Generate last week's report"""
     since, until = last_week_range()
 
-    # Team mode - show all authors
-    if team or (author and author.lower() == "all"):
-        generate_team_report(since, until, "weekly", summarize)
-        return
-
-    # Get detailed info for table
-    commits_info = get_commits_detailed(".", since, until, author)
+    kind, author = normalize_author(author)
 
-    if not commits_info:
-        typer.echo("No commits last week.")
-        raise typer.Exit(code=0)
-
-    # Group commits by component
-    commits_messages = [c.message for c in commits_info]
-    grouped = group_commits_by_component(commits_messages)
+    # Team mode - show all authors
+    if team or kind == "all":
+        from report.cli.handlers import generate_team_report
 
-    # Handle export if requested
-    if export:
-        grouped_info = prepare_grouped_commits_for_export(commits_info, grouped)
-        metadata = {
-            "title": "Last Week's Commits",
-            "date_range": f"{since.strftime('%Y-%m-%d')} to {until.strftime('%Y-%m-%d')}",
-            "author": author if author else "All authors",
-        }
-        handle_export(commits_info, export, output, metadata, grouped_info)
+        generate_team_report(since, until, "weekly", summarize)
         return
 
-    # Build title
-    title_prefix = "📊 Last Week's Commits" if summarize else "Last week's commits"
-    title = f"{title_prefix} (by {author})" if author else title_prefix
-
-    if summarize:
-        handle_detailed_report(
-            commits_info, commits_messages, title, "weekly", summarize, group_by_component=True
-        )
-    else:
-        commits = get_commits(".", since, until, author)
-        print_simple_report(commits, title)
+    _run_report(
+        since,
+        until,
+        title="Last Week's Commits",
+        plain_title="Last week's commits",
+        empty_message="No commits last week.",
+        report_type="weekly",
+        summarize=summarize,
+        author=author,
+        export=export,
+        output=output,
+        group_by_component=True,
+        by_day=by_day,
+    )
 
 
 @app.command()
@@ -382,16 +402,18 @@ def range(
     ),
 ):
     """Generate report for custom date range"""
+    today = date_module.today()
+
     # Determine date range
     try:
         if from_date and to_date:
             since, until = custom_range(from_date, to_date)
             period_desc = f"{from_date} to {to_date}"
         elif days:
-            since, until = last_n_days_range(days)
+            since, until = last_n_days_range(days, today)
             period_desc = f"last {days} days"
         elif month:
-            current_year = year if year else date_module.today().year
+            current_year = year if year else today.year
             since, until = month_range(current_year, month)
             period_desc = f"{current_year}-{month:02d}"
         else:
@@ -407,41 +429,25 @@ def range(
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1)
 
-    # Team mode - show all authors
-    if team or (author and author.lower() == "all"):
-        generate_custom_range_team_report(since, until, period_desc, summarize)
-        return
+    kind, author = normalize_author(author)
 
-    # Individual or filtered report
-    commits_info = get_commits_detailed(".", since, until, author)
-
-    if not commits_info:
-        typer.echo(f"No commits found for period: {period_desc}")
-        raise typer.Exit(code=0)
-
-    # Group commits by component
-    commits_messages = [c.message for c in commits_info]
-    grouped = group_commits_by_component(commits_messages)
+    # Team mode - show all authors
+    if team or kind == "all":
+        from report.cli.handlers import generate_custom_range_team_report
 
-    # Handle export if requested
-    if export:
-        grouped_info = prepare_grouped_commits_for_export(commits_info, grouped)
-        metadata = {
-            "title": f"Commits - {period_desc}",
-            "date_range": f"{since.strftime('%Y-%m-%d')} to {until.strftime('%Y-%m-%d')}",
-            "author": author if author else "All authors",
-        }
-        handle_export(commits_info, export, output, metadata, grouped_info)
+        generate_custom_range_team_report(since, until, period_desc, summarize)
         return
 
-    # Build title
-    title_prefix = f"📊 Commits - {period_desc}" if summarize else f"Commits - {period_desc}"
-    title = f"{title_prefix} (by {author})" if author else title_prefix
-
-    if summarize:
-        handle_detailed_report(
-            commits_info, commits_messages, title, "weekly", summarize, group_by_component=True
-        )
-    else:
-        commits = get_commits(".", since, until, author)
-        print_simple_report(commits, title)
+    _run_report(
+        since,
+        until,
+        title=f"Commits - {period_desc}",
+        plain_title=f"Commits - {period_desc}",
+        empty_message=f"No commits found for period: {period_desc}",
+        report_type="weekly",
+        summarize=summarize,
+        author=author,
+        export=export,
+        output=output,
+        group_by_component=True,
+    )
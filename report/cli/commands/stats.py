@@ -1,9 +1,12 @@
 """Statistics and comparison commands"""
 
-from datetime import date as date_module
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING
 
 import typer
 
+from report.cli.handlers import normalize_author
 from report.utils.dates import (
     custom_range,
     last_n_days_range,
@@ -13,10 +16,88 @@ from report.utils.dates import (
     today_range,
     yesterday_range,
 )
-from report.utils.stats import get_commit_stats
+
+if TYPE_CHECKING:
+    from report.utils.stats import AuthorStats
 
 app = typer.Typer()
 
+# Per-author table layout: (header, column width)
+_COLUMNS = (
+    ("Author", 20),
+    ("Commits", 8),
+    ("Files", 8),
+    ("Added", 10),
+    ("Deleted", 10),
+    ("Net", 10),
+)
+
+
+def _table_rule(left: str, middle: str, right: str) -> str:
+    return left + "─" + f"─{middle}─".join("─" * width for _, width in _COLUMNS) + "─" + right
+
+
+_TABLE_TOP = _table_rule("┌", "┬", "┐")
+_TABLE_SEPARATOR = _table_rule("├", "┼", "┤")
+_TABLE_BOTTOM = _table_rule("└", "┴", "┘")
+_TABLE_HEADER = "│ " + " │ ".join(name.ljust(width) for name, width in _COLUMNS) + " │"
+_ROW_FORMAT = (
+    "│ {author:<20} │ {commits:<8} │ {files:<8} │ {added:<10} │ {deleted:<10} │ {net:<10} │"
+)
+
+# compare: metric, period 1, period 2, delta
+_COMPARE_ROW = "{:<30} {:<20} {:<20} {}"
+
+
+def _author_rows(author_stats: Iterable["AuthorStats"]) -> Iterator[str]:
+    """Yield one formatted table row per author"""
+    for author_stat in author_stats:
+        net_sign = "+" if author_stat.net_lines >= 0 else ""
+        yield _ROW_FORMAT.format(
+            author=author_stat.author[:20],  # Truncate if too long
+            commits=author_stat.total_commits,
+            files=author_stat.files_changed,
+            added=f"+{author_stat.insertions}",
+            deleted=f"-{author_stat.deletions}",
+            net=f"{net_sign}{author_stat.net_lines}",
+        )
+
+
+# compare: periods further apart than this are queried separately
+_FUSE_GAP = timedelta(days=1)
+
+# compare: named period -> (range helper, description)
+_PERIOD_TABLE: dict[str, tuple[Callable[[date], tuple[datetime, datetime]], str]] = {
+    "thisweek": (this_week_range, "this week"),
+    "week": (this_week_range, "this week"),
+    "lastweek": (last_week_range, "last week"),
+    "today": (today_range, "today"),
+    "yesterday": (yesterday_range, "yesterday"),
+}
+
+
+def _compare_period(
+    index: int, period: str, from_date: str | None, to_date: str | None, today: date
+) -> tuple[datetime, datetime, str]:
+    """Resolve one compare period to (since, until, description), exiting on bad input"""
+    try:
+        if from_date and to_date:
+            since, until = custom_range(from_date, to_date)
+            return since, until, f"{from_date} to {to_date}"
+        range_fn, desc = _PERIOD_TABLE[period]
+        return (*range_fn(today), desc)
+    except KeyError:
+        typer.echo(f"Error: Unknown period '{period}'", err=True)
+        raise typer.Exit(code=1)
+    except ValueError as e:
+        typer.echo(f"Error in period {index}: {e}", err=True)
+        raise typer.Exit(code=1)
+
+
+def _signed(value: int) -> str:
+    """Format a change with an explicit "+" for increases"""
+    return f"+{value}" if value > 0 else str(value)
+
 
 @app.command()
 def stats(
@@ -62,35 +143,38 @@ def stats(
     ),
 ):
     """Show git statistics and analytics"""
+    _, author = normalize_author(author)
+    today = date.today()
+
     # Determine date range
     try:
         if from_date and to_date:
             since, until = custom_range(from_date, to_date)
             period_desc = f"{from_date} to {to_date}"
         elif days:
-            since, until = last_n_days_range(days)
+            since, until = last_n_days_range(days, today)
             period_desc = f"last {days} days"
         elif month:
             if year:
                 since, until = month_range(year, month)
                 period_desc = f"{year}-{month:02d}"
             else:
-                current_year = date_module.today().year
+                current_year = today.year
                 since, until = month_range(current_year, month)
                 period_desc = f"{current_year}-{month:02d}"
         else:
             # Use named period
             if period == "daily" or period == "today":
-                since, until = today_range()
+                since, until = today_range(today)
                 period_desc = "today"
             elif period == "yesterday":
-                since, until = yesterday_range()
+                since, until = yesterday_range(today)
                 period_desc = "yesterday"
             elif period == "weekly" or period == "week":
-                since, until = this_week_range()
+                since, until = this_week_range(today)
                 period_desc = "this week"
             elif period == "lastweek":
-                since, until = last_week_range()
+                since, until = last_week_range(today)
                 period_desc = "last week"
             else:
                 typer.echo(f"Error: Unknown period '{period}'", err=True)
@@ -101,6 +185,9 @@ def stats(
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1)
 
+    from report.cli.formatters import BufferedEcho
+    from report.utils.stats import get_commit_stats
+
     # Get statistics
     try:
         repo_stats = get_commit_stats(".", since, until, author)
@@ -108,113 +195,38 @@ def stats(
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1)
 
-    # Display stats
+    # Display stats (buffered: one write for the whole report)
+    echo = BufferedEcho()
     title = f"📊 Git Statistics - {period_desc}"
     if author:
         title += f" (by {author})"
-    typer.echo(f"\n{title}\n")
-    typer.echo("=" * 60)
+    echo(f"\n{title}\n")
+    echo("=" * 60)
 
     # Overall stats
-    typer.echo(f"\n📈 Overview:")
-    typer.echo(f"  Total Commits:       {repo_stats.total_commits}")
-    typer.echo(f"  Total Contributors:  {repo_stats.total_authors}")
-    typer.echo(f"  Files Changed:       {repo_stats.total_files_changed}")
-    typer.echo(f"  Lines Added:         +{repo_stats.total_insertions}")
-    typer.echo(f"  Lines Deleted:       -{repo_stats.total_deletions}")
+    echo(f"\n📈 Overview:")
+    echo(f"  Total Commits:       {repo_stats.total_commits}")
+    echo(f"  Total Contributors:  {repo_stats.total_authors}")
+    echo(f"  Files Changed:       {repo_stats.total_files_changed}")
+    echo(f"  Lines Added:         +{repo_stats.total_insertions}")
+    echo(f"  Lines Deleted:       -{repo_stats.total_deletions}")
     net_sign = "+" if repo_stats.net_lines >= 0 else ""
-    typer.echo(f"  Net Lines:           {net_sign}{repo_stats.net_lines}")
-
-    # Per-author stats
-    if repo_stats.author_stats:
-        typer.echo(f"\n👤 Per-Author Statistics:\n")
-
-        # Header
-        typer.echo(
-            "┌─"
-            + "─" * 20
-            + "─┬─"
-            + "─" * 8
-            + "─┬─"
-            + "─" * 8
-            + "─┬─"
-            + "─" * 10
-            + "─┬─"
-            + "─" * 10
-            + "─┬─"
-            + "─" * 10
-            + "─┐"
-        )
-        typer.echo(
-            "│ "
-            + "Author".ljust(20)
-            + " │ "
-            + "Commits".ljust(8)
-            + " │ "
-            + "Files".ljust(8)
-            + " │ "
-            + "Added".ljust(10)
-            + " │ "
-            + "Deleted".ljust(10)
-            + " │ "
-            + "Net".ljust(10)
-            + " │"
-        )
-        typer.echo(
-            "├─"
-            + "─" * 20
-            + "─┼─"
-            + "─" * 8
-            + "─┼─"
-            + "─" * 8
-            + "─┼─"
-            + "─" * 10
-            + "─┼─"
-            + "─" * 10
-            + "─┼─"
-            + "─" * 10
-            + "─┤"
-        )
+    echo(f"  Net Lines:           {net_sign}{repo_stats.net_lines}")
 
-        # Rows
-        for author_stat in repo_stats.author_stats:
-            author_name = author_stat.author[:20]  # Truncate if too long
-            net_sign = "+" if author_stat.net_lines >= 0 else ""
-
-            typer.echo(
-                "│ "
-                + author_name.ljust(20)
-                + " │ "
-                + str(author_stat.total_commits).ljust(8)
-                + " │ "
-                + str(author_stat.files_changed).ljust(8)
-                + " │ "
-                + f"+{author_stat.insertions}".ljust(10)
-                + " │ "
-                + f"-{author_stat.deletions}".ljust(10)
-                + " │ "
-                + f"{net_sign}{author_stat.net_lines}".ljust(10)
-                + " │"
-            )
+    # Per-author stats (skipped when an --author filter leaves a single author,
+    # whose row would only repeat the overview above)
+    if repo_stats.author_stats and not (author and len(repo_stats.author_stats) == 1):
+        echo(f"\n👤 Per-Author Statistics:\n")
 
-        # Footer
-        typer.echo(
-            "└─"
-            + "─" * 20
-            + "─┴─"
-            + "─" * 8
-            + "─┴─"
-            + "─" * 8
-            + "─┴─"
-            + "─" * 10
-            + "─┴─"
-            + "─" * 10
-            + "─┴─"
-            + "─" * 10
-            + "─┘"
-        )
+        echo(_TABLE_TOP)
+        echo(_TABLE_HEADER)
+        echo(_TABLE_SEPARATOR)
+
+        echo.extend(_author_rows(repo_stats.author_stats))
+        echo(_TABLE_BOTTOM)
 
-    typer.echo()
+    echo()
+    echo.flush()
 
 
 @app.command()
@@ -255,128 +267,73 @@ def compare(
     ),
 ):
     """Compare git statistics between two time periods"""
-    # Parse period 1
-    try:
-        if from1 and to1:
-            since1, until1 = custom_range(from1, to1)
-            period1_desc = f"{from1} to {to1}"
-        elif period1 == "thisweek" or period1 == "week":
-            since1, until1 = this_week_range()
-            period1_desc = "this week"
-        elif period1 == "lastweek":
-            since1, until1 = last_week_range()
-            period1_desc = "last week"
-        elif period1 == "today":
-            since1, until1 = today_range()
-            period1_desc = "today"
-        elif period1 == "yesterday":
-            since1, until1 = yesterday_range()
-            period1_desc = "yesterday"
-        else:
-            typer.echo(f"Error: Unknown period '{period1}'", err=True)
-            raise typer.Exit(code=1)
-    except ValueError as e:
-        typer.echo(f"Error in period 1: {e}", err=True)
-        raise typer.Exit(code=1)
+    _, author = normalize_author(author)
+    today = date.today()
+
+    since1, until1, period1_desc = _compare_period(1, period1, from1, to1, today)
+    since2, until2, period2_desc = _compare_period(2, period2, from2, to2, today)
+
+    from report.cli.formatters import BufferedEcho
+    from report.utils.stats import get_commit_stats, get_commit_stats_multi
 
-    # Parse period 2
+    # Overlapping or adjacent periods (e.g. this week vs last week) come from one
+    # pass over history; far-apart periods are read separately, in parallel, so
+    # the history between them isn't scanned
     try:
-        if from2 and to2:
-            since2, until2 = custom_range(from2, to2)
-            period2_desc = f"{from2} to {to2}"
-        elif period2 == "thisweek" or period2 == "week":
-            since2, until2 = this_week_range()
-            period2_desc = "this week"
-        elif period2 == "lastweek":
-            since2, until2 = last_week_range()
-            period2_desc = "last week"
-        elif period2 == "today":
-            since2, until2 = today_range()
-            period2_desc = "today"
-        elif period2 == "yesterday":
-            since2, until2 = yesterday_range()
-            period2_desc = "yesterday"
+        if max(since1, since2) - min(until1, until2) <= _FUSE_GAP:
+            stats1, stats2 = get_commit_stats_multi(
+                ".", [(since1, until1), (since2, until2)], author
+            )
         else:
-            typer.echo(f"Error: Unknown period '{period2}'", err=True)
-            raise typer.Exit(code=1)
-    except ValueError as e:
-        typer.echo(f"Error in period 2: {e}", err=True)
-        raise typer.Exit(code=1)
+            from concurrent.futures import ThreadPoolExecutor
 
-    # Get stats for both periods
-    try:
-        stats1 = get_commit_stats(".", since1, until1, author)
-        stats2 = get_commit_stats(".", since2, until2, author)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                future1 = executor.submit(get_commit_stats, ".", since1, until1, author)
+                future2 = executor.submit(get_commit_stats, ".", since2, until2, author)
+                stats1, stats2 = future1.result(), future2.result()
     except RuntimeError as e:
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(code=1)
 
-    # Display comparison
+    # Display comparison (buffered: one write for the whole report)
+    echo = BufferedEcho()
     title = f"📊 Comparison: {period1_desc} vs {period2_desc}"
     if author:
         title += f" (by {author})"
-    typer.echo(f"\n{title}\n")
-    typer.echo("=" * 70)
+    echo(f"\n{title}\n")
+    echo("=" * 70)
 
     # Side-by-side comparison
-    typer.echo(f"\n{'Metric':<30} {period1_desc:<20} {period2_desc:<20} Δ")
-    typer.echo("-" * 70)
+    echo()
+    echo(_COMPARE_ROW.format("Metric", period1_desc, period2_desc, "Δ"))
+    echo("-" * 70)
 
-    # Commits
-    commits_diff = stats2.total_commits - stats1.total_commits
-    commits_sign = "+" if commits_diff > 0 else ""
-    typer.echo(
-        f"{'Total Commits':<30} {stats1.total_commits:<20} {stats2.total_commits:<20} {commits_sign}{commits_diff}"
-    )
-
-    # Authors
-    authors_diff = stats2.total_authors - stats1.total_authors
-    authors_sign = "+" if authors_diff > 0 else ""
-    typer.echo(
-        f"{'Contributors':<30} {stats1.total_authors:<20} {stats2.total_authors:<20} {authors_sign}{authors_diff}"
-    )
-
-    # Files
-    files_diff = stats2.total_files_changed - stats1.total_files_changed
-    files_sign = "+" if files_diff > 0 else ""
-    typer.echo(
-        f"{'Files Changed':<30} {stats1.total_files_changed:<20} {stats2.total_files_changed:<20} {files_sign}{files_diff}"
-    )
-
-    # Lines added
-    insertions_diff = stats2.total_insertions - stats1.total_insertions
-    insertions_sign = "+" if insertions_diff > 0 else ""
-    typer.echo(
-        f"{'Lines Added':<30} {stats1.total_insertions:<20} {stats2.total_insertions:<20} {insertions_sign}{insertions_diff}"
-    )
-
-    # Lines deleted
-    deletions_diff = stats2.total_deletions - stats1.total_deletions
-    deletions_sign = "+" if deletions_diff > 0 else ""
-    typer.echo(
-        f"{'Lines Deleted':<30} {stats1.total_deletions:<20} {stats2.total_deletions:<20} {deletions_sign}{deletions_diff}"
-    )
-
-    # Net lines
-    net_diff = stats2.net_lines - stats1.net_lines
-    net_sign = "+" if net_diff > 0 else ""
-    typer.echo(
-        f"{'Net Lines':<30} {stats1.net_lines:<20} {stats2.net_lines:<20} {net_sign}{net_diff}"
-    )
-
-    typer.echo()
+    for metric, value1, value2 in (
+        ("Total Commits", stats1.total_commits, stats2.total_commits),
+        ("Contributors", stats1.total_authors, stats2.total_authors),
+        ("Files Changed", stats1.total_files_changed, stats2.total_files_changed),
+        ("Lines Added", stats1.total_insertions, stats2.total_insertions),
+        ("Lines Deleted", stats1.total_deletions, stats2.total_deletions),
+        ("Net Lines", stats1.net_lines, stats2.net_lines),
+    ):
+        echo(_COMPARE_ROW.format(metric, value1, value2, _signed(value2 - value1)))
+
+    echo()
 
     # Calculate percentage changes
+    commits_diff = stats2.total_commits - stats1.total_commits
+    insertions_diff = stats2.total_insertions - stats1.total_insertions
     if stats1.total_commits > 0:
         commits_pct = (commits_diff / stats1.total_commits) * 100
-        typer.echo(f"📈 Change in commits: {commits_pct:+.1f}%")
+        echo(f"📈 Change in commits: {commits_pct:+.1f}%")
     elif stats2.total_commits > 0:
-        typer.echo("📈 Change in commits: New activity in period 2!")
+        echo("📈 Change in commits: New activity in period 2!")
 
     if stats1.total_insertions > 0:
         insertions_pct = (insertions_diff / stats1.total_insertions) * 100
-        typer.echo("📈 Change in productivity (lines added): {insertions_pct:+.1f}%")
+        echo(f"📈 Change in productivity (lines added): {insertions_pct:+.1f}%")
     elif stats2.total_insertions > 0:
-        typer.echo("📈 Change in productivity: New activity in period 2!")
+        echo("📈 Change in productivity: New activity in period 2!")
 
-    typer.echo()
+    echo()
+    echo.flush()
@@ -1,92 +1,85 @@
 """Output formatting utilities for CLI"""
 
+from collections.abc import Iterable
+from functools import lru_cache
+
 import typer
 
 from report.git.commits import CommitInfo
 
 
+class BufferedEcho:
+    """Drop-in for typer.echo that collects lines and writes them in one call on flush()"""
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def __call__(self, message: str = "") -> None:
+        self._lines.append(message)
+
+    def extend(self, messages: Iterable[str]) -> None:
+        """Collect every line produced by an iterable"""
+        self._lines.extend(messages)
+
+    def flush(self) -> None:
+        if self._lines:
+            typer.echo("\n".join(self._lines))
+            self._lines.clear()
+
+
+# Rows are written in chunks: each typer.echo call is a separate write + flush,
+# so this keeps output progressive without one syscall per row
+ROW_CHUNK_SIZE = 200
+
+
+# Fixed column widths for print_commits_table (the author column fits its longest name)
+HASH_WIDTH = 7
+DATE_WIDTH = 16
+MESSAGE_WIDTH = 50
+
+
+@lru_cache(maxsize=32)
+def _table_frame(author_width: int) -> tuple[str, str, str]:
+    """Return (header block, row template, footer) for a given author column width"""
+    segments = [
+        "─" * width for width in (HASH_WIDTH, author_width, DATE_WIDTH, MESSAGE_WIDTH)
+    ]
+    row = "│ " + " │ ".join(
+        f"{{:<{width}}}" for width in (HASH_WIDTH, author_width, DATE_WIDTH, MESSAGE_WIDTH)
+    ) + " │"
+    header = "\n".join(
+        (
+            "┌─" + "─┬─".join(segments) + "─┐",
+            row.format("Hash", "Author", "Date", "Message"),
+            "├─" + "─┼─".join(segments) + "─┤",
+        )
+    )
+    footer = "└─" + "─┴─".join(segments) + "─┘\n"
+    return header, row, footer
+
+
 def print_commits_table(commits_info: list[CommitInfo], title: str | None = None) -> None:
     """Print commits in a nice table format"""
     if not commits_info:
         return
 
-    if title:
-        typer.echo(f"\n{title}")
-
-    # Calculate column widths
-    hash_width = 7
-    author_width = max((len(c.author) for c in commits_info), default=6)
-    author_width = max(author_width, 6)  # Minimum width for "Author"
-    date_width = 16
-    message_width = 50
-
-    # Header
-    typer.echo(
-        "┌─"
-        + "─" * hash_width
-        + "─┬─"
-        + "─" * author_width
-        + "─┬─"
-        + "─" * date_width
-        + "─┬─"
-        + "─" * message_width
-        + "─┐"
-    )
-    typer.echo(
-        "│ "
-        + "Hash".ljust(hash_width)
-        + " │ "
-        + "Author".ljust(author_width)
-        + " │ "
-        + "Date".ljust(date_width)
-        + " │ "
-        + "Message".ljust(message_width)
-        + " │"
-    )
-    typer.echo(
-        "├─"
-        + "─" * hash_width
-        + "─┼─"
-        + "─" * author_width
-        + "─┼─"
-        + "─" * date_width
-        + "─┼─"
-        + "─" * message_width
-        + "─┤"
-    )
-
-    # Rows
-    for c in commits_info:
-        msg = c.message[:47] + "..." if len(c.message) > message_width else c.message
-        typer.echo(
-            "│ "
-            + c.hash.ljust(hash_width)
-            + " │ "
-            + c.author.ljust(author_width)
-            + " │ "
-            + c.date.ljust(date_width)
-            + " │ "
-            + msg.ljust(message_width)
-            + " │"
-        )
+    # Author column fits the longest name, with a minimum width for "Author"
+    author_width = max(6, max(len(c.author) for c in commits_info))
+    header, row, footer = _table_frame(author_width)
 
-    # Footer
-    typer.echo(
-        "└─"
-        + "─" * hash_width
-        + "─┴─"
-        + "─" * author_width
-        + "─┴─"
-        + "─" * date_width
-        + "─┴─"
-        + "─" * message_width
-        + "─┘"
-    )
-    typer.echo()
+    # Rows are formatted and written one chunk at a time; the header rides with
+    # the first chunk and the footer with the last, so small tables are one write
+    last = len(commits_info) - 1
+    for start in range(0, len(commits_info), ROW_CHUNK_SIZE):
+        lines = [f"\n{title}\n{header}" if title else header] if start == 0 else []
+        for c in commits_info[start : start + ROW_CHUNK_SIZE]:
+            msg = c.message[:47] + "..." if len(c.message) > MESSAGE_WIDTH else c.message
+            lines.append(row.format(c.hash, c.author, c.date, msg))
+        if start + ROW_CHUNK_SIZE > last:
+            lines.append(footer)
+        typer.echo("\n".join(lines))
 
 
 def print_simple_report(commits: list[str], title: str) -> None:
     """Print simple list format report"""
-    typer.echo(f"{title}:")
-    for c in commits:
-        typer.echo(f"- {c}")
+    typer.echo("\n".join([f"{title}:", *(f"- {c}" for c in commits)]))
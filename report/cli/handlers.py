@@ -1,19 +1,44 @@
 """Report generation and handling logic"""
 
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Literal, Optional, cast
 
 import typer
 
-from report.ai.summarizer import AICommitSummarizer
 from report.cli.formatters import print_commits_table
-from report.git.commits import CommitInfo, get_all_authors, get_commits_detailed
+from report.git.commits import CommitInfo, get_commits_by_author
 from report.utils.categorizer import ComponentType, group_commits_by_component
-from report.utils.exporters import ExportFormat, export_commits
+
+if TYPE_CHECKING:
+    from report.utils.exporters import ExportFormat
 
 # Constants
 COMPONENT_ORDER: list[ComponentType] = ["Console", "Server", "Others"]
 
+AuthorKind = Literal["all", "one", "none"]
+
+
+def normalize_author(author: Optional[str]) -> tuple[AuthorKind, Optional[str]]:
+    """Resolve the --author option once at command entry
+
+    "all" means the whole team (no filter), "me" is canonicalised so every
+    spelling shares one history-cache entry, and blank values mean no filter.
+
+    Returns:
+        (kind, author) where author is None unless kind is "one"
+    """
+    if author is None:
+        return "none", None
+    author = author.strip()
+    if not author:
+        return "none", None
+    lowered = author.lower()
+    if lowered == "all":
+        return "all", None
+    if lowered == "me":
+        return "one", "me"
+    return "one", author
+
 
 def handle_export(
     commits_info: list[CommitInfo],
@@ -34,16 +59,17 @@ def handle_export(
         )
         raise typer.Exit(code=1)
 
+    from report.utils.exporters import export_commits, export_commits_to
+
     # Export
     try:
-        content = export_commits(commits_info, export_format, metadata, grouped)  # type: ignore
-
-        # Write to file or stdout
+        # Write to file or stdout; files are written as the report is generated
         if output_file:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(content)
+            with open(output_file, "w", encoding="utf-8", buffering=1 << 16) as f:
+                export_commits_to(f, commits_info, export_format, metadata, grouped)  # type: ignore
             typer.echo(f"\n✓ Report exported to {output_file}")
         else:
+            content = export_commits(commits_info, export_format, metadata, grouped)  # type: ignore
             typer.echo("\n" + "=" * 80)
             typer.echo(content)
             typer.echo("=" * 80)
@@ -56,17 +82,59 @@ def generate_ai_summary(
     commits_messages: list[str], report_type: str, grouped_dict: dict[str, list[str]] | None = None
 ) -> None:
     """Generate and print AI summary"""
+    from report.ai.summarizer import AICommitSummarizer
+
     typer.echo("🤖 AI Summary:\n")
     try:
         summarizer = AICommitSummarizer()
-        summary = summarizer.summarize(
-            commits_messages, report_type=report_type, grouped=grouped_dict
+        # Stream the summary so text shows up while it is being generated
+        summarizer.summarize(
+            commits_messages,
+            report_type=report_type,
+            grouped=grouped_dict,
+            on_token=lambda chunk: typer.echo(chunk, nl=False),
         )
-        typer.echo(summary)
+        typer.echo()
     except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
 
 
+def generate_daily_breakdown_summary(
+    commits_info: list[CommitInfo], grouped_dict: dict[str, list[str]] | None = None
+) -> None:
+    """Generate and print per-day AI summaries plus a weekly rollup"""
+    by_day: dict[str, list[str]] = {}
+    for commit in sorted(commits_info, key=lambda c: c.date):
+        by_day.setdefault(commit.date[:10], []).append(commit.message)
+
+    jobs: list[dict] = [
+        {"commits": messages, "report_type": "daily"} for messages in by_day.values()
+    ]
+    jobs.append(
+        {
+            "commits": [c.message for c in commits_info],
+            "report_type": "weekly",
+            "grouped": grouped_dict,
+        }
+    )
+
+    from report.ai.summarizer import AICommitSummarizer
+
+    typer.echo("🤖 AI Summary:\n")
+    try:
+        # All day summaries and the rollup are requested concurrently
+        summaries = AICommitSummarizer().summarize_many(jobs, max_workers=len(jobs))
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        return
+
+    for day, summary in zip(by_day, summaries):
+        typer.echo(f"📅 {day}\n")
+        typer.echo(f"{summary}\n")
+    typer.echo("🗓️  Week\n")
+    typer.echo(summaries[-1])
+
+
 def handle_detailed_report(
     commits_info: list[CommitInfo],
     commits_messages: list[str],
@@ -74,6 +142,7 @@ def handle_detailed_report(
     report_type: str,
     summarize: bool,
     group_by_component: bool = False,
+    by_day: bool = False,
 ) -> None:
     """Handle detailed report with optional summarization and grouping"""
     typer.echo(f"{title}:\n")
@@ -82,15 +151,18 @@ def handle_detailed_report(
         # Group by component
         grouped = group_commits_by_component(commits_messages)
 
-        for component in COMPONENT_ORDER:
-            component_commits = grouped.get(component, [])
-            if component_commits:
-                component_info = [c for c in commits_info if c.message in component_commits]
-                print_commits_table(component_info, title=f"  {component}")
+        for component, component_info in prepare_grouped_commits_for_export(
+            commits_info, grouped
+        ).items():
+            print_commits_table(component_info, title=f"  {component}")
 
         if summarize:
-            grouped_dict = {k: v for k, v in grouped.items()}
-            generate_ai_summary(commits_messages, report_type, grouped_dict)
+            # Widen the Literal keys for the type checker; no copy at runtime
+            grouped_dict = cast(dict[str, list[str]], grouped)
+            if by_day:
+                generate_daily_breakdown_summary(commits_info, grouped_dict)
+            else:
+                generate_ai_summary(commits_messages, report_type, grouped_dict)
     else:
         # Simple table
         print_commits_table(commits_info)
@@ -102,50 +174,50 @@ def handle_detailed_report(
 def prepare_grouped_commits_for_export(
     commits_info: list[CommitInfo], grouped: dict[ComponentType, list[str]]
 ) -> dict[str, list[CommitInfo]]:
-    """Prepare grouped commits info for export"""
-    grouped_info = {}
-    for component in COMPONENT_ORDER:
-        component_commits = grouped.get(component, [])
-        if component_commits:
-            grouped_info[component] = [c for c in commits_info if c.message in component_commits]
-    return grouped_info
+    """Prepare grouped commits info for export
+
+    Returns:
+        Non-empty components in COMPONENT_ORDER, each with its commits in input order
+    """
+    # One pass over the commits via a message -> component lookup
+    component_by_message = {
+        message: component for component, messages in grouped.items() for message in messages
+    }
+    buckets: dict[str, list[CommitInfo]] = {component: [] for component in COMPONENT_ORDER}
+    for c in commits_info:
+        component = component_by_message.get(c.message)
+        if component in buckets:
+            buckets[component].append(c)
+    return {component: info for component, info in buckets.items() if info}
 
 
 def generate_team_report(
     since: datetime, until: datetime, report_type: str, summarize: bool = False
 ) -> None:
     """Generate report for all team members"""
-    # Get all authors
-    authors = get_all_authors(".", since, until)
+    # One history walk, bucketed by exact author name
+    commits_by_author = get_commits_by_author(".", since, until)
 
-    if not authors:
+    if not commits_by_author:
         typer.echo("No team members found in this time period.")
         raise typer.Exit(code=0)
 
-    typer.echo(f"📊 Team Report - {report_type.title()}\n")
-    typer.echo(f"👥 Team Members ({len(authors)}):")
-
-    # Collect all commits and organize by author
+    lines = [
+        f"📊 Team Report - {report_type.title()}\n",
+        f"👥 Team Members ({len(commits_by_author)}):",
+    ]
     all_commits_info: list[CommitInfo] = []
-    commits_by_author: dict[str, list[CommitInfo]] = {}
-
-    for author in authors:
-        commits_info = get_commits_detailed(".", since, until, author)
-        if commits_info:
-            commits_by_author[author] = commits_info
-            all_commits_info.extend(commits_info)
-            typer.echo(f"├─ {author}: {len(commits_info)} commits")
+    for author, commits_info in commits_by_author.items():
+        all_commits_info.extend(commits_info)
+        lines.append(f"├─ {author}: {len(commits_info)} commits")
+    lines.append("")
 
-    typer.echo()
-
-    if not all_commits_info:
-        typer.echo("No commits found for any team member.")
-        raise typer.Exit(code=0)
+    # One write for the whole member list
+    typer.echo("\n".join(lines))
 
     # Show commits grouped by author
-    for author in authors:
-        if author in commits_by_author:
-            print_commits_table(commits_by_author[author], title=f"  {author}")
+    for author, commits_info in commits_by_author.items():
+        print_commits_table(commits_info, title=f"  {author}")
 
     # AI Summary if requested
     if summarize:
@@ -154,8 +226,9 @@ def generate_team_report(
         # Group by component for weekly reports
         if report_type == "weekly":
             grouped = group_commits_by_component(commits_messages)
-            grouped_dict = {k: v for k, v in grouped.items()}
-            generate_ai_summary(commits_messages, report_type, grouped_dict)
+            generate_ai_summary(
+                commits_messages, report_type, cast(dict[str, list[str]], grouped)
+            )
         else:
             generate_ai_summary(commits_messages, report_type)
 
@@ -166,40 +239,29 @@ def generate_custom_range_team_report(
     """Generate custom range team report"""
     typer.echo(f"📊 Team Report - {period_desc}\n")
 
-    # Get all authors
-    authors = get_all_authors(".", since, until)
+    # One history walk, bucketed by exact author name
+    commits_by_author = get_commits_by_author(".", since, until)
 
-    if not authors:
+    if not commits_by_author:
         typer.echo("No team members found in this time period.")
         raise typer.Exit(code=0)
 
-    typer.echo(f"👥 Team Members ({len(authors)}):")
-
-    # Collect all commits and organize by author
+    lines = [f"👥 Team Members ({len(commits_by_author)}):"]
     all_commits_info: list[CommitInfo] = []
-    commits_by_author: dict[str, list[CommitInfo]] = {}
+    for author_name, commits_info in commits_by_author.items():
+        all_commits_info.extend(commits_info)
+        lines.append(f"├─ {author_name}: {len(commits_info)} commits")
+    lines.append("")
 
-    for author_name in authors:
-        commits_info = get_commits_detailed(".", since, until, author_name)
-        if commits_info:
-            commits_by_author[author_name] = commits_info
-            all_commits_info.extend(commits_info)
-            typer.echo(f"├─ {author_name}: {len(commits_info)} commits")
-
-    typer.echo()
-
-    if not all_commits_info:
-        typer.echo("No commits found for any team member.")
-        raise typer.Exit(code=0)
+    # One write for the whole member list
+    typer.echo("\n".join(lines))
 
     # Show commits grouped by author
-    for author_name in authors:
-        if author_name in commits_by_author:
-            print_commits_table(commits_by_author[author_name], title=f"  {author_name}")
+    for author_name, commits_info in commits_by_author.items():
+        print_commits_table(commits_info, title=f"  {author_name}")
 
     # AI Summary if requested
     if summarize:
         commits_messages = [c.message for c in all_commits_info]
         grouped = group_commits_by_component(commits_messages)
-        grouped_dict = {k: v for k, v in grouped.items()}
-        generate_ai_summary(commits_messages, "weekly", grouped_dict)
+        generate_ai_summary(commits_messages, "weekly", cast(dict[str, list[str]], grouped))
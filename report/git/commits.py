@@ -1,9 +1,24 @@
+import hashlib
+import json
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from datetime import datetime
-from typing import NamedTuple
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
-from git import InvalidGitRepositoryError, Repo
-from git.exc import GitError
+if TYPE_CHECKING:
+    from git import Repo
+
+# GitPython is imported inside the functions that need it so that importing this
+# module (e.g. for CommitInfo when rendering `report --help`) stays cheap.
+
+HISTORY_CACHE_SIZE = 32
+REPO_CACHE_SIZE = 32
+
+T = TypeVar("T")
 
 
 class CommitInfo(NamedTuple):
@@ -16,17 +31,192 @@ class CommitInfo(NamedTuple):
     repo: str = "."  # Repository name or path (with default)
 
 
+_repo_local = threading.local()
+
+
+def open_repo(repo_path: str) -> "Repo":
+    """Open the repository containing repo_path, reusing this thread's earlier handle
+
+    Repo handles keep persistent ``git cat-file`` pipes that can't be shared
+    between threads, so each thread keeps its own small LRU of open repos.
+
+    Raises:
+        InvalidGitRepositoryError: If repo_path is not inside a git repository
+    """
+    from git import Repo
+
+    repos: OrderedDict[str, Repo] | None = getattr(_repo_local, "repos", None)
+    if repos is None:
+        repos = _repo_local.repos = OrderedDict()
+
+    key = os.path.abspath(repo_path)
+    repo = repos.get(key)
+    if repo is not None:
+        repos.move_to_end(key)
+        return repo
+
+    repo = repos[key] = Repo(key, search_parent_directories=True)
+    if len(repos) > REPO_CACHE_SIZE:
+        repos.popitem(last=False)[1].close()
+    return repo
+
+
+def _head_state(repo_path: str) -> tuple[str, str] | None:
+    """Return (git dir, HEAD sha) identifying the history a query would see"""
+    from git import InvalidGitRepositoryError
+
+    try:
+        repo = open_repo(repo_path)
+        return repo.git_dir, repo.head.commit.hexsha
+    except (InvalidGitRepositoryError, ValueError, OSError):
+        # Not a repository or no commits yet: let the wrapped query handle it
+        return None
+
+
+@lru_cache(maxsize=None)
+def current_user_name(git_dir: str) -> str | None:
+    """Return the repository's configured user.name, read once per process"""
+    from git import Repo
+
+    try:
+        return Repo(git_dir).config_reader().get_value("user", "name")
+    except Exception:
+        return None
+
+
+def cached_history_query(func: Callable[..., T]) -> Callable[..., T]:
+    """Memoize a (repo_path, since, until, author) query while HEAD is unchanged
+
+    The key includes the repository's HEAD commit, so new commits invalidate
+    previous results. List results are copied so callers can't alter the cache.
+    """
+    cache: OrderedDict[tuple, Any] = OrderedDict()
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(
+        repo_path: str, since: datetime, until: datetime, author: str | None = None
+    ) -> T:
+        state = _head_state(repo_path)
+        if state is None:
+            return func(repo_path, since, until, author)
+
+        key = (state, since, until, author)
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                result = cache[key]
+                return [*result] if isinstance(result, list) else result
+
+        result = func(repo_path, since, until, author)
+        with lock:
+            cache[key] = result
+            if len(cache) > HISTORY_CACHE_SIZE:
+                cache.popitem(last=False)
+        return [*result] if isinstance(result, list) else result
+
+    wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _author_filter(
+    git_dir: str, author: str | None
+) -> tuple[list[str], Callable[[str], bool] | None]:
+    """Build the author filter for a query as (git log args, name predicate)
+
+    ``--author`` lets git drop most non-matching commits before they are
+    printed, but it also matches the email, so the predicate re-checks the
+    name. "me" matches the configured git user exactly (no filter if it isn't
+    set); anything else is a case-insensitive substring match.
+    """
+    if not author:
+        return [], None
+    if author.lower() == "me":
+        git_user = current_user_name(git_dir)
+        if git_user is None:
+            return [], None
+        return ["--fixed-strings", f"--author={git_user}"], lambda name: name == git_user
+    author_lower = author.lower()
+    # git only folds ASCII case, so non-ASCII names are matched in Python alone
+    args = ["--fixed-strings", "--regexp-ignore-case", f"--author={author}"]
+    return (
+        args if author.isascii() else [],
+        lambda name: bool(name) and author_lower in name.lower(),
+    )
+
+
+def _iter_log_records(
+    repo_path: str,
+    since: datetime,
+    until: datetime,
+    author: str | None,
+    fields: tuple[str, ...] = (),
+) -> Iterator[tuple[str, ...]]:
+    """Yield (author, *fields, subject) for each non-merge commit in the range
+
+    Everything comes from one ``git log`` call; ``fields`` are extra format
+    placeholders (e.g. "%H", "%cd") so callers only pay for what they use.
+    Commits with an empty message are skipped.
+    """
+    from git import InvalidGitRepositoryError
+
+    try:
+        repo = open_repo(repo_path)
+    except InvalidGitRepositoryError:
+        raise RuntimeError("Not a git repository")
+
+    if not repo.head.is_valid():
+        return
+
+    author_args, matches = _author_filter(repo.git_dir, author)
+    # Records are "<author>\x1f<fields...>\x1f<raw body>\x1e"; %cd stays in the
+    # committer's own timezone, as with committed_datetime
+    output = repo.git.log(
+        f"--since={since.isoformat()}",
+        f"--until={until.isoformat()}",
+        "--no-merges",
+        *author_args,
+        "--date=format:%Y-%m-%d %H:%M",
+        "--format=" + "%x1f".join(("%an", *fields, "%B")) + "%x1e",
+    )
+
+    for record in output.split("\x1e"):
+        values = record.lstrip("\n").split("\x1f", len(fields) + 1)
+        if len(values) != len(fields) + 2:
+            continue
+        if matches is not None and not matches(values[0]):
+            continue
+        msg = values[-1].strip()
+        if msg:
+            values[-1] = msg.partition("\n")[0]
+            yield tuple(values)
+
+
+@cached_history_query
 def get_commits(
     repo_path: str,
     since: datetime,
     until: datetime,
     author: str | None = None,
 ) -> list[str]:
-    """Get commit messages only (for backward compatibility)"""
-    commits_info = get_commits_detailed(repo_path, since, until, author)
-    return [c.message for c in commits_info]
+    """Get commit subject lines only
+
+    Reads everything from one ``git log`` call instead of loading each commit
+    object, which is what makes the plain (non-summarize) reports fast.
+
+    Args:
+        repo_path: Path to git repository
+        since: Start datetime for commit range
+        until: End datetime for commit range
+        author: Optional author filter (supports "me" keyword for current git user)
+
+    Returns:
+        First line of each commit message, newest first
+    """
+    return [record[-1] for record in _iter_log_records(repo_path, since, until, author)]
 
 
+@cached_history_query
 def get_commits_detailed(
     repo_path: str,
     since: datetime,
@@ -44,56 +234,38 @@ def get_commits_detailed(
     Returns:
         List of CommitInfo named tuples
     """
-    try:
-        repo = Repo(repo_path, search_parent_directories=True)
-    except InvalidGitRepositoryError:
-        raise RuntimeError("Not a git repository")
-
-    # Get all commits in the time range first
-    all_commits = list(
-        repo.iter_commits(
-            since=since.isoformat(),
-            until=until.isoformat(),
-            no_merges=True,
+    return [
+        CommitInfo(
+            hash=sha[:7],  # Short hash
+            author=name or "Unknown",
+            date=date,
+            message=subject,  # First line only for table
         )
-    )
+        for name, sha, date, subject in _iter_log_records(
+            repo_path, since, until, author, ("%H", "%cd")
+        )
+    ]
 
-    # Filter by author if specified
-    if author:
-        if author.lower() == "me":
-            # Get current git user
-            try:
-                git_user = repo.config_reader().get_value("user", "name")
-                all_commits = [c for c in all_commits if c.author and c.author.name == git_user]
-            except Exception:
-                pass  # If can't get git user, don't filter
-        else:
-            # Filter by specified author (case-insensitive)
-            author_lower = author.lower()
-            all_commits = [
-                c
-                for c in all_commits
-                if c.author and c.author.name and author_lower in c.author.name.lower()
-            ]
-
-    commit_list: list[CommitInfo] = []
-    for c in all_commits:
-        raw = c.message
-        if isinstance(raw, bytes):
-            msg = raw.decode("utf-8", errors="ignore").strip()
-        else:
-            msg = raw.strip()
 
-        if msg:
-            commit_info = CommitInfo(
-                hash=c.hexsha[:7],  # Short hash
-                author=c.author.name if c.author and c.author.name else "Unknown",
-                date=c.committed_datetime.strftime("%Y-%m-%d %H:%M"),
-                message=msg.split("\n")[0],  # First line only for table
-            )
-            commit_list.append(commit_info)
+def get_commits_by_author(
+    repo_path: str,
+    since: datetime,
+    until: datetime,
+) -> dict[str, list[CommitInfo]]:
+    """Get commits grouped by author from a single history walk
 
-    return commit_list
+    Args:
+        repo_path: Path to git repository
+        since: Start datetime for commit range
+        until: End datetime for commit range
+
+    Returns:
+        Dict of author name to their commits (newest first), authors sorted alphabetically
+    """
+    by_author: dict[str, list[CommitInfo]] = {}
+    for commit in get_commits_detailed(repo_path, since, until):
+        by_author.setdefault(commit.author, []).append(commit)
+    return {author: by_author[author] for author in sorted(by_author)}
 
 
 def get_all_authors(
@@ -111,37 +283,26 @@ def get_all_authors(
     Returns:
         List of unique author names sorted alphabetically
     """
+    from git import InvalidGitRepositoryError
+
     try:
-        repo = Repo(repo_path, search_parent_directories=True)
+        repo = open_repo(repo_path)
     except InvalidGitRepositoryError:
         raise RuntimeError("Not a git repository")
 
-    # Build iterator with optional date filters
-    if since and until:
-        commits = repo.iter_commits(
-            since=since.isoformat(),
-            until=until.isoformat(),
-            no_merges=True,
-        )
-    elif since:
-        commits = repo.iter_commits(
-            since=since.isoformat(),
-            no_merges=True,
-        )
-    elif until:
-        commits = repo.iter_commits(
-            until=until.isoformat(),
-            no_merges=True,
-        )
-    else:
-        commits = repo.iter_commits(no_merges=True)
+    if not repo.head.is_valid():
+        return []
 
-    authors = set()
-    for c in commits:
-        if c.author and c.author.name:
-            authors.add(c.author.name)
+    # One name per line from a single `git log` call, with optional date filters
+    args = ["--no-merges", "--format=%an"]
+    if since:
+        args.append(f"--since={since.isoformat()}")
+    if until:
+        args.append(f"--until={until.isoformat()}")
+    authors = set(repo.git.log(*args).splitlines())
+    authors.discard("")
 
-    return sorted(list(authors))
+    return sorted(authors)
 
 
 def get_commits_from_multiple_repos(
@@ -149,40 +310,53 @@ def get_commits_from_multiple_repos(
     since: datetime,
     until: datetime,
     author: str | None = None,
+    max_workers: int | None = None,
 ) -> list[CommitInfo]:
     """Get commits from multiple repositories
 
+    Repositories are scanned concurrently since each scan mostly waits on git.
+
     Args:
         repo_paths: List of repository paths
         since: Start datetime for commit range
         until: End datetime for commit range
         author: Optional author filter
+        max_workers: Maximum concurrent scans (default: min(32, CPU count * 4))
 
     Returns:
         Combined list of CommitInfo from all repositories, sorted by date
     """
-    all_commits: list[CommitInfo] = []
+    from concurrent.futures import ThreadPoolExecutor
+
+    from git import InvalidGitRepositoryError
+    from git.exc import GitError
 
-    for repo_path in repo_paths:
+    def scan(repo_path: str) -> list[CommitInfo] | Exception:
         try:
             commits = get_commits_detailed(repo_path, since, until, author)
-            # Add repository name to each commit
-            repo_name = os.path.basename(os.path.abspath(repo_path))
-            commits_with_repo = [
-                CommitInfo(
-                    hash=c.hash,
-                    author=c.author,
-                    date=c.date,
-                    message=c.message,
-                    repo=repo_name,
-                )
-                for c in commits
-            ]
-            all_commits.extend(commits_with_repo)
         except (RuntimeError, InvalidGitRepositoryError, GitError, OSError) as e:
+            return e
+        # Add repository name to each commit
+        repo_name = os.path.basename(os.path.abspath(repo_path))
+        return [c._replace(repo=repo_name) for c in commits]
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    workers = max(1, min(max_workers, len(repo_paths)))
+
+    if workers == 1:
+        results = [scan(repo_path) for repo_path in repo_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(scan, repo_paths))
+
+    all_commits: list[CommitInfo] = []
+    for repo_path, result in zip(repo_paths, results):
+        if isinstance(result, Exception):
             # Skip invalid repos
-            print(f"Warning: Skipping {repo_path}: {e}")
+            print(f"Warning: Skipping {repo_path}: {result}")
             continue
+        all_commits.extend(result)
 
     # Sort by date (most recent first)
     all_commits.sort(key=lambda c: c.date, reverse=True)
@@ -190,38 +364,103 @@ def get_commits_from_multiple_repos(
     return all_commits
 
 
-def discover_repos_in_directory(base_path: str, max_depth: int = 2) -> list[str]:
+def discovery_cache_enabled() -> bool:
+    """Whether discovery results are cached (disable with REPORT_DISCOVERY_CACHE=false)"""
+    return os.getenv("REPORT_DISCOVERY_CACHE", "true").lower() not in ("false", "0", "no")
+
+
+def _discovery_cache_path(base_path: str, max_depth: int) -> Path:
+    """Cache file for one (workspace, depth) scan under $XDG_CACHE_HOME/report"""
+    key = hashlib.sha256(f"{os.path.abspath(base_path)}\0{max_depth}".encode()).hexdigest()
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "report" / f"repos-{key[:16]}.json"
+
+
+def _load_discovery(cache_path: Path) -> list[str] | None:
+    """Return cached repos if no directory visited by the scan has changed since"""
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+        for path, mtime in data["mtimes"].items():
+            if os.stat(path).st_mtime_ns != mtime:
+                return None
+        return data["repos"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _save_discovery(cache_path: Path, mtimes: dict[str, int], repos: list[str]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"mtimes": mtimes, "repos": repos}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Caching is best effort
+
+
+def discover_repos_in_directory(
+    base_path: str, max_depth: int = 2, use_cache: bool | None = None
+) -> list[str]:
     """Discover git repositories in a directory
 
+    Results are cached on disk together with the mtime of every directory the
+    scan looked at, so a repeat scan only re-walks when something was added,
+    removed or renamed.
+
     Args:
         base_path: Base directory to search
         max_depth: Maximum depth to search (default: 2)
+        use_cache: Read/write the discovery cache (default: discovery_cache_enabled())
 
     Returns:
         List of repository paths
     """
-    repos = []
+    if use_cache is None:
+        use_cache = discovery_cache_enabled()
+    cache_path = _discovery_cache_path(base_path, max_depth)
+    if use_cache:
+        cached = _load_discovery(cache_path)
+        if cached is not None:
+            return cached
 
-    def _search(path: str, depth: int):
-        if depth > max_depth:
-            return
+    from git import InvalidGitRepositoryError, Repo
 
+    repos = []
+    mtimes: dict[str, int] = {}
+    # Iterative depth-first walk; children are pushed in reverse so repositories
+    # come out in the same order as a recursive scan
+    stack = [(base_path, 0)]
+    while stack:
+        path, depth = stack.pop()
         try:
-            # Check if current path is a git repo
-            Repo(path)
-            repos.append(path)
-            return  # Don't search subdirectories of a repo
-        except InvalidGitRepositoryError:
-            pass
-
-        # Search subdirectories
-        try:
-            for entry in os.listdir(path):
-                subpath = os.path.join(path, entry)
-                if os.path.isdir(subpath) and not entry.startswith("."):
-                    _search(subpath, depth + 1)
-        except (PermissionError, OSError):
-            pass
-
-    _search(base_path, 0)
+            # Taken before listing, so a change during the scan invalidates the cache
+            mtimes[path] = os.stat(path).st_mtime_ns
+            with os.scandir(path) as entries:
+                names: set[str] = set()
+                subdirs: list[str] = []
+                for entry in entries:
+                    names.add(entry.name)
+                    if not entry.name.startswith(".") and entry.is_dir():
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+
+        # Only probe directories that look like a work tree (.git dir or file)
+        # or a bare repository (HEAD), instead of asking GitPython about each one
+        if ".git" in names or "HEAD" in names:
+            try:
+                Repo(path)
+                repos.append(path)
+                continue  # Don't search subdirectories of a repo
+            except InvalidGitRepositoryError:
+                pass
+
+        if depth < max_depth:
+            stack.extend((subdir, depth + 1) for subdir in reversed(subdirs))
+
+    # A missing or unreadable base has nothing to validate against, so don't cache it
+    if use_cache and base_path in mtimes:
+        _save_discovery(cache_path, mtimes, repos)
     return repos
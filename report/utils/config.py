@@ -1,6 +1,8 @@
 """Configuration management for report-bot"""
 
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -25,6 +27,7 @@ DEFAULT_CONFIG = {
 }
 
 
+@lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """Get path to config file
 
@@ -53,36 +56,47 @@ def get_config_path() -> Path:
     return xdg_config
 
 
+@lru_cache(maxsize=1)
 def load_config() -> dict[str, Any]:
     """Load configuration from file
 
+    The file is read once per process; treat the returned dict as read-only.
+
     Returns:
         Configuration dictionary (or default config if file doesn't exist)
     """
     config_path = get_config_path()
 
-    if not config_path.exists():
-        return DEFAULT_CONFIG.copy()
-
+    # Open directly rather than checking exists() first: one syscall fewer
     try:
         with open(config_path, "r") as f:
             user_config = json.load(f)
 
         # Merge with defaults
-        config = DEFAULT_CONFIG.copy()
+        config = copy.deepcopy(DEFAULT_CONFIG)
         _deep_update(config, user_config)
 
         return config
+    except FileNotFoundError:
+        return copy.deepcopy(DEFAULT_CONFIG)
     except Exception as e:
         print(f"Warning: Failed to load config from {config_path}: {e}")
-        return DEFAULT_CONFIG.copy()
+        return copy.deepcopy(DEFAULT_CONFIG)
+
+
+def _invalidate_config_cache() -> None:
+    """Forget the cached config path and contents (after the file changes)"""
+    get_config_path.cache_clear()
+    load_config.cache_clear()
 
 
 def _deep_update(base: dict, updates: dict) -> None:
     """Deep update base dictionary with updates"""
     for key, value in updates.items():
-        if isinstance(value, dict) and key in base and isinstance(base[key], dict):
-            _deep_update(base[key], value)
+        # A missing key gives None, which isn't a dict, so one lookup covers both checks
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _deep_update(current, value)
         else:
             base[key] = value
 
@@ -101,6 +115,7 @@ def save_config(config: dict[str, Any]) -> None:
     try:
         with open(config_path, "w") as f:
             json.dump(config, f, indent=2)
+        _invalidate_config_cache()
 
         print(f"✓ Config saved to {config_path}")
     except Exception as e:
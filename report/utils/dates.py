@@ -7,6 +7,7 @@ from shared.dates import (
     last_n_days_range,
     last_week_range,
     month_range,
+    parse_ymd,
     this_week_range,
     today_range,
     yesterday_range,
@@ -27,15 +28,15 @@ def custom_range(from_date: str, to_date: str) -> tuple[datetime, datetime]:
     return _shared_custom_range(from_date, to_date)
 
 
-def yesterday_range() -> tuple[datetime, datetime]:
-    yesterday = date.today() - timedelta(days=1)
+def yesterday_range(today: date | None = None) -> tuple[datetime, datetime]:
+    yesterday = (today or date.today()) - timedelta(days=1)
     start = datetime.combine(yesterday, time.min)
     end = datetime.combine(yesterday, time.max)
     return start, end
 
 
-def this_week_range() -> tuple[datetime, datetime]:
-    today = date.today()
+def this_week_range(today: date | None = None) -> tuple[datetime, datetime]:
+    today = today or date.today()
     start_of_week = today - timedelta(days=today.weekday())  # Monday
     end_of_week = start_of_week + timedelta(days=6)
 
@@ -44,8 +45,8 @@ def this_week_range() -> tuple[datetime, datetime]:
     return start, end
 
 
-def last_week_range() -> tuple[datetime, datetime]:
-    today = date.today()
+def last_week_range(today: date | None = None) -> tuple[datetime, datetime]:
+    today = today or date.today()
     # Get the start of last week (Monday of last week)
     start_of_this_week = today - timedelta(days=today.weekday())
     start_of_last_week = start_of_this_week - timedelta(days=7)
@@ -70,24 +71,25 @@ def custom_range(from_date: str, to_date: str) -> tuple[datetime, datetime]:
         ValueError: If date format is invalid
     """
     try:
-        start_date = datetime.strptime(from_date, "%Y-%m-%d")
-        end_date = datetime.strptime(to_date, "%Y-%m-%d")
+        start_date = parse_ymd(from_date)
+        end_date = parse_ymd(to_date)
     except ValueError as e:
         raise ValueError(f"Invalid date format. Use YYYY-MM-DD format. Error: {e}")
 
     if start_date > end_date:
         raise ValueError("Start date must be before or equal to end date")
 
-    start = datetime.combine(start_date.date(), time.min)
-    end = datetime.combine(end_date.date(), time.max)
+    start = datetime.combine(start_date, time.min)
+    end = datetime.combine(end_date, time.max)
     return start, end
 
 
-def last_n_days_range(days: int) -> tuple[datetime, datetime]:
+def last_n_days_range(days: int, today: date | None = None) -> tuple[datetime, datetime]:
     """Get date range for last N days
 
     Args:
         days: Number of days to look back (including today)
+        today: Reference date (defaults to date.today())
 
     Returns:
         Tuple of (start_datetime, end_datetime)
@@ -95,7 +97,7 @@ def last_n_days_range(days: int) -> tuple[datetime, datetime]:
     if days < 1:
         raise ValueError("Days must be at least 1")
 
-    today = date.today()
+    today = today or date.today()
     start_date = today - timedelta(days=days - 1)
 
     start = datetime.combine(start_date, time.min)
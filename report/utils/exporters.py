@@ -1,25 +1,58 @@
 """Export report data to various formats"""
 
 import json
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Literal
+from functools import lru_cache
+from html import escape
+from typing import Literal, TextIO
 
 from report.git.commits import CommitInfo
 
 ExportFormat = Literal["json", "markdown", "html", "email"]
 
+# Static pieces of the HTML exports, joined once at import. Row templates take
+# (hash, author, date, message) positionally and expand to several output lines.
+_HTML_STYLE = "\n".join(
+    (
+        "    <style>",
+        "        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif; max-width: 1200px; margin: 40px auto; padding: 0 20px; }",  # noqa: E501
+        "        h1 { color: #333; border-bottom: 3px solid #007bff; padding-bottom: 10px; }",
+        "        h2 { color: #555; margin-top: 30px; border-bottom: 2px solid #ddd; padding-bottom: 8px; }",  # noqa: E501
+        "        .metadata { background: #f8f9fa; padding: 15px; border-radius: 5px; margin: 20px 0; }",  # noqa: E501
+        "        .metadata p { margin: 5px 0; }",
+        "        table { width: 100%; border-collapse: collapse; margin: 20px 0; }",
+        "        th { background: #007bff; color: white; padding: 12px; text-align: left; }",
+        "        td { padding: 10px; border-bottom: 1px solid #ddd; }",
+        "        tr:hover { background: #f8f9fa; }",
+        "        .hash { font-family: 'Courier New', monospace; background: #e9ecef; padding: 2px 6px; border-radius: 3px; }",  # noqa: E501
+        "        .footer { margin-top: 40px; padding-top: 20px; border-top: 1px solid #ddd; color: #6c757d; text-align: center; }",  # noqa: E501
+        "    </style>",
+    )
+)
+_HTML_ROW = "\n".join(
+    (
+        "        <tr>",
+        "            <td><span class='hash'>{0}</span></td>",
+        "            <td>{1}</td>",
+        "            <td>{2}</td>",
+        "            <td>{3}</td>",
+        "        </tr>",
+    )
+)
+_EMAIL_ITEM = "\n".join(
+    (
+        "        <li style='margin: 10px 0; padding: 10px; background: #f9f9f9; border-left: 3px solid #007bff;'>",  # noqa: E501
+        "            <strong>{3}</strong><br>",
+        "            <small style='color: #666;'>{1} • {2} • <code>{0}</code></small>",
+        "        </li>",
+    )
+)
 
-def export_to_json(commits_info: list[CommitInfo], metadata: dict | None = None) -> str:
-    """Export commits to JSON format
-
-    Args:
-        commits_info: List of commit information
-        metadata: Optional metadata (title, date range, etc.)
 
-    Returns:
-        JSON string
-    """
-    data = {
+def _json_payload(commits_info: list[CommitInfo], metadata: dict | None = None) -> dict:
+    """Build the JSON export document"""
+    return {
         "metadata": metadata or {},
         "commits": [
             {
@@ -34,42 +67,60 @@ def export_to_json(commits_info: list[CommitInfo], metadata: dict | None = None)
         "exported_at": datetime.now().isoformat(),
     }
 
-    return json.dumps(data, indent=2, ensure_ascii=False)
 
+@lru_cache(maxsize=1)
+def _orjson():
+    """Import orjson once, on first use; it is an optional speedup"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dumps_json(data: dict) -> str:
+    """Serialize with 2-space indent, using orjson when available"""
+    orjson = _orjson()
+    if orjson is None:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
 
-def export_to_markdown(
-    commits_info: list[CommitInfo],
-    metadata: dict | None = None,
-    grouped: dict[str, list[CommitInfo]] | None = None,
-) -> str:
-    """Export commits to Markdown format
+
+def export_to_json(commits_info: list[CommitInfo], metadata: dict | None = None) -> str:
+    """Export commits to JSON format
 
     Args:
         commits_info: List of commit information
         metadata: Optional metadata (title, date range, etc.)
-        grouped: Optional grouped commits by component/author
 
     Returns:
-        Markdown string
+        JSON string
     """
-    lines = []
+    return _dumps_json(_json_payload(commits_info, metadata))
 
+
+def _markdown_lines(
+    commits_info: list[CommitInfo],
+    metadata: dict | None = None,
+    grouped: dict[str, list[CommitInfo]] | None = None,
+) -> Iterator[str]:
+    """Yield the lines of a Markdown report"""
     # Title
     title = metadata.get("title", "Git Commit Report") if metadata else "Git Commit Report"
-    lines.append(f"# {title}\n")
+    yield f"# {title}\n"
 
     # Metadata
     if metadata:
         if "date_range" in metadata:
-            lines.append(f"**Period:** {metadata['date_range']}\n")
+            yield f"**Period:** {metadata['date_range']}\n"
         if "author" in metadata:
-            lines.append(f"**Author:** {metadata['author']}\n")
+            yield f"**Author:** {metadata['author']}\n"
         if "team_members" in metadata:
-            lines.append(f"**Team Members:** {metadata['team_members']}\n")
+            yield f"**Team Members:** {metadata['team_members']}\n"
 
-    lines.append(f"**Total Commits:** {len(commits_info)}\n")
-    lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n")
-    lines.append("---\n")
+    yield f"**Total Commits:** {len(commits_info)}\n"
+    yield f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"
+    yield "---\n"
 
     # Commits table
     if grouped:
@@ -78,32 +129,30 @@ def export_to_markdown(
             if not group_commits:
                 continue
 
-            lines.append(f"## {group_name} ({len(group_commits)} commits)\n")
-            lines.append("| Hash | Author | Date | Message |")
-            lines.append("|------|--------|------|---------|")
+            yield f"## {group_name} ({len(group_commits)} commits)\n"
+            yield "| Hash | Author | Date | Message |"
+            yield "|------|--------|------|---------|"
 
             for c in group_commits:
-                lines.append(f"| `{c.hash}` | {c.author} | {c.date} | {c.message} |")
+                yield f"| `{c.hash}` | {c.author} | {c.date} | {c.message} |"
 
-            lines.append("")
+            yield ""
     else:
         # Ungrouped table
-        lines.append("## Commits\n")
-        lines.append("| Hash | Author | Date | Message |")
-        lines.append("|------|--------|------|---------|")
+        yield "## Commits\n"
+        yield "| Hash | Author | Date | Message |"
+        yield "|------|--------|------|---------|"
 
         for c in commits_info:
-            lines.append(f"| `{c.hash}` | {c.author} | {c.date} | {c.message} |")
+            yield f"| `{c.hash}` | {c.author} | {c.date} | {c.message} |"
 
-    return "\n".join(lines)
 
-
-def export_to_html(
+def export_to_markdown(
     commits_info: list[CommitInfo],
     metadata: dict | None = None,
     grouped: dict[str, list[CommitInfo]] | None = None,
 ) -> str:
-    """Export commits to HTML format
+    """Export commits to Markdown format
 
     Args:
         commits_info: List of commit information
@@ -111,48 +160,48 @@ def export_to_html(
         grouped: Optional grouped commits by component/author
 
     Returns:
-        HTML string
+        Markdown string
     """
-    title = metadata.get("title", "Git Commit Report") if metadata else "Git Commit Report"
+    return "\n".join(_markdown_lines(commits_info, metadata, grouped))
 
-    html = [
-        "<!DOCTYPE html>",
-        "<html>",
-        "<head>",
-        "    <meta charset='UTF-8'>",
-        f"    <title>{title}</title>",
-        "    <style>",
-        "        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif; max-width: 1200px; margin: 40px auto; padding: 0 20px; }",  # noqa: E501
-        "        h1 { color: #333; border-bottom: 3px solid #007bff; padding-bottom: 10px; }",
-        "        h2 { color: #555; margin-top: 30px; border-bottom: 2px solid #ddd; padding-bottom: 8px; }",  # noqa: E501
-        "        .metadata { background: #f8f9fa; padding: 15px; border-radius: 5px; margin: 20px 0; }",  # noqa: E501
-        "        .metadata p { margin: 5px 0; }",
-        "        table { width: 100%; border-collapse: collapse; margin: 20px 0; }",
-        "        th { background: #007bff; color: white; padding: 12px; text-align: left; }",
-        "        td { padding: 10px; border-bottom: 1px solid #ddd; }",
-        "        tr:hover { background: #f8f9fa; }",
-        "        .hash { font-family: 'Courier New', monospace; background: #e9ecef; padding: 2px 6px; border-radius: 3px; }",  # noqa: E501
-        "        .footer { margin-top: 40px; padding-top: 20px; border-top: 1px solid #ddd; color: #6c757d; text-align: center; }",  # noqa: E501
-        "    </style>",
-        "</head>",
-        "<body>",
-        f"    <h1>{title}</h1>",
-    ]
+
+def _html_lines(
+    commits_info: list[CommitInfo],
+    metadata: dict | None = None,
+    grouped: dict[str, list[CommitInfo]] | None = None,
+) -> Iterator[str]:
+    """Yield the lines of an HTML report"""
+    # Commit fields and metadata are user text, so they are HTML-escaped
+    title = metadata.get("title", "Git Commit Report") if metadata else "Git Commit Report"
+    title = escape(str(title))
+    # Shared by the metadata block and the footer so both show the same time
+    generated = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    yield "<!DOCTYPE html>"
+    yield "<html>"
+    yield "<head>"
+    yield "    <meta charset='UTF-8'>"
+    yield f"    <title>{title}</title>"
+    yield _HTML_STYLE
+    yield "</head>"
+    yield "<body>"
+    yield f"    <h1>{title}</h1>"
 
     # Metadata section
     if metadata:
-        html.append("    <div class='metadata'>")
+        yield "    <div class='metadata'>"
         if "date_range" in metadata:
-            html.append(f"        <p><strong>Period:</strong> {metadata['date_range']}</p>")
+            yield f"        <p><strong>Period:</strong> {escape(str(metadata['date_range']))}</p>"
         if "author" in metadata:
-            html.append(f"        <p><strong>Author:</strong> {metadata['author']}</p>")
+            yield f"        <p><strong>Author:</strong> {escape(str(metadata['author']))}</p>"
         if "team_members" in metadata:
-            html.append(f"        <p><strong>Team Members:</strong> {metadata['team_members']}</p>")
-        html.append(f"        <p><strong>Total Commits:</strong> {len(commits_info)}</p>")
-        html.append(
-            f"        <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>"  # noqa: E501
-        )
-        html.append("    </div>")
+            yield (
+                "        <p><strong>Team Members:</strong> "
+                f"{escape(str(metadata['team_members']))}</p>"
+            )
+        yield f"        <p><strong>Total Commits:</strong> {len(commits_info)}</p>"
+        yield f"        <p><strong>Generated:</strong> {generated}</p>"
+        yield "    </div>"
 
     # Commits table
     if grouped:
@@ -160,55 +209,39 @@ def export_to_html(
             if not group_commits:
                 continue
 
-            html.append(f"    <h2>{group_name} ({len(group_commits)} commits)</h2>")
-            html.append("    <table>")
-            html.append(
-                "        <tr><th>Hash</th><th>Author</th><th>Date</th><th>Message</th></tr>"
-            )
+            yield f"    <h2>{escape(group_name)} ({len(group_commits)} commits)</h2>"
+            yield "    <table>"
+            yield "        <tr><th>Hash</th><th>Author</th><th>Date</th><th>Message</th></tr>"
 
             for c in group_commits:
-                html.append("        <tr>")
-                html.append(f"            <td><span class='hash'>{c.hash}</span></td>")
-                html.append(f"            <td>{c.author}</td>")
-                html.append(f"            <td>{c.date}</td>")
-                html.append(f"            <td>{c.message}</td>")
-                html.append("        </tr>")
-
-            html.append("    </table>")
+                yield _HTML_ROW.format(*map(escape, c))
+
+            yield "    </table>"
     else:
-        html.append("    <h2>Commits</h2>")
-        html.append("    <table>")
-        html.append("        <tr><th>Hash</th><th>Author</th><th>Date</th><th>Message</th></tr>")
+        yield "    <h2>Commits</h2>"
+        yield "    <table>"
+        yield "        <tr><th>Hash</th><th>Author</th><th>Date</th><th>Message</th></tr>"
 
         for c in commits_info:
-            html.append("        <tr>")
-            html.append(f"            <td><span class='hash'>{c.hash}</span></td>")
-            html.append(f"            <td>{c.author}</td>")
-            html.append(f"            <td>{c.date}</td>")
-            html.append(f"            <td>{c.message}</td>")
-            html.append("        </tr>")
-
-        html.append("    </table>")
-
-    html.extend(
-        [
-            "    <div class='footer'>",
-            f"        <p>Generated by report-bot on {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>",
-            "    </div>",
-            "</body>",
-            "</html>",
-        ]
-    )
+            yield _HTML_ROW.format(*map(escape, c))
 
-    return "\n".join(html)
+        yield "    </table>"
 
+    yield from (
+        "    <div class='footer'>",
+        f"        <p>Generated by report-bot on {generated}</p>",
+        "    </div>",
+        "</body>",
+        "</html>",
+    )
 
-def export_to_email(
+
+def export_to_html(
     commits_info: list[CommitInfo],
     metadata: dict | None = None,
     grouped: dict[str, list[CommitInfo]] | None = None,
 ) -> str:
-    """Export commits to email-friendly HTML format
+    """Export commits to HTML format
 
     Args:
         commits_info: List of commit information
@@ -216,39 +249,49 @@ def export_to_email(
         grouped: Optional grouped commits by component/author
 
     Returns:
-        Email-ready HTML string
+        HTML string
     """
+    return "\n".join(_html_lines(commits_info, metadata, grouped))
+
+
+def _email_lines(
+    commits_info: list[CommitInfo],
+    metadata: dict | None = None,
+    grouped: dict[str, list[CommitInfo]] | None = None,
+) -> Iterator[str]:
+    """Yield the lines of an email-friendly HTML report"""
     title = metadata.get("title", "Git Commit Report") if metadata else "Git Commit Report"
+    title = escape(str(title))
 
-    html = [
+    yield from (
         "<!DOCTYPE html>",
         "<html>",
         "<head><meta charset='UTF-8'></head>",
         "<body style='font-family: Arial, sans-serif; color: #333; line-height: 1.6;'>",
         f"    <h2 style='color: #007bff; border-bottom: 2px solid #007bff; padding-bottom: 10px;'>{title}</h2>",
-    ]
+    )
 
     # Metadata
     if metadata:
-        html.append(
+        yield (
             "    <div style='background: #f0f0f0; padding: 15px; border-radius: 5px; margin: 15px 0;'>"
         )
         if "date_range" in metadata:
-            html.append(
-                f"        <p style='margin: 5px 0;'><strong>Period:</strong> {metadata['date_range']}</p>"
+            yield (
+                f"        <p style='margin: 5px 0;'><strong>Period:</strong> {escape(str(metadata['date_range']))}</p>"
             )
         if "author" in metadata:
-            html.append(
-                f"        <p style='margin: 5px 0;'><strong>Author:</strong> {metadata['author']}</p>"
+            yield (
+                f"        <p style='margin: 5px 0;'><strong>Author:</strong> {escape(str(metadata['author']))}</p>"
             )
         if "team_members" in metadata:
-            html.append(
-                f"        <p style='margin: 5px 0;'><strong>Team Members:</strong> {metadata['team_members']}</p>"
+            yield (
+                f"        <p style='margin: 5px 0;'><strong>Team Members:</strong> {escape(str(metadata['team_members']))}</p>"
             )
-        html.append(
+        yield (
             f"        <p style='margin: 5px 0;'><strong>Total Commits:</strong> {len(commits_info)}</p>"
         )
-        html.append("    </div>")
+        yield "    </div>"
 
     # Commits
     if grouped:
@@ -256,47 +299,47 @@ def export_to_email(
             if not group_commits:
                 continue
 
-            html.append(
-                f"    <h3 style='color: #555; margin-top: 25px;'>{group_name} ({len(group_commits)} commits)</h3>"
+            yield (
+                f"    <h3 style='color: #555; margin-top: 25px;'>{escape(group_name)} ({len(group_commits)} commits)</h3>"
             )
-            html.append("    <ul style='list-style-type: none; padding-left: 0;'>")
+            yield "    <ul style='list-style-type: none; padding-left: 0;'>"
 
             for c in group_commits:
-                html.append(
-                    "        <li style='margin: 10px 0; padding: 10px; background: #f9f9f9; border-left: 3px solid #007bff;'>"
-                )
-                html.append(f"            <strong>{c.message}</strong><br>")
-                html.append(
-                    f"            <small style='color: #666;'>{c.author} • {c.date} • <code>{c.hash}</code></small>"
-                )
-                html.append("        </li>")
-
-            html.append("    </ul>")
+                yield _EMAIL_ITEM.format(*map(escape, c))
+
+            yield "    </ul>"
     else:
-        html.append("    <ul style='list-style-type: none; padding-left: 0;'>")
+        yield "    <ul style='list-style-type: none; padding-left: 0;'>"
 
         for c in commits_info:
-            html.append(
-                "        <li style='margin: 10px 0; padding: 10px; background: #f9f9f9; border-left: 3px solid #007bff;'>"
-            )
-            html.append(f"            <strong>{c.message}</strong><br>")
-            html.append(
-                f"            <small style='color: #666;'>{c.author} • {c.date} • <code>{c.hash}</code></small>"
-            )
-            html.append("        </li>")
+            yield _EMAIL_ITEM.format(*map(escape, c))
 
-        html.append("    </ul>")
+        yield "    </ul>"
 
-    html.extend(
-        [
-            "    <hr style='margin-top: 30px; border: none; border-top: 1px solid #ddd;'>",
-            f"    <p style='color: #999; text-align: center;'><small>Generated by report-bot on {datetime.now().strftime('%Y-%m-%d %H:%M')}</small></p>",
-            "</body>",
-            "</html>",
-        ]
+    yield from (
+        "    <hr style='margin-top: 30px; border: none; border-top: 1px solid #ddd;'>",
+        f"    <p style='color: #999; text-align: center;'><small>Generated by report-bot on {datetime.now().strftime('%Y-%m-%d %H:%M')}</small></p>",
+        "</body>",
+        "</html>",
     )
 
-    return "\n".join(html)
+
+def export_to_email(
+    commits_info: list[CommitInfo],
+    metadata: dict | None = None,
+    grouped: dict[str, list[CommitInfo]] | None = None,
+) -> str:
+    """Export commits to email-friendly HTML format
+
+    Args:
+        commits_info: List of commit information
+        metadata: Optional metadata (title, date range, etc.)
+        grouped: Optional grouped commits by component/author
+
+    Returns:
+        Email-ready HTML string
+    """
+    return "\n".join(_email_lines(commits_info, metadata, grouped))
 
 
 def export_commits(
@@ -326,3 +369,40 @@ def export_commits(
         return export_to_email(commits_info, metadata, grouped)
     else:
         raise ValueError(f"Unsupported export format: {format}")
+
+
+def export_commits_to(
+    fp: TextIO,
+    commits_info: list[CommitInfo],
+    format: ExportFormat,
+    metadata: dict | None = None,
+    grouped: dict[str, list[CommitInfo]] | None = None,
+) -> None:
+    """Write commits in the specified format to a file object
+
+    Produces the same text as export_commits. Markdown and HTML are written
+    line by line instead of building the whole document in memory first.
+
+    Args:
+        fp: Writable text file object
+        commits_info: List of commit information
+        format: Export format (json, markdown, html, email)
+        metadata: Optional metadata
+        grouped: Optional grouped commits
+    """
+    if format == "json":
+        fp.write(_dumps_json(_json_payload(commits_info, metadata)))
+        return
+    elif format == "markdown":
+        lines = _markdown_lines(commits_info, metadata, grouped)
+    elif format == "html":
+        lines = _html_lines(commits_info, metadata, grouped)
+    elif format == "email":
+        lines = _email_lines(commits_info, metadata, grouped)
+    else:
+        raise ValueError(f"Unsupported export format: {format}")
+
+    for i, line in enumerate(lines):
+        if i:
+            fp.write("\n")
+        fp.write(line)
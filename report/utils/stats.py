@@ -1,9 +1,10 @@
 """Git statistics and analytics"""
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import NamedTuple
 
-from git import InvalidGitRepositoryError, Repo
+from report.git.commits import cached_history_query, current_user_name, open_repo
 
 
 class AuthorStats(NamedTuple):
@@ -29,6 +30,7 @@ class RepoStats(NamedTuple):
     author_stats: list[AuthorStats]
 
 
+@cached_history_query
 def get_commit_stats(
     repo_path: str,
     since: datetime,
@@ -46,107 +48,142 @@ def get_commit_stats(
     Returns:
         RepoStats with detailed statistics
     """
+    return get_commit_stats_multi(repo_path, [(since, until)], author)[0]
+
+
+def get_commit_stats_multi(
+    repo_path: str,
+    ranges: list[tuple[datetime, datetime]],
+    author: str | None = None,
+) -> list[RepoStats]:
+    """Get statistics for several time ranges from a single ``git log`` call
+
+    History spanning all ranges is read once with ``--numstat`` and each
+    commit is counted in every range its committer timestamp falls into.
+
+    Args:
+        repo_path: Path to git repository
+        ranges: (since, until) pairs to compute statistics for
+        author: Optional author filter
+
+    Returns:
+        One RepoStats per range, in the same order
+    """
+    from git import InvalidGitRepositoryError
+
     try:
-        repo = Repo(repo_path, search_parent_directories=True)
+        repo = open_repo(repo_path)
     except InvalidGitRepositoryError:
         raise RuntimeError("Not a git repository")
 
-    commits = list(
-        repo.iter_commits(
-            since=since.isoformat(),
-            until=until.isoformat(),
-            no_merges=True,
-            author=author if author and author.lower() != "me" else None,
-        )
-    )
-
-    # Filter by "me" if needed
+    buckets = [_StatsBucket() for _ in ranges]
+    if not ranges or not repo.head.is_valid():
+        return [bucket.to_repo_stats() for bucket in buckets]
+
+    args = [
+        f"--since={min(since for since, _ in ranges).isoformat()}",
+        f"--until={max(until for _, until in ranges).isoformat()}",
+        "--no-merges",
+        "-M",
+        "--numstat",
+        "-z",
+        "--format=%x1e%ct%x1f%P%x1f%an",
+    ]
+    exact_name: str | None = None
     if author and author.lower() == "me":
-        try:
-            git_user = repo.config_reader().get_value("user", "name")
-            commits = [c for c in commits if c.author and c.author.name == git_user]
-        except Exception:
-            pass
-
-    # Collect stats by author
-    author_data: dict[str, dict] = {}
-    all_files = set()
-
-    for commit in commits:
-        author_name = commit.author.name if commit.author and commit.author.name else "Unknown"
-
-        if author_name not in author_data:
-            author_data[author_name] = {
-                "commits": 0,
-                "files": set(),
-                "insertions": 0,
-                "deletions": 0,
-            }
-
-        author_data[author_name]["commits"] += 1
-
-        # Get diff stats for this commit
-        try:
-            if commit.parents:
-                diffs = commit.parents[0].diff(commit, create_patch=True)
-                for diff in diffs:
-                    # Track files changed
-                    if diff.a_path:
-                        author_data[author_name]["files"].add(diff.a_path)
-                        all_files.add(diff.a_path)
-                    if diff.b_path and diff.b_path != diff.a_path:
-                        author_data[author_name]["files"].add(diff.b_path)
-                        all_files.add(diff.b_path)
-
-                    # Count lines changed
-                    if diff.diff:
-                        # Handle both bytes and str
-                        if isinstance(diff.diff, bytes):
-                            diff_text = diff.diff.decode("utf-8", errors="ignore")
-                        else:
-                            diff_text = diff.diff
-
-                        for line in diff_text.split("\n"):
-                            if line.startswith("+") and not line.startswith("+++"):
-                                author_data[author_name]["insertions"] += 1
-                            elif line.startswith("-") and not line.startswith("---"):
-                                author_data[author_name]["deletions"] += 1
-        except Exception:
-            # Skip if can't get diff stats
-            pass
-
-    # Build author stats list
-    author_stats_list = []
-    total_insertions = 0
-    total_deletions = 0
-
-    for author_name, data in sorted(
-        author_data.items(), key=lambda x: x[1]["commits"], reverse=True
-    ):
-        insertions = data["insertions"]
-        deletions = data["deletions"]
-        net = insertions - deletions
-
-        total_insertions += insertions
-        total_deletions += deletions
-
-        author_stats_list.append(
-            AuthorStats(
+        exact_name = current_user_name(repo.git_dir)
+    elif author:
+        args.append(f"--author={author}")
+    output = repo.git.log(*args)
+
+    windows = [(since.timestamp(), until.timestamp()) for since, until in ranges]
+    # Records are "\x1e<ct>\x1f<parents>\x1f<author>\0\n" followed by NUL-separated numstat
+    # entries; renames are "<added>\t<deleted>\t\0<old path>\0<new path>"
+    for record in output.split("\x1e")[1:]:
+        header, _, numstat = record.partition("\0")
+        timestamp, parents, name = header.split("\x1f", 2)
+        if exact_name is not None and name != exact_name:
+            continue
+        committed = int(timestamp)
+        targets = [
+            bucket for bucket, (start, end) in zip(buckets, windows) if start <= committed <= end
+        ]
+        if not targets:
+            continue
+
+        name = name or "Unknown"
+        files: list[str] = []
+        insertions = deletions = 0
+        # Root commits have no parent to diff against and only count as a commit
+        fields = numstat.lstrip("\n").split("\0") if parents else []
+        i = 0
+        while i < len(fields):
+            entry = fields[i]
+            i += 1
+            if not entry:
+                continue
+            added, deleted, path = entry.split("\t", 2)
+            if path:
+                files.append(path)
+            else:
+                files.extend(fields[i : i + 2])
+                i += 2
+            # Binary files report "-" for both counts
+            insertions += int(added) if added != "-" else 0
+            deletions += int(deleted) if deleted != "-" else 0
+
+        for bucket in targets:
+            bucket.add(name, files, insertions, deletions)
+
+    return [bucket.to_repo_stats() for bucket in buckets]
+
+
+class _StatsBucket:
+    """Accumulates per-author totals for one time range"""
+
+    def __init__(self) -> None:
+        self.commits = 0
+        self.all_files: set[str] = set()
+        self.author_data: dict[str, dict] = {}
+
+    def add(self, author: str, files: list[str], insertions: int, deletions: int) -> None:
+        data = self.author_data.setdefault(
+            author, {"commits": 0, "files": set(), "insertions": 0, "deletions": 0}
+        )
+        data["commits"] += 1
+        data["files"].update(files)
+        data["insertions"] += insertions
+        data["deletions"] += deletions
+        self.all_files.update(files)
+        self.commits += 1
+
+    def iter_author_stats(self) -> Iterator[AuthorStats]:
+        """Yield per-author stats, most commits first"""
+        for author_name, data in sorted(
+            self.author_data.items(), key=lambda x: x[1]["commits"], reverse=True
+        ):
+            insertions = data["insertions"]
+            deletions = data["deletions"]
+            yield AuthorStats(
                 author=author_name,
                 total_commits=data["commits"],
                 files_changed=len(data["files"]),
                 insertions=insertions,
                 deletions=deletions,
-                net_lines=net,
+                net_lines=insertions - deletions,
             )
-        )
 
-    return RepoStats(
-        total_commits=len(commits),
-        total_authors=len(author_data),
-        total_files_changed=len(all_files),
-        total_insertions=total_insertions,
-        total_deletions=total_deletions,
-        net_lines=total_insertions - total_deletions,
-        author_stats=author_stats_list,
-    )
+    def to_repo_stats(self) -> RepoStats:
+        author_stats_list = [*self.iter_author_stats()]
+        total_insertions = sum(stat.insertions for stat in author_stats_list)
+        total_deletions = sum(stat.deletions for stat in author_stats_list)
+
+        return RepoStats(
+            total_commits=self.commits,
+            total_authors=len(self.author_data),
+            total_files_changed=len(self.all_files),
+            total_insertions=total_insertions,
+            total_deletions=total_deletions,
+            net_lines=total_insertions - total_deletions,
+            author_stats=author_stats_list,
+        )
@@ -1,11 +1,24 @@
 """Extract and group commits by ticket/issue numbers"""
 
 import re
+from collections.abc import Sequence
 from typing import NamedTuple
 
 from report.git.commits import CommitInfo
 
 
+# Default patterns for common issue trackers, compiled once at import
+_DEFAULT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"([A-Z]{2,10}-\d+)",  # JIRA, Linear: PROJECT-123
+        r"#(\d+)",  # GitHub: #123
+        r"GH-(\d+)",  # GitHub: GH-123
+        r"(?:ticket|issue)[:\s]+#?(\d+)",  # Generic: ticket #123, issue: 123
+    )
+)
+
+
 class TicketCommits(NamedTuple):
     """Commits grouped by ticket"""
 
@@ -13,12 +26,34 @@ class TicketCommits(NamedTuple):
     commits: list[CommitInfo]
 
 
-def extract_ticket_from_message(message: str, patterns: list[str] | None = None) -> str | None:
+def _compile_patterns(
+    patterns: Sequence[str | re.Pattern[str]] | None,
+) -> tuple[re.Pattern[str], ...]:
+    """Compile ticket patterns case-insensitively (None means the defaults)
+
+    Args:
+        patterns: Regex strings and/or already compiled patterns
+
+    Returns:
+        Tuple of compiled patterns
+    """
+    if patterns is None:
+        return _DEFAULT_PATTERNS
+    return tuple(
+        re.compile(pattern, re.IGNORECASE) if isinstance(pattern, str) else pattern
+        for pattern in patterns
+    )
+
+
+def extract_ticket_from_message(
+    message: str, patterns: Sequence[str | re.Pattern[str]] | None = None
+) -> str | None:
     """Extract ticket/issue number from commit message
 
     Args:
         message: Commit message
-        patterns: Optional list of regex patterns to match. Defaults to common patterns.
+        patterns: Optional regex patterns (strings or compiled) to match.
+            Defaults to common patterns.
 
     Returns:
         Ticket ID if found, None otherwise
@@ -29,17 +64,8 @@ def extract_ticket_from_message(message: str, patterns: list[str] | None = None)
         - Linear: LIN-123
         - Generic: TICKET-123
     """
-    if patterns is None:
-        # Default patterns for common issue trackers
-        patterns = [
-            r"([A-Z]{2,10}-\d+)",  # JIRA, Linear: PROJECT-123
-            r"#(\d+)",  # GitHub: #123
-            r"GH-(\d+)",  # GitHub: GH-123
-            r"(?:ticket|issue)[:\s]+#?(\d+)",  # Generic: ticket #123, issue: 123
-        ]
-
-    for pattern in patterns:
-        match = re.search(pattern, message, re.IGNORECASE)
+    for pattern in _compile_patterns(patterns):
+        match = pattern.search(message)
         if match:
             # Return the full match or first group
             return match.group(1) if match.groups() else match.group(0)
@@ -49,7 +75,7 @@ def extract_ticket_from_message(message: str, patterns: list[str] | None = None)
 
 def group_commits_by_ticket(
     commits_info: list[CommitInfo],
-    patterns: list[str] | None = None,
+    patterns: Sequence[str | re.Pattern[str]] | None = None,
 ) -> tuple[list[TicketCommits], list[CommitInfo]]:
     """Group commits by ticket/issue number
 
@@ -64,18 +90,15 @@ def group_commits_by_ticket(
     """
     ticket_groups: dict[str, list[CommitInfo]] = {}
     unmatched: list[CommitInfo] = []
+    # Compile custom patterns once rather than once per commit
+    compiled = _compile_patterns(patterns)
 
     for commit in commits_info:
-        ticket_id = extract_ticket_from_message(commit.message, patterns)
+        ticket_id = extract_ticket_from_message(commit.message, compiled)
 
         if ticket_id:
             # Normalize ticket ID (uppercase)
-            ticket_id = ticket_id.upper()
-
-            if ticket_id not in ticket_groups:
-                ticket_groups[ticket_id] = []
-
-            ticket_groups[ticket_id].append(commit)
+            ticket_groups.setdefault(ticket_id.upper(), []).append(commit)
         else:
             unmatched.append(commit)
 
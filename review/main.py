@@ -31,14 +31,14 @@ def get_diff_as_string(repo: Repo, commit) -> str:
 
 def get_diff_stats(diff: str) -> dict[str, int]:
     """Extract statistics from diff"""
-    stats = {"files": 0, "additions": 0, "deletions": 0}
-    for line in diff.split("\n"):
-        if line.startswith("diff --git"):
-            stats["files"] += 1
-        elif line.startswith("+") and not line.startswith("+++"):
-            stats["additions"] += 1
-        elif line.startswith("-") and not line.startswith("---"):
-            stats["deletions"] += 1
+    # Count line prefixes as substrings after a newline instead of splitting the
+    # diff into lines; the leading newline lets the first line match too
+    text = "\n" + diff
+    stats = {
+        "files": text.count("\ndiff --git"),
+        "additions": text.count("\n+") - text.count("\n+++"),
+        "deletions": text.count("\n-") - text.count("\n---"),
+    }
     stats["net_changes"] = stats["additions"] - stats["deletions"]
     return stats
 
@@ -144,7 +144,8 @@ def diff(
         typer.echo("-" * 40)
         try:
             from shared.ai import AICommitSummarizer
-            summarizer = AICommitSummarizer()
+            # Reviews should reflect a fresh model run, so skip the response cache
+            summarizer = AICommitSummarizer(use_cache=False)
             summary = summarizer.summarize([staged_diff], "review")
             typer.echo(summary)
         except ValueError as e:
@@ -186,7 +187,8 @@ def commit(
         typer.echo("\n🤖 AI Review:")
         try:
             from shared.ai import AICommitSummarizer
-            summarizer = AICommitSummarizer()
+            # Reviews should reflect a fresh model run, so skip the response cache
+            summarizer = AICommitSummarizer(use_cache=False)
             summary = summarizer.summarize([commit.message], "review")
             typer.echo(summary)
         except ValueError as e:
@@ -212,7 +214,7 @@ def stats(
             until = datetime.strptime(to_date, "%Y-%m-%d")
             commits = list(repo.iter_commits(since=since.isoformat(), until=until.isoformat()))
         else:
-            commits = list(repo.iter_commits(no_merges=True))[:50]
+            commits = list(repo.iter_commits(no_merges=True, max_count=50))
     except Exception as e:
         typer.echo(f"❌ Error: {e}", err=True)
         raise typer.Exit(code=1)
@@ -3,17 +3,67 @@
 This module exposes:
 - AICommitSummarizer: existing helper used by report/commit/review
 - chat_completion: generic helper for other tools (grammar, translate, ...)
+- invalidate_cache: drop cached summaries
 """
 
+import json
 import os
-from typing import Optional
+import re
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Optional
 
 import requests
-import urllib3
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
-load_dotenv()
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from shared.ai.cache import (
+    ResponseCache,
+    cache_enabled,
+    embed_text,
+    make_key,
+    semantic_cache_enabled,
+)
+
+DEFAULT_MODEL = "llama-3.3-70b-versatile"
+# Bump whenever the summary prompt changes so stale cached summaries are ignored
+PROMPT_VERSION = "v2"
+
+# Rough input budget for one summary prompt; larger commit lists are summarized in parts
+PROMPT_TOKEN_BUDGET = 6000
+
+# Jobs queued with enqueue() are flushed together once this many are waiting
+MAX_BATCH_SIZE = 16
+# Average characters per token for English commit text, used instead of a tokenizer
+CHARS_PER_TOKEN = 4
+
+_MERGE_RE = re.compile(r"^Merge (?:branch|pull request|remote-tracking|tag)\b", re.IGNORECASE)
+
+# Prompt templates, built once at import; rendered with str.format so braces in commit
+# messages are never interpreted
+_PROMPT_FOOTER = "Provide a clear, professional summary in markdown format."
+
+FLAT_PROMPT = (
+    "Please summarize the following {report_type} git commits.\n\n"
+    "Organize by categories (Features, Bug Fixes, Improvements, etc.).\n\n"
+    "Commits:\n{commits_text}\n\n" + _PROMPT_FOOTER
+)
+
+GROUPED_PROMPT = (
+    "Please summarize the following {report_type} git commits.\n\n"
+    "Commits by Component:\n{commits_text}\n\n" + _PROMPT_FOOTER
+)
+
+COMBINE_PROMPT = (
+    "Please combine the following partial summaries of {report_type} git commits "
+    "into a single report.\n\n{sections_text}\n\n" + _PROMPT_FOOTER
+)
+
+SUMMARY_SYSTEM_PROMPT = (
+    "You are a helpful assistant that summarizes git commit messages "
+    "into concise, professional reports."
+)
 
 
 def chat_completion(
@@ -22,7 +72,7 @@ def chat_completion(
     *,
     api_key: Optional[str] = None,
     verify_ssl: Optional[bool] = None,
-    model: str = "llama-3.3-70b-versatile",
+    model: str = DEFAULT_MODEL,
     temperature: float = 0.7,
     max_tokens: int = 1500,
 ) -> str:
@@ -32,101 +82,416 @@ def chat_completion(
     tasks like translation or grammar checking.
     """
 
-    key = api_key or os.getenv("GROQ_API_KEY")
-    if not key:
-        raise ValueError(
-            "GROQ_API_KEY not found. Please set it in .env file or environment variable."
+    try:
+        return _request_completion(
+            system_prompt,
+            user_prompt,
+            api_key=api_key,
+            verify_ssl=verify_ssl,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
         )
+    except requests.exceptions.RequestException as e:
+        return _format_request_error(e)
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """Shared HTTP session so repeated calls reuse pooled keep-alive connections"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+    return session
+
+
+def _post_chat(
+    system_prompt: str,
+    user_prompt: str,
+    *,
+    api_key: Optional[str],
+    verify_ssl: Optional[bool],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    stream: bool = False,
+) -> requests.Response:
+    key = _resolve_api_key(api_key)
 
     base_url = "https://api.groq.com/openai/v1/chat/completions"
+    payload: dict[str, Any] = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    if stream:
+        payload["stream"] = True
 
-    try:
-        response = requests.post(
-            base_url,
-            headers={
-                "Authorization": f"Bearer {key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            },
-            timeout=30,
-            verify=_resolve_verify_ssl(verify_ssl),
-        )
-        response.raise_for_status()
-        result = response.json()
-        return result["choices"][0]["message"]["content"].strip()
+    response = _get_session().post(
+        base_url,
+        headers={
+            "Authorization": f"Bearer {key}",
+            "Content-Type": "application/json",
+        },
+        json=payload,
+        timeout=30,
+        verify=_resolve_verify_ssl(verify_ssl),
+        stream=stream,
+    )
+    response.raise_for_status()
+    return response
+
+
+def _request_completion(system_prompt: str, user_prompt: str, **options: Any) -> str:
+    """Perform the Groq request, raising on HTTP/network errors"""
+    result = _post_chat(system_prompt, user_prompt, **options).json()
+    return result["choices"][0]["message"]["content"].strip()
+
+
+def _stream_completion(system_prompt: str, user_prompt: str, **options: Any) -> Iterator[str]:
+    """Yield content deltas from a streamed (server-sent events) Groq response"""
+    response = _post_chat(system_prompt, user_prompt, stream=True, **options)
+    with response:
+        for line in response.iter_lines():
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            event = json.loads(data)
+            choices = event.get("choices")
+            if not choices:
+                # Error frames carry no choices; surface them like an HTTP error
+                error = event.get("error")
+                if error:
+                    message = error.get("message", error) if isinstance(error, dict) else error
+                    raise requests.exceptions.HTTPError(str(message), response=response)
+                continue
+            delta = choices[0].get("delta", {}).get("content")
+            if delta:
+                yield delta
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _compress_commits(commits: list[str], keep_merges: bool = False) -> list[str]:
+    """Drop duplicate subjects and merge-commit noise, keeping first-seen order"""
+    unique = [*dict.fromkeys(commits)]
+    if keep_merges:
+        return unique
+    meaningful = [c for c in unique if not _MERGE_RE.match(c)]
+    return meaningful or unique
+
+
+def _split_by_budget(commits: list[str], budget_tokens: int) -> list[list[str]]:
+    """Split commits into consecutive batches whose prompt lines fit the budget"""
+    batches: list[list[str]] = []
+    batch: list[str] = []
+    used = 0
+    for commit in commits:
+        cost = _estimate_tokens(f"- {commit}\n")
+        if batch and used + cost > budget_tokens:
+            batches.append(batch)
+            batch, used = [], 0
+        batch.append(commit)
+        used += cost
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def _format_request_error(error: requests.exceptions.RequestException) -> str:
+    if isinstance(error, requests.exceptions.SSLError):
+        return f"SSL Certificate Error: {str(error)}\n\nTo fix: Add 'GROQ_VERIFY_SSL=false' to .env"
+    return f"Error calling Groq API: {str(error)}"
+
+
+def invalidate_cache(version: Optional[str] = None) -> int:
+    """Drop cached summaries for a prompt version (all versions if None)"""
+    return ResponseCache().invalidate(version)
+
+
+@lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Load .env once, only when an AI feature is actually used"""
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
-    except requests.exceptions.SSLError as e:
-        return f"SSL Certificate Error: {str(e)}\n\nTo fix: Add 'GROQ_VERIFY_SSL=false' to .env"
-    except requests.exceptions.RequestException as e:
-        return f"Error calling Groq API: {str(e)}"
+
+@lru_cache(maxsize=None)
+def _silence_insecure_warnings() -> None:
+    import urllib3
+
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+def _resolve_api_key(override: Optional[str]) -> str:
+    _load_env()
+    key = override or os.getenv("GROQ_API_KEY")
+    if not key:
+        raise ValueError(
+            "GROQ_API_KEY not found. Please set it in .env file or environment variable."
+        )
+    return key
 
 
 def _resolve_verify_ssl(override: Optional[bool]) -> bool:
     if override is not None:
-        return override
-    verify_env = os.getenv("GROQ_VERIFY_SSL", "true").lower()
-    return verify_env not in ("false", "0", "no")
+        verify = override
+    else:
+        _load_env()
+        verify = os.getenv("GROQ_VERIFY_SSL", "true").lower() not in ("false", "0", "no")
+    if not verify:
+        _silence_insecure_warnings()
+    return verify
+
+
+@lru_cache(maxsize=64)
+def _render_prompt(
+    commits: tuple[str, ...],
+    report_type: str,
+    grouped: Optional[tuple[tuple[str, tuple[str, ...]], ...]],
+) -> str:
+    """Render the summary prompt (memoized; arguments are hashable snapshots)"""
+    if grouped:
+        parts: list[str] = []
+        for component, component_commits in grouped:
+            if component_commits:
+                parts.append(f"\n## {component}\n")
+                parts.extend(f"- {commit}\n" for commit in component_commits)
+        return GROUPED_PROMPT.format(report_type=report_type, commits_text="".join(parts))
+    commits_text = "\n".join(f"- {commit}" for commit in commits)
+    return FLAT_PROMPT.format(report_type=report_type, commits_text=commits_text)
 
 
 class AICommitSummarizer:
-    def __init__(self, api_key: Optional[str] = None, verify_ssl: Optional[bool] = None):
-        self.api_key = api_key
-        self.verify_ssl = verify_ssl
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        verify_ssl: Optional[bool] = None,
+        use_cache: Optional[bool] = None,
+        model: str = DEFAULT_MODEL,
+        keep_merges: bool = False,
+    ):
+        self.api_key = _resolve_api_key(api_key)
+        self.verify_ssl = _resolve_verify_ssl(verify_ssl)
+        self.model = model
+        # Merge commits ("Merge branch ...") are dropped from prompts unless asked to keep them
+        self.keep_merges = keep_merges
+        if use_cache is None:
+            use_cache = cache_enabled()
+        self.cache = ResponseCache() if use_cache else None
+        self.semantic_cache = self.cache is not None and semantic_cache_enabled()
+
+        # Coalescing window for enqueue(); 0 (the default) dispatches every job immediately
+        self.batch_wait = float(os.getenv("GROQ_BATCH_WAIT_MS", "0") or 0) / 1000
+        self._batch_lock = threading.Lock()
+        self._pending: list[tuple[dict[str, Any], Future]] = []
+        self._flush_timer: Optional[threading.Timer] = None
 
     def summarize(
         self,
         commits: list[str],
         report_type: str = "daily",
         grouped: Optional[dict[str, list[str]]] = None,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> str:
+        """Summarize commits, returning the full summary text.
+
+        When ``on_token`` is given the response is streamed and every piece of
+        text (including cached summaries and error messages) is passed to it as
+        soon as it is available.
+        """
         if not commits:
             return "No commits to summarize."
 
+        emit = on_token or (lambda text: None)
+
+        key = None
+        if self.cache is not None:
+            key = make_key(
+                sorted(commits),
+                report_type,
+                grouped or {},
+                self.model,
+                self.keep_merges,
+                PROMPT_VERSION,
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                emit(cached)
+                return cached
+
+        commits = _compress_commits(commits, self.keep_merges)
+        if grouped:
+            grouped = {
+                name: _compress_commits(items, self.keep_merges) for name, items in grouped.items()
+            }
         prompt = self._build_prompt(commits, report_type, grouped)
 
-        system_prompt = (
-            "You are a helpful assistant that summarizes git commit messages "
-            "into concise, professional reports."
-        )
+        vector = scope = None
+        if self.semantic_cache:
+            vector = embed_text(prompt)
+            scope = make_key(
+                report_type, bool(grouped), self.model, self.keep_merges, PROMPT_VERSION
+            )
+            similar = self.cache.nearest(scope, vector)
+            if similar is not None:
+                emit(similar)
+                return similar
 
-        return chat_completion(
-            system_prompt,
-            prompt,
+        options = dict(
             api_key=self.api_key,
             verify_ssl=self.verify_ssl,
+            model=self.model,
+            temperature=0.7,
+            max_tokens=1500,
         )
+        try:
+            if _estimate_tokens(prompt) > PROMPT_TOKEN_BUDGET:
+                parts = self._budget_parts(commits, grouped)
+                # A single oversized item (e.g. a whole diff) can't be split, and
+                # "combining" one partial summary would only add a second call
+                if len(parts) > 1:
+                    prompt = self._condense(parts, report_type, options)
+            if on_token is None:
+                summary = _request_completion(SUMMARY_SYSTEM_PROMPT, prompt, **options)
+            else:
+                summary = self._stream_summary(prompt, on_token, options)
+        except requests.exceptions.RequestException as e:
+            error = _format_request_error(e)
+            emit(error)
+            return error
 
-    def _build_prompt(
-        self, commits: list[str], report_type: str, grouped: Optional[dict[str, list[str]]]
-    ) -> str:
+        # Only successful responses are cached; errors are retried next run
+        if key is not None:
+            self.cache.set(key, summary, PROMPT_VERSION)
+            if vector is not None:
+                self.cache.add_embedding(key, scope, PROMPT_VERSION, vector, summary)
+        return summary
+
+    @staticmethod
+    def _budget_parts(
+        commits: list[str], grouped: Optional[dict[str, list[str]]]
+    ) -> list[tuple[str, list[str]]]:
+        """Split commits (or each group) into labelled batches that fit the prompt budget"""
         if grouped:
-            commits_text = ""
-            for component, component_commits in grouped.items():
-                if component_commits:
-                    commits_text += f"\n## {component}\n"
-                    commits_text += "\n".join(f"- {commit}" for commit in component_commits)
-                    commits_text += "\n"
+            sections = [(name, items) for name, items in grouped.items() if items]
+        else:
+            sections = [("Commits", commits)]
+
+        parts: list[tuple[str, list[str]]] = []
+        for name, items in sections:
+            batches = _split_by_budget(items, PROMPT_TOKEN_BUDGET)
+            for index, batch in enumerate(batches, 1):
+                label = name if len(batches) == 1 else f"{name} (part {index})"
+                parts.append((label, batch))
+        return parts
+
+    def _condense(
+        self,
+        parts: list[tuple[str, list[str]]],
+        report_type: str,
+        options: dict[str, Any],
+    ) -> str:
+        """Summarize each part separately and return a prompt merging the results"""
+
+        def summarize_part(part: tuple[str, list[str]]) -> str:
+            label, batch = part
+            prompt = self._build_prompt(batch, report_type, {label: batch})
+            return _request_completion(SUMMARY_SYSTEM_PROMPT, prompt, **options)
+
+        with ThreadPoolExecutor(max_workers=min(4, len(parts))) as pool:
+            partials = list(pool.map(summarize_part, parts))
+
+        sections_text = "\n\n".join(
+            f"## {label}\n{partial}" for (label, _), partial in zip(parts, partials)
+        )
+        return COMBINE_PROMPT.format(report_type=report_type, sections_text=sections_text)
 
-            return f"""Please summarize the following {report_type} git commits.
+    @staticmethod
+    def _stream_summary(
+        prompt: str, on_token: Callable[[str], None], options: dict[str, Any]
+    ) -> str:
+        chunks: list[str] = []
+        for chunk in _stream_completion(SUMMARY_SYSTEM_PROMPT, prompt, **options):
+            if not chunks:
+                # Match the non-streamed result, which is stripped
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+            chunks.append(chunk)
+            on_token(chunk)
+        return "".join(chunks).strip()
+
+    def summarize_many(self, jobs: list[dict[str, Any]], max_workers: int = 4) -> list[str]:
+        """Summarize several commit sets concurrently.
+
+        Each job holds the keyword arguments for ``summarize``. The API calls
+        are network-bound, so running them on threads makes the total wait
+        roughly the slowest call instead of the sum. Results keep job order.
+        """
+        if len(jobs) <= 1:
+            return [self.summarize(**job) for job in jobs]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+            return list(pool.map(lambda job: self.summarize(**job), jobs))
+
+    def enqueue(self, **job: Any) -> "Future[str]":
+        """Queue a ``summarize`` job and return a future for its summary.
 
-Commits by Component:
-{commits_text}
+        Jobs arriving within ``GROQ_BATCH_WAIT_MS`` of the first queued one (or
+        until MAX_BATCH_SIZE are waiting) are sent together via summarize_many.
+        """
+        future: Future[str] = Future()
+        with self._batch_lock:
+            self._pending.append((job, future))
+            batch = None
+            if self.batch_wait <= 0 or len(self._pending) >= MAX_BATCH_SIZE:
+                batch = self._take_pending()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.batch_wait, self._flush)
+                self._flush_timer.start()
 
-Provide a clear, professional summary in markdown format."""
-        commits_text = "\n".join(f"- {commit}" for commit in commits)
-        return f"""Please summarize the following {report_type} git commits.
+        if batch:
+            threading.Thread(target=self._run_batch, args=(batch,)).start()
+        return future
 
-Organize by categories (Features, Bug Fixes, Improvements, etc.).
+    def _take_pending(self) -> list[tuple[dict[str, Any], Future]]:
+        # Caller holds _batch_lock
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        batch, self._pending = self._pending, []
+        return batch
 
-Commits:
-{commits_text}
+    def _flush(self) -> None:
+        with self._batch_lock:
+            batch = self._take_pending()
+        if batch:
+            self._run_batch(batch)
 
-Provide a clear, professional summary in markdown format."""
+    def _run_batch(self, batch: list[tuple[dict[str, Any], Future]]) -> None:
+        try:
+            summaries = self.summarize_many([job for job, _ in batch], max_workers=len(batch))
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), summary in zip(batch, summaries):
+            future.set_result(summary)
+
+    def _build_prompt(
+        self, commits: list[str], report_type: str, grouped: Optional[dict[str, list[str]]]
+    ) -> str:
+        frozen_groups = (
+            tuple((name, tuple(items)) for name, items in grouped.items()) if grouped else None
+        )
+        # Only the grouped text is used when groups are given, so leave commits out of the key
+        return _render_prompt(() if frozen_groups else tuple(commits), report_type, frozen_groups)
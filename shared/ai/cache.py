@@ -0,0 +1,170 @@
+"""On-disk cache for LLM responses.
+
+Entries are keyed by a hash of the request inputs and stored in a small
+SQLite database so repeated summaries skip the network round-trip. An
+optional near-match tier also stores prompt embeddings so a prompt that
+differs only slightly from a cached one can reuse its response.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_TTL = 7 * 86400
+EMBEDDING_DIMS = 1024
+SIMILARITY_THRESHOLD = 0.95
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def cache_dir() -> Path:
+    """Directory holding the response cache (override with GROQ_CACHE_DIR)"""
+    override = os.getenv("GROQ_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".cache" / "report"
+
+
+def cache_enabled() -> bool:
+    """Whether the response cache is enabled (disable with GROQ_CACHE=false)"""
+    return os.getenv("GROQ_CACHE", "true").lower() not in ("false", "0", "no")
+
+
+def semantic_cache_enabled() -> bool:
+    """Whether the near-match tier is enabled (opt in with GROQ_SEMANTIC_CACHE=1)"""
+    return os.getenv("GROQ_SEMANTIC_CACHE", "").lower() in ("1", "true", "yes")
+
+
+def embed_text(text: str, dims: int = EMBEDDING_DIMS) -> "np.ndarray":
+    """Embed text as an L2-normalised hashed bag of unigrams and bigrams.
+
+    Cheap and deterministic across runs; good enough to spot commit lists
+    that differ by a commit or two.
+    """
+    import numpy as np
+
+    tokens = _TOKEN_RE.findall(text.lower())
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    buckets = [zlib.crc32(feature.encode("utf-8")) % dims for feature in features]
+    vector = np.bincount(buckets, minlength=dims).astype(np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def make_key(*parts: Any) -> str:
+    """Build a stable cache key from JSON-serialisable request inputs"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed key/value store with per-entry expiry"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or cache_dir() / "llm.db"
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, version TEXT NOT NULL, "
+            "value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, scope TEXT NOT NULL, version TEXT NOT NULL, "
+            "vector BLOB NOT NULL, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_scope ON embeddings(scope)")
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value, or None if missing or expired"""
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, version: str, expire: float = DEFAULT_TTL) -> None:
+        """Store a value that expires after ``expire`` seconds, dropping expired entries"""
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+                conn.execute("DELETE FROM embeddings WHERE expires_at <= ?", (now,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (key, version, value, now + expire),
+                )
+        except (sqlite3.Error, OSError):
+            pass
+
+    def nearest(
+        self, scope: str, vector: "np.ndarray", threshold: float = SIMILARITY_THRESHOLD
+    ) -> Optional[str]:
+        """Return the value whose embedding is most similar to ``vector`` above threshold"""
+        import numpy as np
+
+        try:
+            with closing(self._connect()) as conn, conn:
+                rows = conn.execute(
+                    "SELECT vector, value FROM embeddings WHERE scope = ? AND expires_at > ?",
+                    (scope, time.time()),
+                ).fetchall()
+        except (sqlite3.Error, OSError):
+            return None
+        if not rows:
+            return None
+
+        matrix = np.frombuffer(b"".join(row[0] for row in rows), dtype=np.float32)
+        scores = matrix.reshape(len(rows), -1) @ vector
+        best = int(scores.argmax())
+        return rows[best][1] if scores[best] >= threshold else None
+
+    def add_embedding(
+        self,
+        key: str,
+        scope: str,
+        version: str,
+        vector: "np.ndarray",
+        value: str,
+        expire: float = DEFAULT_TTL,
+    ) -> None:
+        """Index a value under its prompt embedding"""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, scope, version, vector.tobytes(), value, time.time() + expire),
+                )
+        except (sqlite3.Error, OSError):
+            pass
+
+    def invalidate(self, version: Optional[str] = None) -> int:
+        """Drop entries for one prompt version (or all of them); return the count"""
+        if not self.path.exists():
+            return 0
+        with closing(self._connect()) as conn, conn:
+            if version is None:
+                cursor = conn.execute("DELETE FROM responses")
+                conn.execute("DELETE FROM embeddings")
+            else:
+                cursor = conn.execute("DELETE FROM responses WHERE version = ?", (version,))
+                conn.execute("DELETE FROM embeddings WHERE version = ?", (version,))
+            return cursor.rowcount
@@ -3,22 +3,22 @@
 from datetime import date, datetime, time, timedelta
 
 
-def today_range() -> tuple[datetime, datetime]:
-    today = date.today()
+def today_range(today: date | None = None) -> tuple[datetime, datetime]:
+    today = today or date.today()
     start = datetime.combine(today, time.min)
     end = datetime.combine(today, time.max)
     return start, end
 
 
-def yesterday_range() -> tuple[datetime, datetime]:
-    yesterday = date.today() - timedelta(days=1)
+def yesterday_range(today: date | None = None) -> tuple[datetime, datetime]:
+    yesterday = (today or date.today()) - timedelta(days=1)
     start = datetime.combine(yesterday, time.min)
     end = datetime.combine(yesterday, time.max)
     return start, end
 
 
-def this_week_range() -> tuple[datetime, datetime]:
-    today = date.today()
+def this_week_range(today: date | None = None) -> tuple[datetime, datetime]:
+    today = today or date.today()
     start_of_week = today - timedelta(days=today.weekday())
     end_of_week = start_of_week + timedelta(days=6)
 
@@ -27,8 +27,8 @@ def this_week_range() -> tuple[datetime, datetime]:
     return start, end
 
 
-def last_week_range() -> tuple[datetime, datetime]:
-    today = date.today()
+def last_week_range(today: date | None = None) -> tuple[datetime, datetime]:
+    today = today or date.today()
     start_of_this_week = today - timedelta(days=today.weekday())
     start_of_last_week = start_of_this_week - timedelta(days=7)
     end_of_last_week = start_of_last_week + timedelta(days=6)
@@ -38,26 +38,40 @@ def last_week_range() -> tuple[datetime, datetime]:
     return start, end
 
 
+def parse_ymd(value: str) -> date:
+    """Parse a YYYY-MM-DD string.
+
+    Canonical zero-padded input takes the C-level date.fromisoformat path;
+    anything else falls back to strptime so the accepted formats don't change.
+    """
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
 def custom_range(from_date: str, to_date: str) -> tuple[datetime, datetime]:
     try:
-        start_date = datetime.strptime(from_date, "%Y-%m-%d")
-        end_date = datetime.strptime(to_date, "%Y-%m-%d")
+        start_date = parse_ymd(from_date)
+        end_date = parse_ymd(to_date)
     except ValueError as e:
         raise ValueError(f"Invalid date format. Use YYYY-MM-DD format. Error: {e}")
 
     if start_date > end_date:
         raise ValueError("Start date must be before or equal to end date")
 
-    start = datetime.combine(start_date.date(), time.min)
-    end = datetime.combine(end_date.date(), time.max)
+    start = datetime.combine(start_date, time.min)
+    end = datetime.combine(end_date, time.max)
     return start, end
 
 
-def last_n_days_range(days: int) -> tuple[datetime, datetime]:
+def last_n_days_range(days: int, today: date | None = None) -> tuple[datetime, datetime]:
     if days < 1:
         raise ValueError("Days must be at least 1")
 
-    today = date.today()
+    today = today or date.today()
     start_date = today - timedelta(days=days - 1)
 
     start = datetime.combine(start_date, time.min)
@@ -1,27 +1,34 @@
 """Commit categorization by component"""
 
+import re
 from typing import Literal
 
 ComponentType = Literal["Console", "Server", "Others"]
 
 
+CONSOLE_KEYWORDS = (
+    "console", "ui-block", "ui block", "frontend", "react", "detail",
+    "icon", "style", "css", "component", "button", "modal", "dialog",
+    "form", "layout", "page", "view", "screen", "ui", "ux",
+)
+
+SERVER_KEYWORDS = (
+    "server", "nest-core", "nestcore", "backend", "api", "endpoint",
+    "controller", "service", "repository", "database", "db", "query",
+    "migration",
+)
+
+# Each keyword list is one case-insensitive alternation, so a message is scanned
+# once per component without making a lowercased copy first
+_CONSOLE_RE = re.compile("|".join(map(re.escape, CONSOLE_KEYWORDS)), re.IGNORECASE)
+_SERVER_RE = re.compile("|".join(map(re.escape, SERVER_KEYWORDS)), re.IGNORECASE)
+
+
 def categorize_commit(message: str) -> ComponentType:
-    message_lower = message.lower()
-
-    console_keywords = [
-        "console", "ui-block", "ui block", "frontend", "react", "detail",
-        "icon", "style", "css", "component", "button", "modal", "dialog",
-        "form", "layout", "page", "view", "screen", "ui", "ux",
-    ]
-    if any(keyword in message_lower for keyword in console_keywords):
+    if _CONSOLE_RE.search(message):
         return "Console"
 
-    server_keywords = [
-        "server", "nest-core", "nestcore", "backend", "api", "endpoint",
-        "controller", "service", "repository", "database", "db", "query",
-        "migration",
-    ]
-    if any(keyword in message_lower for keyword in server_keywords):
+    if _SERVER_RE.search(message):
         return "Server"
 
     return "Others"
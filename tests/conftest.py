@@ -10,6 +10,14 @@ from git import Repo
 from report.git.commits import CommitInfo
 
 
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path_factory, monkeypatch):
+    """Keep the AI summary and repo discovery caches out of the user's home directory"""
+    cache_root = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("GROQ_CACHE_DIR", str(cache_root / "ai-cache"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_root / "xdg"))
+
+
 @pytest.fixture
 def temp_git_repo():
     """Create a temporary git repository for testing"""
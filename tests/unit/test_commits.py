@@ -9,8 +9,10 @@ from report.git.commits import (
     get_commits,
     get_commits_detailed,
     get_all_authors,
+    get_commits_by_author,
     get_commits_from_multiple_repos,
     discover_repos_in_directory,
+    open_repo,
 )
 
 
@@ -41,6 +43,30 @@ class TestCommitInfo:
         assert commit.repo == "my-repo"
 
 
+class TestOpenRepo:
+    """Test open_repo function"""
+
+    def test_reuses_handle_within_thread(self, temp_git_repo):
+        tmpdir, repo = temp_git_repo
+
+        assert open_repo(tmpdir) is open_repo(str(Path(tmpdir) / "."))
+
+    def test_separate_handle_per_thread(self, temp_git_repo):
+        from concurrent.futures import ThreadPoolExecutor
+
+        tmpdir, repo = temp_git_repo
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            other = pool.submit(open_repo, tmpdir).result()
+
+        assert other is not open_repo(tmpdir)
+        assert other.git_dir == open_repo(tmpdir).git_dir
+
+    def test_invalid_repo(self, tmp_path):
+        with pytest.raises(InvalidGitRepositoryError):
+            open_repo(str(tmp_path))
+
+
 class TestGetCommits:
     """Test get_commits function"""
     
@@ -61,11 +87,51 @@ class TestGetCommits:
             since = datetime.now() - timedelta(days=1)
             until = datetime.now()
             get_commits(str(tmp_path), since, until)
+    
+    def test_get_commits_matches_detailed_messages(self, populated_git_repo):
+        tmpdir, repo, commits = populated_git_repo
+        repo.index.commit("Wrapped subject\ncontinues here\n\nBody text")
+        
+        since = datetime.now() - timedelta(days=8)
+        until = datetime.now() + timedelta(days=1)
+        
+        messages = get_commits(tmpdir, since, until, author="test")
+        detailed = get_commits_detailed(tmpdir, since, until, author="test")
+        
+        assert messages[0] == "Wrapped subject"
+        assert messages == [c.message for c in detailed]
+    
+    def test_get_commits_empty_repo(self, tmp_path):
+        from git import Repo
+        Repo.init(tmp_path)
+        
+        since = datetime.now() - timedelta(days=1)
+        until = datetime.now()
+        
+        assert get_commits(str(tmp_path), since, until) == []
 
 
 class TestGetCommitsDetailed:
     """Test get_commits_detailed function"""
     
+    def test_repeated_query_is_cached_until_head_moves(self, populated_git_repo):
+        tmpdir, repo, commits = populated_git_repo
+        
+        since = datetime.now() - timedelta(days=8)
+        until = datetime.now() + timedelta(days=1)
+        
+        first = get_commits_detailed(tmpdir, since, until)
+        second = get_commits_detailed(tmpdir, since, until)
+        assert second == first
+        
+        # Mutating a returned list must not affect the cached result
+        second.clear()
+        assert get_commits_detailed(tmpdir, since, until) == first
+        
+        repo.index.commit("New commit after caching")
+        third = get_commits_detailed(tmpdir, since, until)
+        assert len(third) == len(first) + 1
+    
     def test_get_commits_detailed_structure(self, populated_git_repo):
         tmpdir, repo, commits = populated_git_repo
         
@@ -187,6 +253,28 @@ class TestGetAllAuthors:
             get_all_authors(str(tmp_path))
 
 
+class TestGetCommitsByAuthor:
+    """Test get_commits_by_author function"""
+    
+    def test_groups_by_exact_author(self, populated_git_repo):
+        tmpdir, repo, commits = populated_git_repo
+        
+        # An author whose name contains another author's name
+        from git import Actor
+        (Path(tmpdir) / "extra.txt").write_text("extra")
+        repo.index.add([str(Path(tmpdir) / "extra.txt")])
+        repo.index.commit("Extra commit", author=Actor("Test User Two", "two@example.com"))
+        
+        since = datetime.now() - timedelta(days=8)
+        until = datetime.now() + timedelta(days=1)
+        
+        by_author = get_commits_by_author(tmpdir, since, until)
+        
+        assert list(by_author) == ["Test User", "Test User Two"]
+        assert [c.message for c in by_author["Test User Two"]] == ["Extra commit"]
+        assert all(c.author == "Test User" for c in by_author["Test User"])
+
+
 class TestGetCommitsFromMultipleRepos:
     """Test get_commits_from_multiple_repos function"""
     
@@ -225,6 +313,19 @@ class TestGetCommitsFromMultipleRepos:
         )
         
         assert len(all_commits) > 0
+    
+    def test_parallel_matches_serial(self, populated_git_repo, temp_git_repo, tmp_path):
+        tmpdir1, repo1, commits1 = populated_git_repo
+        tmpdir2, repo2 = temp_git_repo
+        paths = [tmpdir1, str(tmp_path / "invalid"), tmpdir2]
+        
+        since = datetime.now() - timedelta(days=8)
+        until = datetime.now()
+        
+        serial = get_commits_from_multiple_repos(paths, since, until, max_workers=1)
+        parallel = get_commits_from_multiple_repos(paths, since, until, max_workers=3)
+        
+        assert parallel == serial
 
 
 class TestDiscoverReposInDirectory:
@@ -269,3 +370,28 @@ class TestDiscoverReposInDirectory:
         repos = discover_repos_in_directory(str(tmp_path), max_depth=1)
         
         assert not any("level3" in r for r in repos)
+
+    def test_discover_reuses_cached_result(self, tmp_path, monkeypatch):
+        from git import Repo as GitRepo
+
+        GitRepo.init(str(tmp_path / "repo1"))
+        first = discover_repos_in_directory(str(tmp_path), use_cache=True)
+
+        # A cache hit must not probe any directory
+        import git
+
+        monkeypatch.setattr(git, "Repo", None)
+        assert discover_repos_in_directory(str(tmp_path), use_cache=True) == first
+
+    def test_discover_cache_invalidated_by_new_repo(self, tmp_path):
+        from git import Repo as GitRepo
+
+        (tmp_path / "group").mkdir()
+        GitRepo.init(str(tmp_path / "group" / "repo1"))
+        assert len(discover_repos_in_directory(str(tmp_path), use_cache=True)) == 1
+
+        GitRepo.init(str(tmp_path / "group" / "repo2"))
+        repos = discover_repos_in_directory(str(tmp_path), use_cache=True)
+
+        assert len(repos) == 2
+        assert any("repo2" in r for r in repos)
@@ -49,6 +49,10 @@ class TestYesterdayRange:
         assert start.hour == 0 and start.minute == 0 and start.second == 0
         assert end.hour == 23 and end.minute == 59 and end.second == 59
 
+    def test_yesterday_range_reference_date(self):
+        start, end = yesterday_range(date(2024, 3, 1))
+        assert start.date() == end.date() == date(2024, 2, 29)
+
 
 class TestThisWeekRange:
     """Test this_week_range function"""
@@ -71,6 +75,11 @@ class TestThisWeekRange:
         delta = end.date() - start.date()
         assert delta.days == 6  # 7 days (inclusive)
 
+    def test_this_week_range_reference_date(self):
+        start, end = this_week_range(date(2024, 1, 10))  # Wednesday
+        assert start.date() == date(2024, 1, 8)
+        assert end.date() == date(2024, 1, 14)
+
 
 class TestLastWeekRange:
     """Test last_week_range function"""
@@ -161,6 +170,11 @@ class TestLastNDaysRange:
         with pytest.raises(ValueError, match="Days must be at least 1"):
             last_n_days_range(-5)
 
+    def test_last_n_days_range_reference_date(self):
+        start, end = last_n_days_range(3, date(2024, 1, 2))
+        assert start.date() == date(2023, 12, 31)
+        assert end.date() == date(2024, 1, 2)
+
 
 class TestMonthRange:
     """Test month_range function"""
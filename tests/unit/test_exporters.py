@@ -1,14 +1,18 @@
 """Tests for report.utils.exporters module"""
+import io
 import json
+
 import pytest
 
 from report.git.commits import CommitInfo
+from report.utils import exporters
 from report.utils.exporters import (
     export_to_json,
     export_to_markdown,
     export_to_html,
     export_to_email,
     export_commits,
+    export_commits_to,
 )
 
 
@@ -73,6 +77,17 @@ class TestExportToJson:
         assert data["metadata"]["title"] == "Daily Report"
         assert data["metadata"]["date_range"] == "2024-01-10"
     
+    def test_export_to_json_without_orjson(self, sample_commits_for_export, monkeypatch):
+        fast = export_to_json(sample_commits_for_export, {"title": "Ünïcode"})
+        monkeypatch.setattr(exporters, "_orjson", lambda: None)
+        plain = export_to_json(sample_commits_for_export, {"title": "Ünïcode"})
+        
+        # Same text either way, apart from the export timestamp
+        def strip(text):
+            return [line for line in text.splitlines() if "exported_at" not in line]
+        
+        assert strip(plain) == strip(fast)
+    
     def test_export_to_json_empty_commits(self):
         result = export_to_json([])
         data = json.loads(result)
@@ -183,6 +198,16 @@ class TestExportToHtml:
         
         assert "<h2>Console" in result
         assert "<h2>Server" in result
+    
+    def test_export_to_html_escapes_user_text(self):
+        commits = [CommitInfo("abc1234", "A & B", "2024-01-10 10:00", "fix: <script> in \"title\"")]
+        
+        result = export_to_html(commits, {"title": "<Report>"})
+        
+        assert "<script>" not in result
+        assert "fix: &lt;script&gt; in &quot;title&quot;" in result
+        assert "A &amp; B" in result
+        assert "<h1>&lt;Report&gt;</h1>" in result
 
 
 class TestExportToEmail:
@@ -226,6 +251,14 @@ class TestExportToEmail:
         
         assert "Console" in result
         assert "Server" in result
+    
+    def test_export_to_email_escapes_user_text(self):
+        commits = [CommitInfo("abc1234", "A & B", "2024-01-10 10:00", "fix: <b>bold</b>")]
+        
+        result = export_to_email(commits)
+        
+        assert "<strong>fix: &lt;b&gt;bold&lt;/b&gt;</strong>" in result
+        assert "A &amp; B" in result
 
 
 class TestExportCommits:
@@ -270,3 +303,33 @@ class TestExportCommits:
         
         assert "Test Report" in result
         assert "Console" in result
+
+
+class TestExportCommitsTo:
+    """Test export_commits_to streaming writer"""
+    
+    @pytest.mark.parametrize("fmt", ["markdown", "html", "email"])
+    def test_matches_export_commits(self, sample_commits_for_export, fmt):
+        metadata = {"title": "Test Report", "date_range": "2024-01-08 to 2024-01-14"}
+        grouped = {"Console": sample_commits_for_export[:1], "Server": []}
+        fp = io.StringIO()
+        
+        export_commits_to(fp, sample_commits_for_export, fmt, metadata, grouped)
+        
+        assert fp.getvalue() == export_commits(sample_commits_for_export, fmt, metadata, grouped)
+    
+    def test_json(self, sample_commits_for_export):
+        metadata = {"title": "Test Report"}
+        fp = io.StringIO()
+        
+        export_commits_to(fp, sample_commits_for_export, "json", metadata)
+        
+        data = json.loads(fp.getvalue())
+        expected = json.loads(export_commits(sample_commits_for_export, "json", metadata))
+        data.pop("exported_at")
+        expected.pop("exported_at")
+        assert data == expected
+    
+    def test_invalid_format(self, sample_commits_for_export):
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            export_commits_to(io.StringIO(), sample_commits_for_export, "pdf")  # type: ignore
@@ -5,6 +5,7 @@ from pathlib import Path
 
 from report.utils.stats import (
     get_commit_stats,
+    get_commit_stats_multi,
     AuthorStats,
     RepoStats,
 )
@@ -192,3 +193,27 @@ class TestGetCommitStats:
         if len(stats.author_stats) > 1:
             for i in range(len(stats.author_stats) - 1):
                 assert stats.author_stats[i].total_commits >= stats.author_stats[i + 1].total_commits
+
+
+class TestGetCommitStatsMulti:
+    """Test get_commit_stats_multi function"""
+
+    def test_matches_separate_queries(self, populated_git_repo):
+        tmpdir, repo, commits = populated_git_repo
+
+        until = datetime.now() + timedelta(minutes=1)
+        ranges = [
+            (until - timedelta(days=30), until),
+            (datetime(2000, 1, 1), datetime(2000, 1, 2)),
+        ]
+
+        multi = get_commit_stats_multi(tmpdir, ranges)
+
+        get_commit_stats.cache_clear()
+        assert multi == [get_commit_stats(tmpdir, since, end) for since, end in ranges]
+        assert multi[1].total_commits == 0
+
+    def test_empty_range_list(self, populated_git_repo):
+        tmpdir, repo, commits = populated_git_repo
+
+        assert get_commit_stats_multi(tmpdir, []) == []
@@ -168,3 +168,310 @@ class TestAICommitSummarizer:
         # Should handle timeout gracefully
         assert isinstance(result, str)
         assert "Error" in result
+
+
+class TestSummarizeMany:
+    """Test AICommitSummarizer.summarize_many"""
+
+    @patch('shared.ai.requests.Session.post')
+    def test_summarize_many_keeps_job_order(self, mock_post):
+        def fake_post(url, **kwargs):
+            prompt = kwargs["json"]["messages"][1]["content"]
+            response = Mock()
+            response.json.return_value = {
+                "choices": [{"message": {"content": "weekly" if "weekly" in prompt else "daily"}}]
+            }
+            return response
+
+        mock_post.side_effect = fake_post
+
+        summarizer = AICommitSummarizer(api_key="test-key")
+        results = summarizer.summarize_many([
+            {"commits": ["feat: A"], "report_type": "weekly"},
+            {"commits": ["fix: B"], "report_type": "daily"},
+        ])
+
+        assert results == ["weekly", "daily"]
+        assert mock_post.call_count == 2
+
+    @patch('shared.ai.requests.Session.post')
+    def test_summarize_many_empty(self, mock_post):
+        summarizer = AICommitSummarizer(api_key="test-key")
+
+        assert summarizer.summarize_many([]) == []
+        assert not mock_post.called
+
+
+class TestSummaryCache:
+    """Test the on-disk summary cache"""
+
+    @staticmethod
+    def _response(content):
+        response = Mock()
+        response.json.return_value = {"choices": [{"message": {"content": content}}]}
+        return response
+
+    @patch('shared.ai.requests.Session.post')
+    def test_repeated_summary_is_served_from_cache(self, mock_post):
+        mock_post.return_value = self._response("Cached summary")
+
+        first = AICommitSummarizer(api_key="test-key").summarize(["feat: A", "fix: B"])
+        second = AICommitSummarizer(api_key="test-key").summarize(["fix: B", "feat: A"])
+
+        assert first == second == "Cached summary"
+        assert mock_post.call_count == 1
+
+    @patch('shared.ai.requests.Session.post')
+    def test_unusable_cache_dir_does_not_break_summary(self, mock_post, mock_env_vars, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        mock_env_vars(GROQ_CACHE_DIR=str(blocker / "cache"), GROQ_SEMANTIC_CACHE="1")
+        mock_post.return_value = self._response("Summary")
+
+        result = AICommitSummarizer(api_key="test-key").summarize(["feat: A"])
+
+        assert result == "Summary"
+
+    def test_set_drops_expired_entries(self, tmp_path):
+        import sqlite3
+        from shared.ai.cache import ResponseCache
+
+        cache = ResponseCache(tmp_path / "llm.db")
+        cache.set("old", "stale", "v1", expire=-1)
+        cache.set("new", "fresh", "v1")
+
+        with sqlite3.connect(tmp_path / "llm.db") as conn:
+            keys = [row[0] for row in conn.execute("SELECT key FROM responses")]
+        assert keys == ["new"]
+
+    @patch('shared.ai.requests.Session.post')
+    def test_report_type_is_part_of_key(self, mock_post):
+        mock_post.return_value = self._response("Summary")
+        summarizer = AICommitSummarizer(api_key="test-key")
+
+        summarizer.summarize(["feat: A"], report_type="daily")
+        summarizer.summarize(["feat: A"], report_type="weekly")
+
+        assert mock_post.call_count == 2
+
+    @patch('shared.ai.requests.Session.post')
+    def test_errors_are_not_cached(self, mock_post):
+        import requests
+        mock_post.side_effect = [
+            requests.exceptions.RequestException("API Error"),
+            self._response("Recovered"),
+        ]
+        summarizer = AICommitSummarizer(api_key="test-key")
+
+        assert "Error" in summarizer.summarize(["feat: A"])
+        assert summarizer.summarize(["feat: A"]) == "Recovered"
+
+    @patch('shared.ai.requests.Session.post')
+    def test_cache_can_be_disabled(self, mock_post, mock_env_vars):
+        mock_env_vars(GROQ_CACHE="false")
+        mock_post.return_value = self._response("Summary")
+        summarizer = AICommitSummarizer(api_key="test-key")
+
+        summarizer.summarize(["feat: A"])
+        summarizer.summarize(["feat: A"])
+
+        assert summarizer.cache is None
+        assert mock_post.call_count == 2
+
+    @patch('shared.ai.requests.Session.post')
+    def test_invalidate_cache(self, mock_post):
+        from shared.ai import PROMPT_VERSION, invalidate_cache
+
+        mock_post.return_value = self._response("Summary")
+        summarizer = AICommitSummarizer(api_key="test-key")
+        summarizer.summarize(["feat: A"])
+
+        assert invalidate_cache("other-version") == 0
+        assert invalidate_cache(PROMPT_VERSION) == 1
+        summarizer.summarize(["feat: A"])
+        assert mock_post.call_count == 2
+
+    @patch('shared.ai.requests.Session.post')
+    def test_semantic_cache_reuses_near_match(self, mock_post, mock_env_vars):
+        mock_env_vars(GROQ_SEMANTIC_CACHE="1")
+        mock_post.return_value = self._response("Summary")
+        summarizer = AICommitSummarizer(api_key="test-key")
+        commits = [f"feat: Add report export option number {i}" for i in range(30)]
+
+        summarizer.summarize(commits)
+        result = summarizer.summarize(commits + ["fix: Typo in export help"])
+
+        assert result == "Summary"
+        assert mock_post.call_count == 1
+
+    @patch('shared.ai.requests.Session.post')
+    def test_semantic_cache_separates_merge_filtering(self, mock_post, mock_env_vars):
+        mock_env_vars(GROQ_SEMANTIC_CACHE="1")
+        mock_post.return_value = self._response("Summary")
+        commits = [f"feat: Add report export option number {i}" for i in range(30)]
+
+        AICommitSummarizer(api_key="test-key").summarize(commits)
+        AICommitSummarizer(api_key="test-key", keep_merges=True).summarize(
+            commits + ["fix: Typo in export help"]
+        )
+
+        assert mock_post.call_count == 2
+
+    @patch('shared.ai.requests.Session.post')
+    def test_semantic_cache_misses_unrelated_commits(self, mock_post, mock_env_vars):
+        mock_env_vars(GROQ_SEMANTIC_CACHE="1")
+        mock_post.return_value = self._response("Summary")
+        summarizer = AICommitSummarizer(api_key="test-key")
+
+        summarizer.summarize(["feat: Add login page"])
+        summarizer.summarize(["fix: Handle database timeout in worker"])
+
+        assert mock_post.call_count == 2
+
+
+class TestStreamingSummary:
+    """Test streamed summaries"""
+
+    @patch('shared.ai.requests.Session.post')
+    def test_stream_emits_chunks_and_returns_full_text(self, mock_post):
+        frames = [
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}',
+            b"",
+            b'data: {"choices": [{"delta": {"content": "\\n## Sum"}}]}',
+            b'data: {"choices": [{"delta": {"content": "mary"}}]}',
+            b"data: [DONE]",
+        ]
+        response = MagicMock()
+        response.iter_lines.return_value = iter(frames)
+        mock_post.return_value = response
+
+        chunks = []
+        summarizer = AICommitSummarizer(api_key="test-key")
+        result = summarizer.summarize(["feat: A"], on_token=chunks.append)
+
+        assert result == "## Summary"
+        assert chunks == ["## Sum", "mary"]
+        assert mock_post.call_args[1]["stream"] is True
+        assert mock_post.call_args[1]["json"]["stream"] is True
+
+    @patch('shared.ai.requests.Session.post')
+    def test_stream_reports_errors_through_callback(self, mock_post):
+        import requests
+        mock_post.side_effect = requests.exceptions.RequestException("API Error")
+
+        chunks = []
+        summarizer = AICommitSummarizer(api_key="test-key")
+        result = summarizer.summarize(["feat: A"], on_token=chunks.append)
+
+        assert chunks == [result]
+        assert "Error" in result
+
+    @patch('shared.ai.requests.Session.post')
+    def test_stream_error_frame_reports_api_error(self, mock_post):
+        frames = [
+            b'data: {"x_groq": {"id": "req_1"}}',
+            b'data: {"error": {"message": "Rate limit reached", "type": "tokens"}}',
+        ]
+        response = MagicMock()
+        response.iter_lines.return_value = iter(frames)
+        mock_post.return_value = response
+
+        chunks = []
+        summarizer = AICommitSummarizer(api_key="test-key")
+        result = summarizer.summarize(["feat: A"], on_token=chunks.append)
+
+        assert result == "Error calling Groq API: Rate limit reached"
+        assert chunks == [result]
+
+
+class TestPromptCompression:
+    """Test commit-list compression for large prompts"""
+
+    def test_compress_drops_duplicates_and_merges(self):
+        from shared.ai import _compress_commits
+
+        commits = [
+            "feat: A",
+            "Merge branch 'main' into feature",
+            "feat: A",
+            "Merge pull request #1 from org/feature",
+            "fix: B",
+        ]
+
+        assert _compress_commits(commits) == ["feat: A", "fix: B"]
+
+    def test_compress_merge_match_is_case_insensitive(self):
+        from shared.ai import _compress_commits
+
+        commits = ["merge remote-tracking branch 'origin/main'", "fix: B"]
+
+        assert _compress_commits(commits) == ["fix: B"]
+        assert _compress_commits(commits, keep_merges=True) == commits
+
+    def test_compress_keeps_merges_when_nothing_else(self):
+        from shared.ai import _compress_commits
+
+        commits = ["Merge branch 'a'", "Merge branch 'b'"]
+
+        assert _compress_commits(commits) == commits
+
+    @patch('shared.ai.requests.Session.post')
+    def test_oversized_prompt_is_summarized_in_parts(self, mock_post):
+        response = Mock()
+        response.json.return_value = {"choices": [{"message": {"content": "Part summary"}}]}
+        mock_post.return_value = response
+
+        commits = [f"feat: Add a fairly descriptive change number {i} to the app" for i in range(800)]
+        result = AICommitSummarizer(api_key="test-key").summarize(commits)
+
+        assert result == "Part summary"
+        assert mock_post.call_count > 2
+        final_prompt = mock_post.call_args[1]["json"]["messages"][1]["content"]
+        assert "partial summaries" in final_prompt
+
+    @patch('shared.ai.requests.Session.post')
+    def test_single_oversized_item_is_sent_once(self, mock_post):
+        response = Mock()
+        response.json.return_value = {"choices": [{"message": {"content": "feat: Add thing"}}]}
+        mock_post.return_value = response
+
+        diff = "+ added line\n" * 4000
+        result = AICommitSummarizer(api_key="test-key").summarize([diff], "commit")
+
+        assert result == "feat: Add thing"
+        assert mock_post.call_count == 1
+        prompt = mock_post.call_args[1]["json"]["messages"][1]["content"]
+        assert "partial summaries" not in prompt
+        assert diff in prompt
+
+
+class TestEnqueue:
+    """Test coalesced summarize jobs"""
+
+    @patch('shared.ai.requests.Session.post')
+    def test_jobs_in_window_share_one_batch(self, mock_post, mock_env_vars):
+        mock_env_vars(GROQ_BATCH_WAIT_MS="200")
+        response = Mock()
+        response.json.return_value = {"choices": [{"message": {"content": "Summary"}}]}
+        mock_post.return_value = response
+
+        summarizer = AICommitSummarizer(api_key="test-key")
+        with patch.object(
+            summarizer, "summarize_many", wraps=summarizer.summarize_many
+        ) as summarize_many:
+            futures = [summarizer.enqueue(commits=[f"feat: {i}"]) for i in range(3)]
+            results = [future.result(timeout=5) for future in futures]
+
+        assert results == ["Summary"] * 3
+        summarize_many.assert_called_once()
+        assert len(summarize_many.call_args[0][0]) == 3
+
+    @patch('shared.ai.requests.Session.post')
+    def test_without_window_jobs_run_immediately(self, mock_post):
+        response = Mock()
+        response.json.return_value = {"choices": [{"message": {"content": "Summary"}}]}
+        mock_post.return_value = response
+
+        summarizer = AICommitSummarizer(api_key="test-key")
+
+        assert summarizer.enqueue(commits=["feat: A"]).result(timeout=5) == "Summary"
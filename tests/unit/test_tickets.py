@@ -1,4 +1,6 @@
 """Tests for report.utils.tickets module"""
+import re
+
 import pytest
 
 from report.git.commits import CommitInfo
@@ -45,6 +47,12 @@ class TestExtractTicketFromMessage:
     def test_extract_custom_pattern(self):
         patterns = [r'CUSTOM-(\d+)']
         assert extract_ticket_from_message("CUSTOM-123: Fix", patterns) == "123"
+    
+    def test_extract_compiled_pattern(self):
+        patterns = [re.compile(r'CUSTOM-(\d+)')]
+        assert extract_ticket_from_message("CUSTOM-123: Fix", patterns) == "123"
+        # Custom string patterns are case-insensitive like the defaults
+        assert extract_ticket_from_message("custom-7: Fix", [r'CUSTOM-(\d+)']) == "7"
 
 
 class TestGroupCommitsByTicket: